@@ -0,0 +1,93 @@
+"""
+Benchmark scalar vs vectorized coupon pricing.
+
+Prices synthetic product batches (like the deal scanner's) with
+CouponService.apply_best_coupon per product and with BatchCouponPricer,
+checks both paths pick the same coupons and prices, and prints the cost.
+
+Usage:
+    python benchmarks/bench_batch_pricing.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.batch_pricing import BatchCouponPricer
+from src.services.coupon_service import CouponService
+
+MARKETPLACES = ["Mercado Livre", "Amazon", "Shopee", "AliExpress", "Magalu"]
+
+
+def make_batch(size: int, seed: int = 42) -> tuple:
+    """Build (marketplaces, prices) for a batch of products."""
+    rng = random.Random(seed)
+    marketplaces = [rng.choice(MARKETPLACES) for _ in range(size)]
+    prices = [round(rng.uniform(10, 5000), 2) for _ in range(size)]
+    return marketplaces, prices
+
+
+def scalar(service: CouponService, marketplaces: list, prices: list) -> list:
+    """Price every product one by one."""
+    return [
+        service.apply_best_coupon(marketplace, price)
+        for marketplace, price in zip(marketplaces, prices)
+    ]
+
+
+def vectorized(service: CouponService, marketplaces: list, prices: list) -> tuple:
+    """Price the whole batch at once."""
+    return BatchCouponPricer(service.get_all_coupons()).price(marketplaces, prices)
+
+
+def best_of(func, repeat: int) -> tuple:
+    """Return (best seconds, last result) over several runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    service = CouponService()
+    
+    print(f"{'products':>10}{'scalar ms':>12}{'batch ms':>12}{'speedup':>10}  identical")
+    
+    for size in args.sizes:
+        marketplaces, prices = make_batch(size)
+        
+        scalar_time, expected = best_of(lambda: scalar(service, marketplaces, prices), args.repeat)
+        batch_time, (coupons, discounts, finals) = best_of(
+            lambda: vectorized(service, marketplaces, prices), args.repeat
+        )
+        
+        identical = all(
+            (coupon.code if coupon else None) == result['coupon_code']
+            and final == result['final_price']
+            and discount == result['discount']
+            for coupon, discount, final, result in zip(
+                coupons, discounts.tolist(), finals.tolist(), expected
+            )
+        )
+        
+        print(
+            f"{size:>10}{scalar_time * 1e3:>12.1f}{batch_time * 1e3:>12.1f}"
+            f"{scalar_time / batch_time:>9.1f}x  {identical}"
+        )
+
+
+if __name__ == "__main__":
+    main()
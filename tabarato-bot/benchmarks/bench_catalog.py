@@ -0,0 +1,105 @@
+"""
+Benchmark catalog grouping: fuzzy grouping vs catalog lookup.
+
+Builds deal-scan-like listings spread over two marketplaces, groups them
+by name similarity (group_similar_products) and through the catalog
+(CatalogService, in-memory SQLite), first with an empty catalog and then
+again once every listing is known, and reports the groups found and the
+time taken.
+
+Usage:
+    python benchmarks/bench_catalog.py [--sizes 200 500 1000] [--threshold 70]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bench_grouping import make_listings
+from src.database.models import Base
+from src.models.product import Product
+from src.services.catalog_service import CatalogService
+from src.utils.normalizer import group_similar_products
+
+
+def make_products(count: int) -> list:
+    """Build products from listing titles, alternating marketplaces."""
+    return [
+        Product(
+            id=f"ID{i}",
+            name=name,
+            price=100.0,
+            marketplace="Amazon" if i % 2 else "Mercado Livre",
+            url="https://test.com"
+        )
+        for i, name in enumerate(make_listings(count))
+    ]
+
+
+def make_service() -> CatalogService:
+    """Build a catalog service backed by a fresh in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    
+    @contextmanager
+    def session_scope():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+    
+    return CatalogService(session_scope=session_scope)
+
+
+def timed(func) -> tuple:
+    """Run func once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 500, 1000])
+    parser.add_argument("--threshold", type=float, default=70.0)
+    args = parser.parse_args()
+    
+    # Grouping logs one line per call
+    logging.disable(logging.INFO)
+    
+    print(f"{'products':>8} | {'fuzzy':>16} | {'catalog (new)':>16} | {'catalog (known)':>16} | {'speedup':>7}")
+    print("-" * 76)
+    
+    for size in args.sizes:
+        products = make_products(size)
+        service = make_service()
+        
+        fuzzy, fuzzy_time = timed(lambda: group_similar_products(products, threshold=args.threshold))
+        cold, cold_time = timed(lambda: service.group_products(products, args.threshold))
+        warm, warm_time = timed(lambda: service.group_products(products, args.threshold))
+        
+        print(
+            f"{size:>8} | {len(fuzzy):>5} in {fuzzy_time * 1000:>6.1f}ms | "
+            f"{len(cold):>5} in {cold_time * 1000:>6.1f}ms | "
+            f"{len(warm):>5} in {warm_time * 1000:>6.1f}ms | "
+            f"{fuzzy_time / warm_time:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
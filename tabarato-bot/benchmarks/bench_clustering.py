@@ -0,0 +1,93 @@
+"""
+Benchmark incremental clustering against grouping from scratch.
+
+Simulates hourly scans: the clusterer first sees a history of listings,
+then each scan returns a batch in which most listings were seen before
+and a fraction is new. Reports the time to group a scan from scratch
+(group_similar_products) and incrementally (IncrementalClusterer), for
+several history sizes, so the incremental cost can be seen to follow
+the new listings rather than the listings seen.
+
+Usage:
+    python benchmarks/bench_clustering.py [--history 1000 5000 20000] [--scan 1000] [--new 0.1]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_grouping import make_listings
+from src.models.product import Product
+from src.utils.clustering import IncrementalClusterer
+from src.utils.normalizer import group_similar_products
+
+
+def make_products(names: list, offset: int = 0) -> list:
+    """Build products with unique IDs from listing titles."""
+    return [
+        Product.from_trusted(
+            id=f"ID{offset + i}",
+            name=name,
+            price=100.0,
+            marketplace="Mercado Livre",
+            url="https://test.com"
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--history", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--scan", type=int, default=1000)
+    parser.add_argument("--new", type=float, default=0.1)
+    parser.add_argument("--threshold", type=float, default=70.0)
+    args = parser.parse_args()
+    
+    # Grouping logs one line per call
+    logging.disable(logging.INFO)
+    rng = random.Random(5)
+    
+    print(f"{'history':>8} | {'scan':>5} | {'new':>4} | {'from scratch':>12} | {'incremental':>11} | {'first load':>10}")
+    print("-" * 70)
+    
+    for history_size in args.history:
+        names = make_listings(history_size + args.scan, seed=history_size)
+        history = make_products(names[:history_size])
+        
+        clusterer = IncrementalClusterer(threshold=args.threshold)
+        start = time.perf_counter()
+        clusterer.group(history)
+        load_time = time.perf_counter() - start
+        
+        new_count = int(args.scan * args.new)
+        scan = rng.sample(history, args.scan - new_count) + make_products(
+            names[history_size:history_size + new_count], offset=history_size
+        )
+        
+        start = time.perf_counter()
+        group_similar_products(scan, threshold=args.threshold)
+        scratch_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        clusterer.group(scan)
+        incremental_time = time.perf_counter() - start
+        
+        print(
+            f"{history_size:>8} | {args.scan:>5} | {new_count:>4} | "
+            f"{scratch_time * 1000:>10.1f}ms | {incremental_time * 1000:>9.1f}ms | "
+            f"{load_time:>9.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
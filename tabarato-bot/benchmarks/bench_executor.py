@@ -0,0 +1,104 @@
+"""
+Benchmark inline vs offloaded grouping and the event loop lag each causes.
+
+Groups listing titles (group_similar_names) and extracts their specs
+(specs.extract_specs_batch) inline on the event loop and through
+CpuExecutor (one worker process), while a ticker measures how late the
+loop wakes up. The inline time against the offloaded round trip shows
+where CPU_OFFLOAD_MIN_ITEMS should sit; the lag column shows what the
+other users of the bot wait meanwhile.
+
+Usage:
+    python benchmarks/bench_executor.py [--sizes 100 300 1000 3000]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_grouping import make_listings
+from src.utils import specs
+from src.utils.executor import CpuExecutor
+from src.utils.metrics import MetricsRegistry
+from src.utils.normalizer import group_similar_names
+
+async def measure(job, tick: float = 0.005) -> tuple:
+    """Run a job while ticking; return (seconds, max loop lag in seconds)."""
+    loop = asyncio.get_running_loop()
+    max_lag = 0.0
+    done = False
+    
+    async def ticker():
+        nonlocal max_lag
+        while not done:
+            expected = loop.time() + tick
+            await asyncio.sleep(tick)
+            max_lag = max(max_lag, loop.time() - expected)
+    
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    
+    start = time.perf_counter()
+    await job()
+    elapsed = time.perf_counter() - start
+    
+    done = True
+    await ticker_task
+    return elapsed, max_lag
+
+
+async def run(sizes: list, threshold: float) -> None:
+    """Measure every stage and batch size."""
+    executor = CpuExecutor(max_workers=1, inline_min_items=1, metrics=MetricsRegistry())
+    await executor.start()
+    
+    stages = [
+        ("grouping", lambda names: (group_similar_names, names, threshold)),
+        ("specs", lambda names: (specs.extract_specs_batch, names))
+    ]
+    
+    print(f"{'stage':>8} | {'titles':>6} | {'inline':>9} | {'inline lag':>10} | {'offloaded':>9} | {'offload lag':>11}")
+    print("-" * 71)
+    
+    try:
+        for stage, make_call in stages:
+            for size in sizes:
+                func, *args = make_call(make_listings(size))
+                
+                async def inline():
+                    func(*args)
+                
+                async def offloaded():
+                    await executor.run(func, *args, items=size)
+                
+                inline_s, inline_lag = min([await measure(inline) for _ in range(3)])
+                offload_s, offload_lag = min([await measure(offloaded) for _ in range(3)])
+                
+                print(
+                    f"{stage:>8} | {size:>6} | {inline_s * 1000:>7.1f}ms | {inline_lag * 1000:>8.1f}ms | "
+                    f"{offload_s * 1000:>7.1f}ms | {offload_lag * 1000:>9.1f}ms"
+                )
+    finally:
+        executor.close()
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000, 3000])
+    parser.add_argument("--threshold", type=float, default=70.0)
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.sizes, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
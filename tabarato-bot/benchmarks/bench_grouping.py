@@ -0,0 +1,117 @@
+"""
+Benchmark product grouping: all pairs vs token-blocked candidates.
+
+Builds deal-scan-like listings (many sellers listing variants of the same
+models, sharing the query words), groups them with the fuzzywuzzy backend
+scoring every pair and scoring only the candidates from
+similarity_candidates, and reports the
+pairs scored, recall of similar pairs, whether the groups are identical
+and the time taken.
+
+Usage:
+    python benchmarks/bench_grouping.py [--sizes 200 500 1000] [--threshold 70]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config
+from src.utils import similarity
+from src.utils.normalizer import ProductNormalizer, group_similar_products, similarity_candidates
+
+FAMILIES = [
+    ("Smartphone", ["Samsung Galaxy A54", "Samsung Galaxy S23", "Motorola Moto G84", "Motorola Edge 40", "Xiaomi Redmi Note 13", "Xiaomi Poco X6", "Apple iPhone 13", "Apple iPhone 15"], ["128GB", "256GB", "8GB RAM", "5G", "Dual Chip", "Câmera 50MP"]),
+    ("Notebook", ["Dell Inspiron 15", "Dell Vostro 14", "Lenovo IdeaPad 3", "Lenovo ThinkPad E14", "Acer Aspire 5", "Acer Nitro 5", "Asus Vivobook 15", "Samsung Galaxy Book 2"], ["Intel Core i5", "Intel Core i7", "Ryzen 5", "8GB", "16GB", "256GB SSD", "512GB SSD", "Tela 15,6\""]),
+    ("Fone de Ouvido", ["JBL Tune 510BT", "JBL Wave Buds", "Sony WH-CH520", "QCY T13", "Xiaomi Redmi Buds 4", "Edifier W820NB"], ["Bluetooth", "Sem Fio", "Cancelamento de Ruído", "Microfone", "Estojo de Carga"]),
+    ("Air Fryer", ["Mondial AF-30", "Philco PFR15", "Britânia BFR38", "Electrolux EAF20", "Arno Easy Fry"], ["4L", "5,5L", "Digital", "1500W", "Antiaderente", "127V", "220V"]),
+]
+
+NOISE = ["Original", "Lançamento", "Promoção", "Frete Grátis", "Garantia", "Nacional", "Envio Imediato", "Preto", "Azul", "Branco", "Novo", "Lacrado", "Nf", "Oferta"]
+
+
+def make_listings(count: int, seed: int = 11) -> list:
+    """Build listing titles: model core, a few specs and seller noise, shuffled."""
+    rng = random.Random(seed)
+    listings = []
+    
+    for _ in range(count):
+        kind, models, specs = rng.choice(FAMILIES)
+        words = rng.choice(models).split() + rng.sample(specs, rng.randint(1, 3)) + rng.sample(NOISE, rng.randint(0, 3))
+        if rng.random() < 0.6:
+            words.insert(0, kind)
+        if rng.random() < 0.2:
+            rng.shuffle(words)
+        listings.append(" ".join(words))
+    
+    return listings
+
+
+class Named:
+    """Minimal product stand-in for group_similar_products."""
+    
+    def __init__(self, name: str):
+        self.name = name
+
+
+def group_ids(groups: list) -> list:
+    """Groups as lists of listing ids, for comparison."""
+    return [[id(p) for p in group] for group in groups]
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 500, 1000])
+    parser.add_argument("--threshold", type=float, default=float(Config.SIMILARITY_THRESHOLD))
+    args = parser.parse_args()
+    
+    # group_similar_products logs every call
+    logging.disable(logging.INFO)
+    
+    # Candidates are used by the fuzzywuzzy backend only
+    similarity.rapid_process = None
+    
+    print(f"threshold {args.threshold:.0f}, token overlap {Config.GROUPING_MIN_TOKEN_OVERLAP}\n")
+    print(f"{'products':>9}{'all pairs':>11}{'candidates':>12}{'recall':>9}{'same groups':>13}{'all ms':>10}{'blocked ms':>12}{'speedup':>9}")
+    
+    for size in args.sizes:
+        products = [Named(name) for name in make_listings(size)]
+        names = ProductNormalizer.normalize_batch(p.name for p in products)
+        
+        # Every similar pair, scored exhaustively
+        start = time.perf_counter()
+        Config.GROUPING_BLOCKING_MIN_PRODUCTS = size + 1
+        exhaustive = group_similar_products(products, args.threshold)
+        all_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        Config.GROUPING_BLOCKING_MIN_PRODUCTS = 1
+        blocked = group_similar_products(products, args.threshold)
+        blocked_time = time.perf_counter() - start
+        
+        candidates = similarity_candidates(names, args.threshold, Config.GROUPING_MIN_TOKEN_OVERLAP)
+        candidate_pairs = {(i, j) for i, js in enumerate(candidates) for j in js}
+        similar_pairs = {
+            (i, j)
+            for i in range(size)
+            for j in range(i + 1, size)
+            if ProductNormalizer.normalized_similarity(names[i], names[j]) >= args.threshold
+        }
+        recall = len(similar_pairs & candidate_pairs) / len(similar_pairs) if similar_pairs else 1.0
+        
+        print(
+            f"{size:>9}{size * (size - 1) // 2:>11}{len(candidate_pairs):>12}{recall:>9.3f}"
+            f"{str(group_ids(exhaustive) == group_ids(blocked)):>13}"
+            f"{all_time * 1e3:>10.0f}{blocked_time * 1e3:>12.0f}{all_time / blocked_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
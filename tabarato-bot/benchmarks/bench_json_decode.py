@@ -0,0 +1,96 @@
+"""
+Benchmark JSON decoding of Mercado Livre search responses.
+
+Compares every installed backend in generic mode and the typed schema
+mode (msgspec) on a synthetic payload shaped like /sites/MLB/search.
+
+Usage:
+    python benchmarks/bench_json_decode.py [--results 50] [--runs 200]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.integrations.mercadolivre_api import MLSearchResponse
+from src.utils.json_codec import JsonDecoder, _available_backends
+
+
+def make_payload(results: int) -> bytes:
+    """Build a search response with the nested objects ML returns."""
+    items = []
+    
+    for i in range(results):
+        items.append({
+            "id": f"MLB{1000000 + i}",
+            "title": f"Notebook Gamer Modelo {i} 16GB RAM 512GB SSD RTX 4060",
+            "price": 4999.9 + i,
+            "original_price": 5999.9 + i,
+            "currency_id": "BRL",
+            "permalink": f"https://produto.mercadolivre.com.br/MLB-{1000000 + i}",
+            "thumbnail": f"http://http2.mlstatic.com/D_{i}-I.jpg",
+            "shipping": {"free_shipping": True, "mode": "me2", "logistic_type": "fulfillment", "tags": ["fulfillment", "mandatory_free_shipping"]},
+            "seller": {"id": 123456 + i, "nickname": f"LOJA_{i}", "tags": ["normal", "eshop"], "seller_reputation": {"level_id": "5_green", "transactions": {"total": 10000, "completed": 9800}}},
+            "installments": {"quantity": 12, "amount": 416.66, "rate": 0, "currency_id": "BRL"},
+            "attributes": [
+                {"id": f"ATTR_{j}", "name": f"Atributo {j}", "value_id": str(j), "value_name": f"Valor {j}", "values": [{"id": str(j), "name": f"Valor {j}", "struct": None}]}
+                for j in range(20)
+            ],
+        })
+    
+    return json.dumps({
+        "site_id": "MLB",
+        "query": "notebook gamer",
+        "paging": {"total": 5000, "offset": 0, "limit": results},
+        "results": items,
+        "available_filters": [{"id": f"F{k}", "values": [{"id": str(v), "results": v} for v in range(10)]} for k in range(10)],
+    }).encode()
+
+
+def measure(decode, payload: bytes, runs: int):
+    """Return (mean seconds, peak bytes allocated) for one decode."""
+    decode(payload)
+    
+    start = time.perf_counter()
+    for _ in range(runs):
+        decode(payload)
+    elapsed = (time.perf_counter() - start) / runs
+    
+    tracemalloc.start()
+    decode(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    
+    payload = make_payload(args.results)
+    print(f"Payload: {args.results} results, {len(payload) / 1024:.0f} KiB\n")
+    print(f"{'decoder':<18}{'ms/response':>12}{'peak KiB':>12}")
+    
+    cases = [(name, JsonDecoder(name).decode) for name in _available_backends()]
+    
+    typed = JsonDecoder()
+    if typed.supports_schemas:
+        cases.append(("msgspec (typed)", lambda data: typed.decode(data, MLSearchResponse)))
+    
+    for name, decode in cases:
+        elapsed, peak = measure(decode, payload, args.runs)
+        print(f"{name:<18}{elapsed * 1000:>12.3f}{peak / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
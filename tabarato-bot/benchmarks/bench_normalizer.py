@@ -0,0 +1,151 @@
+"""
+Benchmark product name normalization and grouping.
+
+Compares the original normalize_text (NFD + per-character category loop +
+uncompiled regex) with the translation-table path, with and without the
+memo cache, and group_similar_products with per-comparison normalization
+vs names normalized once, on a corpus of marketplace-style titles.
+
+Usage:
+    python benchmarks/bench_normalizer.py [--titles 5000] [--group 150]
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fuzzywuzzy import fuzz
+
+from src.utils.normalizer import ProductNormalizer, _normalize_cached, group_similar_products
+
+PRODUCTS = [
+    ("Notebook", ["Dell Inspiron 15", "Lenovo IdeaPad 3", "Acer Aspire 5", "Samsung Galaxy Book"], ["Intel Core i5 8GB 256GB SSD", "Ryzen 7 16GB 512GB SSD", "i7 16GB 1TB"]),
+    ("Smartphone", ["Samsung Galaxy A54", "Motorola Moto G84", "Xiaomi Redmi Note 13", "Apple iPhone 15"], ["128GB 8GB RAM", "256GB Câmera 50MP", "5G Tela 6,5\""]),
+    ("Fone de Ouvido", ["JBL Tune 510BT", "Sony WH-CH520", "QCY T13", "Xiaomi Redmi Buds"], ["Bluetooth Sem Fio", "Cancelamento de Ruído", "Microfone Integrado"]),
+    ("Smart TV", ["LG 50\" 4K", "Samsung 55\" Crystal UHD", "TCL 43\" Full HD"], ["Wi-Fi HDR10", "Comando de Voz", "Google TV"]),
+    ("Air Fryer", ["Mondial", "Philco", "Britânia", "Electrolux"], ["4L Antiaderente", "5,5 Litros Digital", "Elétrica 1500W"]),
+]
+
+EXTRAS = ["Original", "Lançamento", "Promoção", "Frete Grátis", "Garantia 1 Ano", "Nacional", "Envio Imediato", "Cor: Preto", "Edição Limitada", "Bivolt"]
+
+
+def make_titles(count: int, seed: int = 7) -> list:
+    """Build marketplace-style product titles (with repeats, like real feeds)."""
+    rng = random.Random(seed)
+    titles = []
+    
+    for _ in range(count):
+        kind, models, specs = rng.choice(PRODUCTS)
+        parts = [kind, rng.choice(models), rng.choice(specs)] + rng.sample(EXTRAS, rng.randint(0, 3))
+        if rng.random() < 0.3:
+            parts.append(f"- Cód. {rng.randint(1000, 9999)}")
+        titles.append(" ".join(parts))
+    
+    return titles
+
+
+def original_normalize(text: str) -> str:
+    """normalize_text before memoization and the translation table."""
+    if not text:
+        return ""
+    normalized = text.lower()
+    nfd = unicodedata.normalize('NFD', normalized)
+    normalized = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
+    normalized = re.sub(r'[^a-z0-9\s]', ' ', normalized)
+    return ' '.join(normalized.split())
+
+
+def original_group(names: list, threshold: float) -> int:
+    """group_similar_products normalizing both names per comparison."""
+    used = set()
+    groups = 0
+    for i in range(len(names)):
+        if i in used:
+            continue
+        used.add(i)
+        groups += 1
+        for j in range(i + 1, len(names)):
+            if j not in used and fuzz.token_sort_ratio(
+                original_normalize(names[i]), original_normalize(names[j])
+            ) >= threshold:
+                used.add(j)
+    return groups
+
+
+class Named:
+    """Minimal product stand-in for group_similar_products."""
+    
+    def __init__(self, name: str):
+        self.name = name
+
+
+def timed(func) -> float:
+    """Return the best wall time of three runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titles", type=int, default=5000)
+    parser.add_argument("--group", type=int, default=150)
+    args = parser.parse_args()
+    
+    # group_similar_products logs every call
+    logging.disable(logging.INFO)
+    
+    titles = make_titles(args.titles)
+    unique = len(set(titles))
+    
+    assert [original_normalize(t) for t in titles] == ProductNormalizer.normalize_batch(titles)
+    
+    def cold():
+        _normalize_cached.cache_clear()
+        ProductNormalizer.normalize_batch(titles)
+    
+    baseline = timed(lambda: [original_normalize(t) for t in titles])
+    uncached = timed(lambda: [ProductNormalizer._normalize(t) for t in titles])
+    first = timed(cold)
+    warm = timed(lambda: ProductNormalizer.normalize_batch(titles))
+    
+    print(f"normalize {args.titles} titles ({unique} distinct, cache size {_normalize_cached.cache_info().maxsize})\n")
+    print(f"{'path':<34}{'us/title':>10}{'speedup':>9}")
+    for label, seconds in [
+        ("original", baseline),
+        ("translation table, no cache", uncached),
+        ("memoized, cold cache", first),
+        ("memoized, warm cache", warm),
+    ]:
+        print(f"{label:<34}{seconds / len(titles) * 1e6:>10.2f}{baseline / seconds:>8.1f}x")
+    
+    names = titles[:args.group]
+    products = [Named(name) for name in names]
+    
+    def grouped():
+        _normalize_cached.cache_clear()
+        return len(group_similar_products(products, threshold=70.0))
+    
+    assert original_group(names, 70.0) == grouped()
+    before = timed(lambda: original_group(names, 70.0))
+    after = timed(grouped)
+    
+    print(f"\ngroup_similar_products, {args.group} products\n")
+    print(f"{'normalize per comparison':<34}{before * 1e3:>8.1f} ms")
+    print(f"{'normalize once (batch)':<34}{after * 1e3:>8.1f} ms{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
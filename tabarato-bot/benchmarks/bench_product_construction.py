@@ -0,0 +1,107 @@
+"""
+Benchmark Product construction and coupon application.
+
+Compares the per-product cost of the old path (validated parse plus a
+second validated Product for the coupon) with the current one (validated
+parse plus Product.with_coupon), and of Product.from_trusted.
+
+Usage:
+    python benchmarks/bench_product_construction.py [--products 10000]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.product import Product
+
+
+def make_rows(count: int) -> list:
+    """Build raw product fields as adapters produce them."""
+    now = datetime.now()
+    return [
+        {
+            "id": f"MLB{i}",
+            "name": f"Notebook Gamer Modelo {i} 16GB RAM 512GB SSD",
+            "price": 3999.9 + i % 100,
+            "original_price": 4999.9,
+            "marketplace": "Mercado Livre",
+            "url": f"https://produto.mercadolivre.com.br/MLB-{i}",
+            "image_url": f"http://http2.mlstatic.com/D_{i}-O.jpg",
+            "currency": "BRL",
+            "timestamp": now,
+        }
+        for i in range(count)
+    ]
+
+
+def validated_coupon_copy(product: Product) -> Product:
+    """The previous coupon path: a second fully validated Product."""
+    return Product(
+        id=product.id,
+        name=product.name,
+        price=product.price * 0.9,
+        original_price=product.price,
+        marketplace=product.marketplace,
+        url=product.url,
+        image_url=product.image_url,
+        coupon_code="TECH10",
+        discount_percentage=10.0,
+        currency=product.currency,
+        timestamp=product.timestamp
+    )
+
+
+def timed(label: str, func, rows: list, baseline: float = None, repeat: int = 5) -> float:
+    """Run func over all rows and print the best per-product cost."""
+    func(rows[:100])
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - start)
+    per_product = best / len(rows) * 1e6
+    
+    speedup = f"{baseline / per_product:>8.1f}x" if baseline else ""
+    print(f"{label:<42}{per_product:>10.2f}{speedup}")
+    return per_product
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=10000)
+    args = parser.parse_args()
+    
+    rows = make_rows(args.products)
+    products = [Product(**row) for row in rows]
+    
+    print(f"{args.products} products\n")
+    print(f"{'path':<42}{'us/product':>10}{'speedup':>9}")
+    
+    parse = timed("parse: Product(**fields)", lambda rs: [Product(**r) for r in rs], rows)
+    timed("parse: Product.from_trusted(**fields)", lambda rs: [Product.from_trusted(**r) for r in rs], rows, parse)
+    
+    coupon = timed("coupon: validated Product (before)", lambda _: [validated_coupon_copy(p) for p in products], rows)
+    timed("coupon: with_coupon copy (after)", lambda _: [p.with_coupon(p.price * 0.9, "TECH10", 10.0) for p in products], rows, coupon)
+    
+    before = timed(
+        "parse + coupon (before)",
+        lambda rs: [validated_coupon_copy(Product(**r)) for r in rs],
+        rows
+    )
+    timed(
+        "parse + coupon (after)",
+        lambda rs: [Product(**r).with_coupon(r["price"] * 0.9, "TECH10", 10.0) for r in rs],
+        rows,
+        before
+    )
+
+
+if __name__ == "__main__":
+    main()
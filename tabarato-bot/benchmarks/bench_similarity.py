@@ -0,0 +1,111 @@
+"""
+Benchmark grouping with the rapidfuzz and fuzzywuzzy similarity backends.
+
+Groups marketplace-style listings with fuzzywuzzy pair by pair over the
+token-blocked candidates (the fallback) and with rapidfuzz batch scoring,
+single-threaded and on every core, and reports how many groups match the
+fallback's.
+
+Usage:
+    python benchmarks/bench_similarity.py [--sizes 1000 2000 5000] [--threshold 70]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Make "src" importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config
+from src.utils import similarity
+from src.utils.normalizer import group_similar_products
+
+MODELS = [
+    "Samsung Galaxy A54", "Samsung Galaxy S23", "Motorola Moto G84", "Motorola Edge 40",
+    "Xiaomi Redmi Note 13", "Xiaomi Poco X6", "Apple iPhone 13", "Apple iPhone 15",
+    "Dell Inspiron 15", "Lenovo IdeaPad 3", "Acer Aspire 5", "Asus Vivobook 15",
+    "JBL Tune 510BT", "Sony WH-CH520", "QCY T13", "Mondial AF-30", "Philco PFR15",
+]
+
+SPECS = ["128GB", "256GB", "8GB RAM", "5G", "Dual Chip", "Intel Core i5", "Ryzen 5", "512GB SSD", "Bluetooth", "4L", "Digital", "127V"]
+
+NOISE = ["Original", "Lançamento", "Promoção", "Frete Grátis", "Garantia", "Nacional", "Envio Imediato", "Preto", "Azul", "Novo", "Lacrado", "Oferta"]
+
+
+def make_listings(count: int, seed: int = 5) -> list:
+    """Build listing titles: model, a few specs and seller noise."""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(MODELS).split() + rng.sample(SPECS, rng.randint(1, 3)) + rng.sample(NOISE, rng.randint(0, 3)))
+        for _ in range(count)
+    ]
+
+
+class Named:
+    """Minimal product stand-in for group_similar_products."""
+    
+    def __init__(self, name: str):
+        self.name = name
+
+
+def run(products: list, threshold: float, native: bool, workers: int = 1, blocked: bool = True) -> tuple:
+    """Group once with the given backend settings; return (seconds, groups)."""
+    saved = similarity.rapid_process
+    if not native:
+        similarity.rapid_process = None
+    Config.SIMILARITY_WORKERS = workers
+    Config.GROUPING_BLOCKING_MIN_PRODUCTS = 1 if blocked else len(products) + 1
+    
+    try:
+        start = time.perf_counter()
+        groups = group_similar_products(products, threshold)
+        return time.perf_counter() - start, [tuple(id(p) for p in g) for g in groups]
+    finally:
+        similarity.rapid_process = saved
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 5000])
+    parser.add_argument("--threshold", type=float, default=float(Config.SIMILARITY_THRESHOLD))
+    parser.add_argument("--all-pairs-max", type=int, default=1000, help="largest size also timed without blocking")
+    args = parser.parse_args()
+    
+    if not similarity.is_native():
+        sys.exit("rapidfuzz is not installed")
+    
+    # group_similar_products logs every call
+    logging.disable(logging.INFO)
+    
+    print(f"{'products':>9}  {'backend':<34}{'ms':>10}{'speedup':>9}{'same groups':>13}")
+    
+    for size in args.sizes:
+        products = [Named(name) for name in make_listings(size)]
+        baseline, reference = run(products, args.threshold, native=False)
+        print(f"{size:>9}  {'fuzzywuzzy, blocked':<34}{baseline * 1e3:>10.1f}{'1.0x':>9}{'-':>13}")
+        
+        if size <= args.all_pairs_max:
+            seconds, groups = run(products, args.threshold, native=False, blocked=False)
+            same = len(set(groups) & set(reference))
+            print(
+                f"{'':>9}  {'fuzzywuzzy, all pairs':<34}{seconds * 1e3:>10.1f}{baseline / seconds:>8.1f}x"
+                f"{f'{same}/{len(reference)}':>13}"
+            )
+        
+        for label, workers in [("rapidfuzz, 1 thread", 1), (f"rapidfuzz, all cores ({os.cpu_count()})", -1)]:
+            seconds, groups = run(products, args.threshold, native=True, workers=workers)
+            same = len(set(groups) & set(reference))
+            print(
+                f"{'':>9}  {label:<34}{seconds * 1e3:>10.1f}{baseline / seconds:>8.0f}x"
+                f"{f'{same}/{len(reference)}':>13}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from src.services.search_service import get_search_service
 from src.database.connection import get_database
 from src.database.repositories import SearchRepository
 from src.config import Config
+from src.utils.executor import get_cpu_executor, get_loop_lag_monitor
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -147,6 +148,24 @@ async def stats_admin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
             for i, (query, count) in enumerate(popular, 1):
                 message_parts.append(f"{i}. {query} ({count}x)\n")
             
+            # Marketplace health
+            message_parts.append("\n*⚡ Marketplaces:*\n")
+            for marketplace in get_search_service().marketplaces:
+                breaker = marketplace.circuit_breaker.stats()
+                message_parts.append(
+                    f"• {marketplace.marketplace_name}: {breaker['state'].replace('_', '-')} "
+                    f"({breaker['errors']} erros, {breaker['timeouts']} timeouts, "
+                    f"{marketplace.rate_limiter.rejected} limitadas)\n"
+                )
+            
+            # Event loop responsiveness
+            lag_monitor = get_loop_lag_monitor()
+            message_parts.append(
+                f"\n*⏱️ Event loop:* lag {lag_monitor.last_lag * 1000:.0f}ms "
+                f"(máx {lag_monitor.max_lag * 1000:.0f}ms), "
+                f"{get_cpu_executor().queued} tarefas na fila\n"
+            )
+            
             await update.message.reply_text(
                 "".join(message_parts),
                 parse_mode="Markdown"
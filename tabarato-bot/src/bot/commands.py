@@ -78,6 +78,9 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         "✅ \"air fryer philco 4l\"\n\n"
         "❌ \"notebook\" (muito genérico)\n"
         "❌ \"celular barato\" (muito vago)\n\n"
+        "*Em qualquer conversa:*\n"
+        "Digite @economizap_bot seguido do produto para compartilhar "
+        "o melhor preço das buscas mais populares.\n\n"
         "*O que eu faço:*\n"
         "1️⃣ Busco o produto em 4 marketplaces\n"
         "2️⃣ Comparo os preços\n"
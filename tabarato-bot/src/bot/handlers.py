@@ -3,9 +3,15 @@ Message handlers for EconomiZap Bot.
 Handles user messages and product searches.
 """
 
-from telegram import Update
+from typing import List
+import math
+
+from telegram import Message, Update
+from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
+from src.bot.throttle import get_search_throttle
+from src.models.product import SearchResult
 from src.services.search_service import get_search_service
 from src.database.connection import get_database
 from src.database.repositories import UserRepository, SearchRepository
@@ -42,6 +48,17 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         return
     
+    # Per-user rate limit (in memory, no database round trip)
+    allowed, retry_after = get_search_throttle().hit(user.id)
+    
+    if not allowed:
+        logger.info(f"User {user.id} throttled for {retry_after:.0f}s")
+        await update.message.reply_text(
+            "⏳ Você fez muitas buscas em pouco tempo.\n\n"
+            f"Tente novamente em {math.ceil(retry_after)} segundos. 😉"
+        )
+        return
+    
     # Send "searching" message
     searching_message = await update.message.reply_text(
         "🔍 Buscando os melhores preços...\n"
@@ -52,8 +69,18 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         # Get search service
         search_service = get_search_service()
         
-        # Perform search
-        results = await search_service.search_all(message_text)
+        # Answer at once from stored results while they are refreshed
+        results = await search_service.get_stale_result(message_text)
+        
+        if results is None:
+            # Perform search, updating the progress message as marketplaces answer
+            partial_results: List[SearchResult] = []
+            
+            async for partial_result in search_service.search_stream(message_text):
+                partial_results.append(partial_result)
+                await _update_progress(searching_message, partial_results)
+            
+            results = search_service.merge_results(message_text, partial_results)
         
         # Save to database
         try:
@@ -72,7 +99,8 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 SearchRepository.create_search(
                     session=session,
                     user=db_user,
-                    search_result=results
+                    search_result=results,
+                    save_products=not results.stale
                 )
                 
                 logger.info(f"Saved search to database for user {user.id}")
@@ -110,10 +138,15 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         response_message = (
             f"🎯 *Melhor Preço Encontrado!*\n\n"
             f"{best_product.to_telegram_message()}\n\n"
-            f"⏰ Preço verificado há alguns segundos\n"
+            f"{_format_price_age(results)}\n"
             f"📊 Encontrados {results.total_results} resultado(s) em {results.search_time:.1f}s"
         )
         
+        if results.is_partial:
+            response_message += (
+                f"\n⏱️ Sem resposta a tempo: {', '.join(results.missing_marketplaces)}"
+            )
+        
         # Send response
         await update.message.reply_text(
             response_message,
@@ -140,3 +173,58 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             "😔 Desculpe, ocorreu um erro ao buscar produtos.\n"
             "Por favor, tente novamente em alguns instantes."
         )
+
+
+def _format_price_age(results: SearchResult) -> str:
+    """
+    Describe how old the prices in a result are.
+    
+    Args:
+        results: Search results being answered
+        
+    Returns:
+        str: Line for the reply message
+    """
+    if not results.stale:
+        return "⏰ Preço verificado há alguns segundos"
+    
+    minutes = int(results.age.total_seconds() // 60)
+    
+    if minutes < 1:
+        age = "menos de 1 minuto"
+    elif minutes < 60:
+        age = f"{minutes} minuto(s)"
+    else:
+        age = f"{minutes // 60} hora(s)"
+    
+    return f"⏰ Preço verificado há {age} (atualizando em segundo plano)"
+
+
+async def _update_progress(
+    searching_message: Message,
+    partial_results: List[SearchResult]
+) -> None:
+    """
+    Edit the "searching" message with the best price found so far.
+    
+    Args:
+        searching_message: Message to edit in place
+        partial_results: Results received so far
+    """
+    products = [p for result in partial_results for p in result.products]
+    
+    if not products:
+        return
+    
+    best_product = min(products, key=lambda p: p.final_price)
+    
+    try:
+        await searching_message.edit_text(
+            f"🔍 Buscando os melhores preços...\n"
+            f"✅ {len(partial_results)} marketplace(s) responderam\n\n"
+            f"💰 Melhor até agora: {best_product.format_price()} "
+            f"({best_product.marketplace})"
+        )
+    except TelegramError as e:
+        # Progress updates are best effort (e.g. "message is not modified")
+        logger.debug(f"Could not update progress message: {e}")
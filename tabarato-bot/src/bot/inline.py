@@ -0,0 +1,103 @@
+"""
+Inline query handler for EconomiZap Bot.
+Answers "@economizap_bot produto" in any chat from cached results.
+"""
+
+import hashlib
+from typing import List
+
+from telegram import (
+    InlineQueryResultArticle,
+    InlineQueryResultsButton,
+    InputTextMessageContent,
+    Update
+)
+from telegram.error import TelegramError
+from telegram.ext import ContextTypes
+
+from src.bot.throttle import get_inline_throttle
+from src.models.product import SearchResult
+from src.services.inline_service import get_inline_search_service
+from src.utils.logger import get_logger
+from src.config import Config
+
+logger = get_logger(__name__)
+
+
+async def handle_inline_query(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Handle inline queries (e.g. "@economizap_bot notebook" in any chat).
+    
+    Only cached results are used, so the answer is sent at once; a query
+    with no cached result is searched in the background once the user
+    stops typing (within the user's inline search limit) and the user is
+    asked to try again shortly.
+    
+    Args:
+        update: Telegram update object
+        context: Telegram context object
+    """
+    inline_query = update.inline_query
+    user = inline_query.from_user
+    query = inline_query.query.strip()
+    
+    inline_service = get_inline_search_service()
+    results = inline_service.answer(query)
+    
+    searching = inline_service.schedule_prefetch(user.id, query, get_inline_throttle().hit)
+    
+    logger.info(f"User {user.id} inline query: '{query}' ({len(results)} cached result(s))")
+    
+    button = None
+    if searching:
+        button = InlineQueryResultsButton(
+            text="🔍 Buscando preços... digite de novo em instantes",
+            start_parameter="inline"
+        )
+    
+    try:
+        await inline_query.answer(
+            _build_articles(results),
+            # Answers change as searches complete: only cache complete ones
+            cache_time=0 if searching else Config.INLINE_CACHE_TIME,
+            is_personal=False,
+            button=button
+        )
+    except TelegramError as e:
+        # The user may have kept typing, making this query too old to answer
+        logger.debug(f"Could not answer inline query '{query}': {e}")
+
+
+def _build_articles(results: List[SearchResult]) -> List[InlineQueryResultArticle]:
+    """
+    Build one inline result per query, showing its best price.
+    
+    Args:
+        results: Cached search results
+        
+    Returns:
+        List[InlineQueryResultArticle]: Inline results
+    """
+    articles = []
+    
+    for result in results:
+        best_product = result.best_price
+        if not best_product:
+            continue
+        
+        articles.append(InlineQueryResultArticle(
+            id=hashlib.sha1(result.query.encode('utf-8')).hexdigest(),
+            title=f"{result.query} - {best_product.format_price()}",
+            description=(
+                f"{best_product.name[:60]}\n"
+                f"🏪 {best_product.marketplace} · {result.total_results} resultado(s)"
+            ),
+            thumbnail_url=best_product.image_url,
+            input_message_content=InputTextMessageContent(
+                f"🎯 *Melhor Preço para \"{result.query}\"*\n\n"
+                f"{best_product.to_telegram_message()}",
+                parse_mode="Markdown"
+            )
+        ))
+    
+    return articles
@@ -0,0 +1,214 @@
+"""
+Per-user search throttling for EconomiZap Bot.
+Enforces MAX_SEARCHES_PER_MINUTE in memory, without touching the database.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import time
+
+from src.utils.logger import get_logger
+from src.config import Config
+
+logger = get_logger(__name__)
+
+
+class SlidingWindowLimiter:
+    """
+    Approximate sliding-window rate limiter.
+    
+    Time is split into fixed windows. For each key only the counts of the
+    current and previous windows are kept, and the rate over the last
+    ``window`` seconds is estimated by weighting the previous count by the
+    part of it still inside the sliding window:
+        
+        estimate = previous * (1 - elapsed / window) + current
+    
+    This needs constant memory and time per key. Keys idle for two windows
+    carry no information and are dropped as new requests arrive.
+    """
+    
+    def __init__(
+        self,
+        limit: int,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            limit: Requests allowed per window (0 or less disables limiting)
+            window: Window length in seconds
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.limit = limit
+        self.window = window
+        self._clock = clock
+        
+        # key -> [window index, previous count, current count, last seen]
+        # kept in last-seen order so idle keys can be dropped from the front
+        self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+        
+        # Counters
+        self.allowed = 0
+        self.throttled = 0
+    
+    def hit(self, key: Hashable) -> Tuple[bool, float]:
+        """
+        Register a request for a key.
+        
+        Args:
+            key: Rate limited identity (e.g. Telegram user ID)
+            
+        Returns:
+            Tuple: Whether the request is allowed, and the seconds to wait
+            before retrying when it is not (0.0 when allowed)
+        """
+        if self.limit <= 0:
+            return True, 0.0
+        
+        now = self._clock()
+        self._expire(now)
+        
+        index = int(now // self.window)
+        entry = self._entries.get(key)
+        
+        if entry is None:
+            entry = self._entries[key] = [index, 0, 0, now]
+        else:
+            self._entries.move_to_end(key)
+            self._advance(entry, index)
+            entry[3] = now
+        
+        elapsed = (now - index * self.window) / self.window
+        _, previous, current, _ = entry
+        
+        if previous * (1 - elapsed) + current < self.limit:
+            entry[2] += 1
+            self.allowed += 1
+            return True, 0.0
+        
+        self.throttled += 1
+        return False, self._retry_after(previous, current, elapsed)
+    
+    @staticmethod
+    def _advance(entry: list, index: int) -> None:
+        """
+        Roll an entry forward to the window containing now.
+        
+        Args:
+            entry: Entry to update in place
+            index: Current window index
+        """
+        if entry[0] == index:
+            return
+        
+        if entry[0] == index - 1:
+            entry[1], entry[2] = entry[2], 0
+        else:
+            entry[1], entry[2] = 0, 0
+        
+        entry[0] = index
+    
+    def _retry_after(self, previous: int, current: int, elapsed: float) -> float:
+        """
+        Compute when the estimate drops below the limit again.
+        
+        Args:
+            previous: Count of the previous window
+            current: Count of the current window
+            elapsed: Fraction of the current window already elapsed
+            
+        Returns:
+            float: Seconds to wait
+        """
+        if current < self.limit:
+            # The previous window's weight fades out within this window
+            allowed_at = 1 - (self.limit - current) / previous
+            return max(0.0, (allowed_at - elapsed) * self.window)
+        
+        # Wait for the next window, then for this window's weight to fade
+        allowed_at = 1 - self.limit / current
+        return (1 - elapsed + allowed_at) * self.window
+    
+    def _expire(self, now: float) -> None:
+        """
+        Drop entries idle for at least two windows.
+        
+        Args:
+            now: Current time
+        """
+        cutoff = now - 2 * self.window
+        
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry[3] > cutoff:
+                break
+            del self._entries[key]
+    
+    def reset(self, key: Hashable) -> None:
+        """
+        Forget a key's history.
+        
+        Args:
+            key: Rate limited identity
+        """
+        self._entries.pop(key, None)
+    
+    def __len__(self) -> int:
+        """Number of keys currently tracked."""
+        return len(self._entries)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+        
+        Returns:
+            Dict: Limit, tracked keys and counters
+        """
+        return {
+            'limit': self.limit,
+            'window': self.window,
+            'tracked': len(self._entries),
+            'allowed': self.allowed,
+            'throttled': self.throttled
+        }
+
+
+# Global throttle instances
+_search_throttle: Optional[SlidingWindowLimiter] = None
+_inline_throttle: Optional[SlidingWindowLimiter] = None
+
+
+def get_search_throttle() -> SlidingWindowLimiter:
+    """
+    Get the global per-user search throttle.
+    
+    Returns:
+        SlidingWindowLimiter: Limiter enforcing MAX_SEARCHES_PER_MINUTE
+    """
+    global _search_throttle
+    
+    if _search_throttle is None:
+        _search_throttle = SlidingWindowLimiter(limit=Config.MAX_SEARCHES_PER_MINUTE, window=60.0)
+    
+    return _search_throttle
+
+
+def get_inline_throttle() -> SlidingWindowLimiter:
+    """
+    Get the global per-user throttle for inline mode background searches.
+    
+    Kept apart from the search throttle, so typing inline does not use up
+    the searches a user can run in chat.
+    
+    Returns:
+        SlidingWindowLimiter: Limiter enforcing MAX_INLINE_SEARCHES_PER_MINUTE
+    """
+    global _inline_throttle
+    
+    if _inline_throttle is None:
+        _inline_throttle = SlidingWindowLimiter(limit=Config.MAX_INLINE_SEARCHES_PER_MINUTE, window=60.0)
+    
+    return _inline_throttle
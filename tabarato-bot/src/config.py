@@ -58,8 +58,96 @@ class Config:
     SEARCH_TIMEOUT: int = int(os.getenv("SEARCH_TIMEOUT", "10"))
     MAX_RESULTS_PER_MARKETPLACE: int = int(os.getenv("MAX_RESULTS_PER_MARKETPLACE", "5"))
     
+    # HTTP connection pool (shared by all marketplace APIs)
+    HTTP_POOL_LIMIT: int = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+    HTTP_POOL_LIMIT_PER_HOST: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+    
+    # JSON decoder for API responses: auto, orjson, msgspec or json
+    JSON_BACKEND: str = os.getenv("JSON_BACKEND", "auto")
+    
+    # Conditional-request (ETag / Last-Modified) cache for API GETs (0 disables it)
+    HTTP_CACHE_MAX_SIZE: int = int(os.getenv("HTTP_CACHE_MAX_SIZE", "1000"))
+    
+    # Circuit breaker (per marketplace)
+    CIRCUIT_WINDOW: float = float(os.getenv("CIRCUIT_WINDOW", "60"))
+    CIRCUIT_MIN_CALLS: int = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+    CIRCUIT_ERROR_RATE: float = float(os.getenv("CIRCUIT_ERROR_RATE", "0.5"))
+    CIRCUIT_TIMEOUT_RATE: float = float(os.getenv("CIRCUIT_TIMEOUT_RATE", "0.3"))
+    CIRCUIT_OPEN_DURATION: float = float(os.getenv("CIRCUIT_OPEN_DURATION", "30"))
+    
+    # Retries for idempotent marketplace requests (jittered exponential backoff)
+    RETRY_MAX_ATTEMPTS: int = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+    RETRY_BASE_DELAY: float = float(os.getenv("RETRY_BASE_DELAY", "0.2"))
+    RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "2"))
+    
+    # Outbound rate limits per marketplace (requests per second, 0 disables)
+    MARKETPLACE_RATE_LIMIT: float = float(os.getenv("MARKETPLACE_RATE_LIMIT", "5"))
+    MARKETPLACE_RATE_BURST: float = float(os.getenv("MARKETPLACE_RATE_BURST", "10"))
+    MERCADOLIVRE_RATE_LIMIT: float = float(
+        os.getenv("MERCADOLIVRE_RATE_LIMIT", os.getenv("MARKETPLACE_RATE_LIMIT", "5"))
+    )
+    MERCADOLIVRE_RATE_BURST: float = float(
+        os.getenv("MERCADOLIVRE_RATE_BURST", os.getenv("MARKETPLACE_RATE_BURST", "10"))
+    )
+    
+    # Parallel multiget calls when refreshing Mercado Livre products in bulk
+    MERCADOLIVRE_MULTIGET_CONCURRENCY: int = int(os.getenv("MERCADOLIVRE_MULTIGET_CONCURRENCY", "4"))
+    
+    # Deep search used by the channel deal scanner (listings scanned per term)
+    MERCADOLIVRE_DEEP_SEARCH_MAX_ITEMS: int = int(os.getenv("MERCADOLIVRE_DEEP_SEARCH_MAX_ITEMS", "300"))
+    MERCADOLIVRE_DEEP_SEARCH_CONCURRENCY: int = int(os.getenv("MERCADOLIVRE_DEEP_SEARCH_CONCURRENCY", "3"))
+    
+    # Latency budget for a whole search (0 disables it)
+    SEARCH_BUDGET: float = float(os.getenv("SEARCH_BUDGET", "4"))
+    SEARCH_BUDGET_BACKGROUND: bool = os.getenv("SEARCH_BUDGET_BACKGROUND", "true").lower() == "true"
+    
+    # Products from which coupons are priced in one vectorized pass (needs numpy)
+    BATCH_PRICING_MIN_PRODUCTS: int = int(os.getenv("BATCH_PRICING_MIN_PRODUCTS", "32"))
+    
     # Normalization settings
     SIMILARITY_THRESHOLD: int = int(os.getenv("SIMILARITY_THRESHOLD", "70"))
+    NORMALIZE_CACHE_SIZE: int = int(os.getenv("NORMALIZE_CACHE_SIZE", "10000"))
+    
+    # Without rapidfuzz, grouping only scores pairs sharing rare tokens from this many products
+    GROUPING_BLOCKING_MIN_PRODUCTS: int = int(os.getenv("GROUPING_BLOCKING_MIN_PRODUCTS", "100"))
+    GROUPING_MIN_TOKEN_OVERLAP: float = float(os.getenv("GROUPING_MIN_TOKEN_OVERLAP", "0.4"))
+    
+    # Threads used by rapidfuzz to score name pairs in batch (-1 = all cores)
+    SIMILARITY_WORKERS: int = int(os.getenv("SIMILARITY_WORKERS", "-1"))
+    
+    # Product grouping strategy (alternatives): the persistent catalog table
+    # (true) or in-memory clusters kept across searches (false)
+    CATALOG_GROUPING: bool = os.getenv("CATALOG_GROUPING", "true").lower() == "true"
+    
+    # Days a listing stays in the in-memory clusters without being seen
+    # (only used when CATALOG_GROUPING is false)
+    CLUSTER_MAX_AGE_DAYS: float = float(os.getenv("CLUSTER_MAX_AGE_DAYS", "7"))
+    
+    # CPU-bound stages: worker processes (0 = run inline), batch size from
+    # which work is offloaded, and jobs allowed to wait for a worker
+    CPU_WORKERS: int = int(os.getenv("CPU_WORKERS", "2"))
+    CPU_OFFLOAD_MIN_ITEMS: int = int(os.getenv("CPU_OFFLOAD_MIN_ITEMS", "1000"))
+    CPU_QUEUE_SIZE: int = int(os.getenv("CPU_QUEUE_SIZE", "32"))
+    
+    # Event loop lag sampling interval and warning threshold (seconds)
+    LOOP_LAG_INTERVAL: float = float(os.getenv("LOOP_LAG_INTERVAL", "1"))
+    LOOP_LAG_WARNING: float = float(os.getenv("LOOP_LAG_WARNING", "0.25"))
+    
+    # Inline mode: results per answer, popular queries indexed and the days
+    # they are counted over, index refresh interval and Telegram answer
+    # cache time (seconds)
+    INLINE_MAX_RESULTS: int = int(os.getenv("INLINE_MAX_RESULTS", "5"))
+    INLINE_INDEX_MAX_QUERIES: int = int(os.getenv("INLINE_INDEX_MAX_QUERIES", "5000"))
+    INLINE_POPULAR_DAYS: int = int(os.getenv("INLINE_POPULAR_DAYS", "7"))
+    INLINE_REFRESH_INTERVAL: int = int(os.getenv("INLINE_REFRESH_INTERVAL", "3600"))
+    INLINE_CACHE_TIME: int = int(os.getenv("INLINE_CACHE_TIME", "60"))
+    
+    # Inline mode background searches: seconds a query must stay unchanged
+    # before it is searched, and searches per user per minute
+    INLINE_PREFETCH_DELAY: float = float(os.getenv("INLINE_PREFETCH_DELAY", "1.0"))
+    MAX_INLINE_SEARCHES_PER_MINUTE: int = int(os.getenv("MAX_INLINE_SEARCHES_PER_MINUTE", "5"))
     
     # Channel posting settings
     MIN_DISCOUNT_FOR_CHANNEL: int = int(os.getenv("MIN_DISCOUNT_FOR_CHANNEL", "30"))
@@ -69,6 +157,10 @@ class Config:
     
     # Cache settings
     CACHE_EXPIRATION: int = int(os.getenv("CACHE_EXPIRATION", "3600"))
+    CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", "500"))
+    
+    # Answer from stored results up to this age (seconds) while refreshing (0 disables)
+    STALE_RESULTS_MAX_AGE: int = int(os.getenv("STALE_RESULTS_MAX_AGE", "21600"))
     
     @classmethod
     def validate(cls) -> bool:
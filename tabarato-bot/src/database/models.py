@@ -4,7 +4,7 @@ Defines SQLAlchemy models for persistence.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -98,6 +98,32 @@ class ProductCache(Base):
         return f"<ProductCache(name={self.name[:30]}..., price={self.price})>"
 
 
+class CatalogProduct(Base):
+    """
+    Cross-marketplace catalog: maps each listing to a canonical product.
+    """
+    __tablename__ = 'product_catalog'
+    
+    id = Column(Integer, primary_key=True)
+    marketplace = Column(String(50), nullable=False)
+    external_id = Column(String(100), nullable=False)  # ID from marketplace
+    canonical_id = Column(String(32), nullable=False, index=True)
+    fingerprint = Column(String(200), index=True)
+    name = Column(String(500), nullable=False)
+    
+    # Metadata
+    first_seen = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_seen = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Indexes
+    __table_args__ = (
+        Index('idx_catalog_listing', 'marketplace', 'external_id', unique=True),
+    )
+    
+    def __repr__(self):
+        return f"<CatalogProduct(listing={self.marketplace}:{self.external_id}, canonical={self.canonical_id})>"
+
+
 class PriceHistory(Base):
     """
     Price history tracking for products.
@@ -159,7 +185,8 @@ class Analytics(Base):
     id = Column(Integer, primary_key=True)
     metric_name = Column(String(100), nullable=False, index=True)
     metric_value = Column(Float, nullable=False)
-    metadata = Column(JSONB)  # Additional data as JSON
+    # Additional data as JSON ("metadata" is reserved by SQLAlchemy as an attribute name)
+    extra_data = Column('metadata', JSON().with_variant(JSONB(), 'postgresql'))
     recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     # Indexes
@@ -2,5 +2,6 @@
 
 from src.database.repositories.user_repository import UserRepository
 from src.database.repositories.search_repository import SearchRepository
+from src.database.repositories.catalog_repository import CatalogRepository
 
-__all__ = ['UserRepository', 'SearchRepository']
+__all__ = ['UserRepository', 'SearchRepository', 'CatalogRepository']
@@ -0,0 +1,141 @@
+"""
+Repository for the cross-marketplace product catalog.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import tuple_
+
+from src.database.models import CatalogProduct
+from src.models.product import Product
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# A listing is identified by (marketplace, external_id)
+ListingKey = Tuple[str, str]
+
+# Listings looked up per query (keeps the IN clause small)
+LOOKUP_BATCH_SIZE = 500
+
+
+class CatalogRepository:
+    """
+    Repository for CatalogProduct database operations.
+    """
+    
+    @staticmethod
+    def listing_key(product: Product) -> ListingKey:
+        """
+        Get the catalog key of a product.
+        
+        Args:
+            product: Product from a marketplace
+            
+        Returns:
+            ListingKey: (marketplace, external_id)
+        """
+        return (product.marketplace, product.id)
+    
+    @staticmethod
+    def get_canonical_ids(
+        session: Session,
+        keys: Iterable[ListingKey]
+    ) -> Dict[ListingKey, str]:
+        """
+        Get the canonical product IDs of known listings.
+        
+        Args:
+            session: Database session
+            keys: Listing keys to look up
+            
+        Returns:
+            Dict: Listing key to canonical ID (unknown listings are absent)
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[ListingKey, str] = {}
+        
+        for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            batch = keys[start:start + LOOKUP_BATCH_SIZE]
+            rows = session.query(
+                CatalogProduct.marketplace,
+                CatalogProduct.external_id,
+                CatalogProduct.canonical_id
+            ).filter(
+                tuple_(CatalogProduct.marketplace, CatalogProduct.external_id).in_(batch)
+            ).all()
+            
+            for marketplace, external_id, canonical_id in rows:
+                found[(marketplace, external_id)] = canonical_id
+        
+        return found
+    
+    @staticmethod
+    def add_listings(
+        session: Session,
+        listings: Iterable[Tuple[Product, str, Optional[str]]],
+        seen_at: Optional[datetime] = None
+    ) -> int:
+        """
+        Add new listings to the catalog.
+        
+        Args:
+            session: Database session
+            listings: (product, canonical ID, fingerprint) per new listing
+            seen_at: When the listings were seen (default: now, UTC)
+            
+        Returns:
+            int: Number of listings added
+        """
+        seen_at = seen_at or datetime.utcnow()
+        
+        # A listing repeated in one batch is added once
+        by_key = {}
+        for product, canonical_id, fingerprint in listings:
+            by_key.setdefault(
+                CatalogRepository.listing_key(product),
+                (product, canonical_id, fingerprint)
+            )
+        
+        session.add_all([
+            CatalogProduct(
+                marketplace=product.marketplace,
+                external_id=product.id,
+                canonical_id=canonical_id,
+                fingerprint=fingerprint,
+                name=product.name[:500],
+                first_seen=seen_at,
+                last_seen=seen_at
+            )
+            for product, canonical_id, fingerprint in by_key.values()
+        ])
+        session.flush()
+        
+        logger.debug(f"Catalog: added {len(by_key)} listings")
+        
+        return len(by_key)
+    
+    @staticmethod
+    def touch(
+        session: Session,
+        keys: Iterable[ListingKey],
+        seen_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Mark known listings as seen.
+        
+        Args:
+            session: Database session
+            keys: Listing keys
+            seen_at: When the listings were seen (default: now, UTC)
+        """
+        seen_at = seen_at or datetime.utcnow()
+        keys = list(dict.fromkeys(keys))
+        
+        for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            session.query(CatalogProduct).filter(
+                tuple_(CatalogProduct.marketplace, CatalogProduct.external_id).in_(
+                    keys[start:start + LOOKUP_BATCH_SIZE]
+                )
+            ).update({CatalogProduct.last_seen: seen_at}, synchronize_session=False)
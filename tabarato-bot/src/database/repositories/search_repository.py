@@ -3,13 +3,14 @@ Repository for search operations.
 """
 
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 
 from src.database.models import Search, ProductCache, User
 from src.models.product import Product, SearchResult
 from src.utils.logger import get_logger
+from src.utils.normalizer import ProductNormalizer
 
 logger = get_logger(__name__)
 
@@ -23,7 +24,8 @@ class SearchRepository:
     def create_search(
         session: Session,
         user: User,
-        search_result: SearchResult
+        search_result: SearchResult,
+        save_products: bool = True
     ) -> Search:
         """
         Create a new search record.
@@ -32,6 +34,7 @@ class SearchRepository:
             session: Database session
             user: User who performed the search
             search_result: Search result to save
+            save_products: Whether to store the products in ProductCache
             
         Returns:
             Search: Created search record
@@ -54,8 +57,9 @@ class SearchRepository:
         session.add(search)
         session.flush()  # Get search.id
         
-        # Save products
-        for product in search_result.products:
+        # Save products (not for results read back from ProductCache)
+        products = search_result.products if save_products else []
+        for product in products:
             product_cache = ProductCache(
                 search_id=search.id,
                 external_id=product.id,
@@ -71,10 +75,82 @@ class SearchRepository:
             session.add(product_cache)
         
         session.commit()
-        logger.info(f"Saved search: {search_result.query} with {len(search_result.products)} products")
+        logger.info(f"Saved search: {search_result.query} with {len(products)} products")
         
         return search
     
+    @staticmethod
+    def get_recent_result(
+        session: Session,
+        query: str,
+        max_age: timedelta
+    ) -> Optional[SearchResult]:
+        """
+        Rebuild the latest stored result for a query.
+        
+        Queries are stored as typed, so spellings are compared by their
+        normalized form (the search cache key): "Notebook " finds a result
+        stored for "notebook".
+        
+        Args:
+            session: Database session
+            query: Search query (any spelling)
+            max_age: Oldest result accepted
+            
+        Returns:
+            Optional[SearchResult]: Stale result with the stored products and
+            their fetch time, or None if there is no recent result
+        """
+        since = datetime.utcnow() - max_age
+        key = ProductNormalizer.normalize_text(query)
+        
+        # Newest first, stopping at the first spelling of the query
+        recent = session.query(Search.id, Search.query).filter(
+            Search.created_at >= since,
+            Search.products.any()
+        ).order_by(
+            desc(Search.created_at)
+        ).yield_per(100)
+        
+        search_id = next(
+            (row.id for row in recent if ProductNormalizer.normalize_text(row.query) == key),
+            None
+        )
+        
+        if search_id is None:
+            return None
+        
+        search = session.get(Search, search_id)
+        
+        # Stored times are UTC; results use local naive times
+        fetched_at = search.created_at.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+        
+        # Stored products were validated before being saved
+        products = [
+            Product.from_trusted(
+                id=row.external_id,
+                name=row.name,
+                price=row.price,
+                original_price=row.original_price,
+                marketplace=row.marketplace,
+                url=row.url,
+                image_url=row.image_url,
+                coupon_code=row.coupon_code,
+                discount_percentage=row.discount_percentage,
+                timestamp=fetched_at
+            )
+            for row in search.products
+        ]
+        
+        return SearchResult(
+            query=query,
+            products=products,
+            total_results=len(products),
+            search_time=search.search_time or 0.0,
+            timestamp=fetched_at,
+            stale=True
+        )
+    
     @staticmethod
     def get_user_searches(
         session: Session,
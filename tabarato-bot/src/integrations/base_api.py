@@ -4,13 +4,21 @@ Provides common functionality for all marketplace APIs.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import aiohttp
 import asyncio
 from datetime import datetime
 
+from src.integrations.circuit_breaker import CircuitBreaker
+from src.integrations.http_client import get_http_client
+from src.integrations.rate_limiter import TokenBucket, is_fail_fast
+from src.integrations.response_cache import ResponseCache
+from src.integrations.retry import RetryPolicy
 from src.models.product import Product, SearchResult
+from src.utils.deadline import remaining_time
+from src.utils.json_codec import get_json_decoder
 from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics, metric_name
 from src.config import Config
 
 logger = get_logger(__name__)
@@ -24,37 +32,54 @@ class BaseMarketplaceAPI(ABC):
     and implement the required abstract methods.
     """
     
-    def __init__(self, marketplace_name: str):
+    def __init__(
+        self,
+        marketplace_name: str,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        response_cache: Optional[ResponseCache] = None
+    ):
         """
         Initialize the base API.
         
         Args:
             marketplace_name: Name of the marketplace
+            retry_policy: Retry policy for HTTP calls (default: global settings)
+            rate_limiter: Outbound rate limiter (default: global rate settings)
+            response_cache: Conditional-request cache for GETs (default: disabled)
         """
         self.marketplace_name = marketplace_name
         self.timeout = Config.SEARCH_TIMEOUT
         self.max_results = Config.MAX_RESULTS_PER_MARKETPLACE
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.circuit_breaker = CircuitBreaker(marketplace_name)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or TokenBucket(
+            marketplace_name,
+            rate=Config.MARKETPLACE_RATE_LIMIT,
+            capacity=Config.MARKETPLACE_RATE_BURST
+        )
+        self.json_decoder = get_json_decoder()
+        self.response_cache = response_cache
         
         logger.info(f"Initialized {marketplace_name} API integration")
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """
-        Get or create aiohttp session.
+        Get the shared aiohttp session.
         
         Returns:
-            aiohttp.ClientSession: HTTP session
+            aiohttp.ClientSession: HTTP session from the shared pool
         """
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
+        return await get_http_client().get_session()
     
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            logger.debug(f"Closed {self.marketplace_name} API session")
+        """
+        Release API resources.
+        
+        The HTTP session is shared by all marketplaces and is closed by
+        close_http_client() at application shutdown.
+        """
+        logger.debug(f"Closed {self.marketplace_name} API")
     
     @abstractmethod
     async def search(self, query: str) -> SearchResult:
@@ -91,23 +116,132 @@ class BaseMarketplaceAPI(ABC):
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        json_data: Optional[Dict[str, Any]] = None
+        json_data: Optional[Dict[str, Any]] = None,
+        schema: Optional[Any] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Make HTTP request to API.
         
+        Every attempt takes a token from self.rate_limiter, waiting for it up
+        to the search deadline (or failing fast inside rate_limit_fail_fast()).
+        Idempotent requests failing with a retryable status, a timeout or a
+        connection error are retried according to self.retry_policy, as long
+        as the next attempt fits in the remaining search deadline.
+        
         Args:
             url: Request URL
             method: HTTP method (GET, POST, etc.)
             params: Query parameters
             headers: Request headers
             json_data: JSON body data
+            schema: Optional TypedDict of the response fields to decode
             
         Returns:
             Optional[Dict]: Response JSON or None if request fails
         """
+        attempt = 0
+        
+        while True:
+            # Short-circuit while the marketplace is considered unhealthy
+            if not self.circuit_breaker.allow_request():
+                logger.debug(f"{self.marketplace_name}: Circuit open, skipping request")
+                return None
+            
+            remaining = remaining_time()
+            if remaining is not None and remaining <= 0:
+                self.circuit_breaker.record_cancelled()
+                logger.warning(f"{self.marketplace_name}: Search deadline exceeded")
+                return None
+            
+            # Stay within the marketplace quota
+            if not await self.rate_limiter.acquire(max_wait=self._max_token_wait(remaining)):
+                self.circuit_breaker.record_cancelled()
+                return None
+            
+            remaining = remaining_time()
+            attempt += 1
+            timeout = self.timeout if remaining is None else min(self.timeout, remaining)
+            
+            data, retryable, retry_after = await self._send_request(
+                url, method, params, headers, json_data, timeout, schema
+            )
+            
+            if not retryable or not self.retry_policy.can_retry(method, attempt):
+                return data
+            
+            # Never let a retry push the user past the search deadline
+            delay = self.retry_policy.next_delay(attempt, retry_after)
+            remaining = remaining_time()
+            
+            if delay is None or (remaining is not None and delay >= remaining):
+                logger.warning(
+                    f"{self.marketplace_name}: Not retrying, next attempt would "
+                    f"exceed the deadline"
+                )
+                return None
+            
+            logger.info(
+                f"{self.marketplace_name}: Retrying in {delay:.2f}s "
+                f"(attempt {attempt + 1}/{self.retry_policy.max_attempts})"
+            )
+            get_metrics().increment(metric_name("http", self.marketplace_name, "retries"))
+            await asyncio.sleep(delay)
+    
+    def _max_token_wait(self, remaining: Optional[float]) -> float:
+        """
+        Get how long a request may wait for a rate limit token.
+        
+        Args:
+            remaining: Time left before the search deadline, if any
+            
+        Returns:
+            float: Seconds (0 when failing fast)
+        """
+        if is_fail_fast():
+            return 0.0
+        return self.timeout if remaining is None else min(self.timeout, remaining)
+    
+    async def _send_request(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        json_data: Optional[Dict[str, Any]],
+        timeout: float,
+        schema: Optional[Any] = None
+    ) -> Tuple[Optional[Dict[str, Any]], bool, Optional[str]]:
+        """
+        Send a single HTTP request and record its outcome.
+        
+        Args:
+            url: Request URL
+            method: HTTP method
+            params: Query parameters
+            headers: Request headers
+            json_data: JSON body data
+            timeout: Total timeout for this attempt in seconds
+            schema: Optional TypedDict of the response fields to decode
+            
+        Returns:
+            Tuple: Response JSON (or None), whether the failure is
+            retryable, and the Retry-After header value (if any)
+        """
         session = await self._get_session()
         
+        # Revalidate a cached response instead of downloading it again
+        cache_key = cached = None
+        if (
+            self.response_cache is not None
+            and method.upper() == "GET"
+            and self.response_cache.ttl_for(url)
+        ):
+            cache_key = self.response_cache.make_key(url, params, schema)
+            cached = self.response_cache.get(cache_key)
+            
+            if cached is not None:
+                headers = {**(headers or {}), **cached.conditional_headers()}
+        
         try:
             logger.debug(f"{self.marketplace_name}: {method} {url}")
             
@@ -116,32 +250,66 @@ class BaseMarketplaceAPI(ABC):
                 url=url,
                 params=params,
                 headers=headers,
-                json=json_data
+                json=json_data,
+                timeout=aiohttp.ClientTimeout(total=timeout)
             ) as response:
                 
+                if response.status == 304 and cached is not None:
+                    self.circuit_breaker.record_success()
+                    return self.response_cache.revalidate(cache_key, url, cached), False, None
+                
                 # Check status code
                 if response.status != 200:
                     logger.warning(
                         f"{self.marketplace_name} API returned status {response.status}"
                     )
-                    return None
+                    
+                    # Rate limiting and server errors count against the circuit
+                    if response.status == 429 or response.status >= 500:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+                    
+                    return (
+                        None,
+                        self.retry_policy.is_retryable_status(response.status),
+                        response.headers.get("Retry-After")
+                    )
+                
+                # Parse JSON from the raw body
+                data = self.json_decoder.decode(await response.read(), schema)
+                self.circuit_breaker.record_success()
+                
+                if cache_key is not None:
+                    self.response_cache.store(
+                        cache_key,
+                        url,
+                        data,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified")
+                    )
                 
-                # Parse JSON
-                data = await response.json()
                 logger.debug(f"{self.marketplace_name}: Request successful")
-                return data
+                return data, False, None
                 
+        except asyncio.CancelledError:
+            self.circuit_breaker.record_cancelled()
+            raise
+            
         except asyncio.TimeoutError:
-            logger.warning(f"{self.marketplace_name}: Request timeout after {self.timeout}s")
-            return None
+            self.circuit_breaker.record_failure(timeout=True)
+            logger.warning(f"{self.marketplace_name}: Request timeout after {timeout:.1f}s")
+            return None, True, None
             
         except aiohttp.ClientError as e:
+            self.circuit_breaker.record_failure()
             logger.error(f"{self.marketplace_name}: Client error - {e}")
-            return None
+            return None, True, None
             
         except Exception as e:
+            self.circuit_breaker.record_failure()
             logger.error(f"{self.marketplace_name}: Unexpected error - {e}", exc_info=True)
-            return None
+            return None, False, None
     
     def _create_search_result(
         self,
@@ -0,0 +1,243 @@
+"""
+Circuit breaker for marketplace integrations.
+Stops calling a degraded marketplace until it recovers.
+"""
+
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Tuple
+import time
+
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics, metric_name
+from src.config import Config
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Gauge values exported for each state
+STATE_GAUGE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker.
+    
+    Outcomes of the calls made in the last ``window`` seconds are kept.
+    Once at least ``min_calls`` were made, the circuit opens when the
+    failure rate (errors and timeouts) reaches ``error_rate`` or the
+    timeout rate alone reaches ``timeout_rate``. After ``open_duration``
+    seconds it becomes half-open and lets ``half_open_max_calls`` probes
+    through: a successful probe closes it, a failed one opens it again.
+    """
+    
+    # Outcome markers stored in the window
+    SUCCESS = "success"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+    
+    def __init__(
+        self,
+        name: str,
+        window: float = Config.CIRCUIT_WINDOW,
+        min_calls: int = Config.CIRCUIT_MIN_CALLS,
+        error_rate: float = Config.CIRCUIT_ERROR_RATE,
+        timeout_rate: float = Config.CIRCUIT_TIMEOUT_RATE,
+        open_duration: float = Config.CIRCUIT_OPEN_DURATION,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the circuit breaker.
+        
+        Args:
+            name: Name of the protected marketplace
+            window: Rolling window length in seconds
+            min_calls: Calls required in the window before tripping
+            error_rate: Failure rate (0-1) that opens the circuit
+            timeout_rate: Timeout rate (0-1) that opens the circuit
+            open_duration: Seconds to stay open before probing
+            half_open_max_calls: Probe calls allowed while half-open
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        
+        self._state = CircuitState.CLOSED
+        self._outcomes: Deque[Tuple[float, str]] = deque()
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        
+        self._metrics = get_metrics()
+        self._metric_prefix = metric_name("circuit_breaker", name)
+        self._metrics.set_gauge(f"{self._metric_prefix}.state", STATE_GAUGE_VALUES[self._state])
+    
+    @property
+    def state(self) -> CircuitState:
+        """
+        Get the current state (an expired open circuit becomes half-open).
+        
+        Returns:
+            CircuitState: Current state
+        """
+        if (self._state == CircuitState.OPEN and
+                self._clock() - self._opened_at >= self.open_duration):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+    
+    @property
+    def is_open(self) -> bool:
+        """Check if calls are currently being rejected."""
+        return self.state == CircuitState.OPEN
+    
+    def allow_request(self) -> bool:
+        """
+        Check if a call may go through (consumes a half-open probe).
+        
+        Returns:
+            bool: True if the call is allowed
+        """
+        state = self.state
+        
+        if state == CircuitState.CLOSED:
+            return True
+        
+        if state == CircuitState.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        
+        self._metrics.increment(f"{self._metric_prefix}.rejected")
+        return False
+    
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+            return
+        
+        self._record(self.SUCCESS)
+    
+    def record_failure(self, timeout: bool = False) -> None:
+        """
+        Record a failed call.
+        
+        Args:
+            timeout: Whether the call timed out
+        """
+        self._metrics.increment(
+            f"{self._metric_prefix}.{'timeouts' if timeout else 'errors'}"
+        )
+        
+        if self._state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN)
+            return
+        
+        self._record(self.TIMEOUT if timeout else self.ERROR)
+        
+        if self._state == CircuitState.CLOSED and self._should_trip():
+            self._transition(CircuitState.OPEN)
+    
+    def record_cancelled(self) -> None:
+        """Record a call abandoned before completion (frees a half-open probe)."""
+        if self._state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+    
+    def _record(self, outcome: str) -> None:
+        """
+        Add an outcome to the rolling window.
+        
+        Args:
+            outcome: Outcome marker
+        """
+        now = self._clock()
+        self._outcomes.append((now, outcome))
+        self._prune(now)
+    
+    def _prune(self, now: float) -> None:
+        """
+        Drop outcomes older than the window.
+        
+        Args:
+            now: Current time
+        """
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+    
+    def _should_trip(self) -> bool:
+        """
+        Check the window against the trip thresholds.
+        
+        Returns:
+            bool: True if the circuit should open
+        """
+        calls = len(self._outcomes)
+        
+        if calls < self.min_calls:
+            return False
+        
+        timeouts = sum(1 for _, outcome in self._outcomes if outcome == self.TIMEOUT)
+        errors = sum(1 for _, outcome in self._outcomes if outcome == self.ERROR)
+        
+        return (
+            (errors + timeouts) / calls >= self.error_rate or
+            timeouts / calls >= self.timeout_rate
+        )
+    
+    def _transition(self, new_state: CircuitState) -> None:
+        """
+        Move to a new state, logging and exporting the change.
+        
+        Args:
+            new_state: State to move to
+        """
+        old_state = self._state
+        self._state = new_state
+        self._half_open_calls = 0
+        
+        if new_state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+        
+        if new_state == CircuitState.CLOSED:
+            self._outcomes.clear()
+        
+        self._metrics.set_gauge(f"{self._metric_prefix}.state", STATE_GAUGE_VALUES[new_state])
+        self._metrics.increment(f"{self._metric_prefix}.transitions.{new_state.value}")
+        
+        log = logger.warning if new_state == CircuitState.OPEN else logger.info
+        log(f"{self.name}: circuit {old_state.value} -> {new_state.value}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker statistics.
+        
+        Returns:
+            Dict: State and rolling window counts
+        """
+        self._prune(self._clock())
+        outcomes = [outcome for _, outcome in self._outcomes]
+        
+        return {
+            'name': self.name,
+            'state': self.state.value,
+            'calls': len(outcomes),
+            'errors': outcomes.count(self.ERROR),
+            'timeouts': outcomes.count(self.TIMEOUT)
+        }
@@ -0,0 +1,115 @@
+"""
+Shared HTTP client for marketplace integrations.
+Owns a single tuned aiohttp session reused by every marketplace API.
+"""
+
+from typing import Optional
+import aiohttp
+
+from src.utils.logger import get_logger
+from src.config import Config
+
+logger = get_logger(__name__)
+
+
+class HttpClient:
+    """
+    Process-wide HTTP connection pool.
+    
+    All marketplace adapters share one aiohttp.ClientSession so TCP and TLS
+    connections (e.g. to api.mercadolibre.com) are kept alive and reused
+    across searches instead of being re-established per adapter.
+    """
+    
+    def __init__(self):
+        """Initialize the HTTP client (the session is created lazily)."""
+        self.limit = Config.HTTP_POOL_LIMIT
+        self.limit_per_host = Config.HTTP_POOL_LIMIT_PER_HOST
+        self.keepalive_timeout = Config.HTTP_KEEPALIVE_TIMEOUT
+        self.dns_cache_ttl = Config.HTTP_DNS_CACHE_TTL
+        self.timeout = Config.SEARCH_TIMEOUT
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create a session with a tuned connector.
+        
+        Returns:
+            aiohttp.ClientSession: New HTTP session
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            enable_cleanup_closed=True
+        )
+        
+        logger.info(
+            f"HTTP pool created (limit={self.limit}, per_host={self.limit_per_host}, "
+            f"keepalive={self.keepalive_timeout}s, dns_ttl={self.dns_cache_ttl}s)"
+        )
+        
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+    
+    async def start(self) -> None:
+        """Create the shared session (call at application startup)."""
+        await self.get_session()
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, creating it if needed.
+        
+        Returns:
+            aiohttp.ClientSession: Shared HTTP session
+        """
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+    
+    @property
+    def is_open(self) -> bool:
+        """Check if the shared session is open."""
+        return self._session is not None and not self._session.closed
+    
+    async def close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        if self.is_open:
+            await self._session.close()
+            logger.info("HTTP pool closed")
+        self._session = None
+
+
+# Global HTTP client instance
+_http_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the global HTTP client instance.
+    
+    Returns:
+        HttpClient: Global HTTP client
+    """
+    global _http_client
+    
+    if _http_client is None:
+        _http_client = HttpClient()
+    
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the global HTTP client.
+    Call this at application shutdown.
+    """
+    global _http_client
+    
+    if _http_client:
+        await _http_client.close()
+        _http_client = None
@@ -3,11 +3,15 @@ Mercado Livre API integration.
 Implements product search using Mercado Livre's public API.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, List, TypedDict
 from datetime import datetime
+import asyncio
 import urllib.parse
 
 from src.integrations.base_api import BaseMarketplaceAPI
+from src.integrations.rate_limiter import TokenBucket
+from src.integrations.response_cache import ResponseCache
+from src.integrations.retry import RetryPolicy
 from src.models.product import Product, SearchResult
 from src.utils.logger import get_logger
 from src.config import Config
@@ -15,6 +19,50 @@ from src.config import Config
 logger = get_logger(__name__)
 
 
+# Response fields read by _parse_product; everything else (attributes,
+# seller, installments...) is skipped by typed decoding
+class MLShipping(TypedDict, total=False):
+    """Shipping fields of a search item."""
+    
+    free_shipping: bool
+
+
+class MLItem(TypedDict, total=False):
+    """Fields of a Mercado Livre item used to build a Product."""
+    
+    id: str
+    title: Optional[str]
+    price: Optional[float]
+    original_price: Optional[float]
+    permalink: Optional[str]
+    thumbnail: Optional[str]
+    currency_id: Optional[str]
+    shipping: MLShipping
+
+
+class MLPaging(TypedDict, total=False):
+    """Paging fields of a search response."""
+    
+    total: int
+
+
+class MLSearchResponse(TypedDict, total=False):
+    """Mercado Livre search response."""
+    
+    paging: MLPaging
+    results: List[MLItem]
+
+
+class MLMultigetEntry(TypedDict, total=False):
+    """One entry of a multiget (/items?ids=) response."""
+    
+    code: int
+    body: MLItem
+
+
+MLMultigetResponse = List[MLMultigetEntry]
+
+
 class MercadoLivreAPI(BaseMarketplaceAPI):
     """
     Mercado Livre API integration.
@@ -26,10 +74,50 @@ class MercadoLivreAPI(BaseMarketplaceAPI):
     # API endpoints
     BASE_URL = "https://api.mercadolibre.com"
     SEARCH_ENDPOINT = "/sites/MLB/search"
+    ITEMS_ENDPOINT = "/items"
+    
+    # Largest page the search endpoint returns
+    SEARCH_PAGE_SIZE = 50
+    
+    # Multiget limits: IDs per call, and fields requested per item
+    MULTIGET_MAX_IDS = 20
+    MULTIGET_ATTRIBUTES = "id,title,price,original_price,permalink,thumbnail,currency_id"
+    
+    # Endpoints revalidated with ETag / Last-Modified, and how long (seconds)
+    # their responses are kept; searches change too often to be worth it
+    RESPONSE_CACHE_POLICIES = [
+        (r"^/items/[^/]+$", 600),
+        (r"^/items/[^/]+/description$", 3600),
+        (r"^/categories/", 86400),
+    ]
     
-    def __init__(self):
-        """Initialize Mercado Livre API."""
-        super().__init__("Mercado Livre")
+    def __init__(
+        self,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        response_cache: Optional[ResponseCache] = None
+    ):
+        """
+        Initialize Mercado Livre API.
+        
+        Args:
+            retry_policy: Retry policy override (default: global retry settings)
+            rate_limiter: Rate limiter override (default: Mercado Livre rate settings)
+            response_cache: Response cache override (default: RESPONSE_CACHE_POLICIES)
+        """
+        if response_cache is None and Config.HTTP_CACHE_MAX_SIZE > 0:
+            response_cache = ResponseCache("Mercado Livre", self.RESPONSE_CACHE_POLICIES)
+        
+        super().__init__(
+            "Mercado Livre",
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter or TokenBucket(
+                "Mercado Livre",
+                rate=Config.MERCADOLIVRE_RATE_LIMIT,
+                capacity=Config.MERCADOLIVRE_RATE_BURST
+            ),
+            response_cache=response_cache
+        )
         
         # Get credentials from config (for future affiliate features)
         self.app_id = Config.MERCADOLIVRE_APP_ID
@@ -57,21 +145,11 @@ class MercadoLivreAPI(BaseMarketplaceAPI):
         url = f"{self.BASE_URL}{self.SEARCH_ENDPOINT}"
         
         # Build parameters
-        params = {
-            "q": normalized_query,
-            "limit": self.max_results,
-            "offset": 0,
-            # Sort by relevance (can also use 'price_asc', 'price_desc')
-            "sort": "relevance",
-            # Only new items
-            "condition": "new",
-            # Only items with free shipping (optional, can remove)
-            # "shipping": "free",
-        }
+        params = self._search_params(normalized_query, offset=0, limit=self.max_results)
         
         try:
             # Make API request
-            data = await self._make_request(url, params=params)
+            data = await self._make_request(url, params=params, schema=MLSearchResponse)
             
             if not data:
                 logger.warning("Mercado Livre: No data returned from API")
@@ -99,6 +177,130 @@ class MercadoLivreAPI(BaseMarketplaceAPI):
             logger.error(f"Mercado Livre: Search failed - {e}", exc_info=True)
             return self._create_search_result(query, [], 0.0)
     
+    def _search_params(self, normalized_query: str, offset: int, limit: int) -> Dict[str, Any]:
+        """
+        Build the query parameters for one search page.
+        
+        Args:
+            normalized_query: Normalized search query
+            offset: Index of the first result
+            limit: Page size
+            
+        Returns:
+            Dict: Query parameters
+        """
+        return {
+            "q": normalized_query,
+            "limit": limit,
+            "offset": offset,
+            # Sort by relevance (can also use 'price_asc', 'price_desc')
+            "sort": "relevance",
+            # Only new items
+            "condition": "new",
+            # Only items with free shipping (optional, can remove)
+            # "shipping": "free",
+        }
+    
+    async def deep_search(
+        self,
+        query: str,
+        max_items: Optional[int] = None,
+        predicate: Optional[Callable[[Product], bool]] = None,
+        target: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> SearchResult:
+        """
+        Search the top listings for a query across many result pages.
+        
+        Pages of SEARCH_PAGE_SIZE results are fetched concurrently (at most
+        max_concurrency in flight) and each page is parsed as soon as it
+        arrives. Fetching stops when max_items listings were requested, the
+        results run out, or target products satisfying the predicate were
+        found; pages still in flight are then cancelled.
+        
+        Args:
+            query: Search query string
+            max_items: Listings to scan (default: MERCADOLIVRE_DEEP_SEARCH_MAX_ITEMS)
+            predicate: Keep only products for which this returns True
+            target: Stop once this many products were kept (default: no early stop)
+            max_concurrency: Parallel page requests (default: MERCADOLIVRE_DEEP_SEARCH_CONCURRENCY)
+            
+        Returns:
+            SearchResult: Kept products, in relevance order
+        """
+        start_time = datetime.now()
+        normalized_query = self._normalize_query(query)
+        url = f"{self.BASE_URL}{self.SEARCH_ENDPOINT}"
+        
+        max_items = max_items or Config.MERCADOLIVRE_DEEP_SEARCH_MAX_ITEMS
+        concurrency = max_concurrency or Config.MERCADOLIVRE_DEEP_SEARCH_CONCURRENCY
+        
+        pages: Dict[int, List[Product]] = {}
+        state = {"next_offset": 0, "end": max_items, "kept": 0}
+        done = asyncio.Event()
+        
+        async def worker() -> None:
+            while not done.is_set() and state["next_offset"] < state["end"]:
+                offset = state["next_offset"]
+                state["next_offset"] += self.SEARCH_PAGE_SIZE
+                limit = min(self.SEARCH_PAGE_SIZE, state["end"] - offset)
+                
+                data = await self._make_request(
+                    url,
+                    params=self._search_params(normalized_query, offset, limit),
+                    schema=MLSearchResponse
+                )
+                
+                if not data:
+                    continue
+                
+                # Never request offsets past the last result
+                total = data.get("paging", {}).get("total")
+                if total is not None:
+                    state["end"] = min(state["end"], total)
+                
+                items = data.get("results", [])
+                if len(items) < limit:
+                    state["end"] = min(state["end"], offset + len(items))
+                
+                kept = []
+                for item in items:
+                    product = self._parse_product(item)
+                    if product and (predicate is None or predicate(product)):
+                        kept.append(product)
+                
+                pages[offset] = kept
+                state["kept"] += len(kept)
+                
+                if target is not None and state["kept"] >= target:
+                    done.set()
+        
+        workers = asyncio.gather(
+            *[worker() for _ in range(concurrency)],
+            return_exceptions=True
+        )
+        stop = asyncio.ensure_future(done.wait())
+        
+        try:
+            # Finish when every page is in, or as soon as the target is reached
+            await asyncio.wait([workers, stop], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop.cancel()
+            workers.cancel()
+            await asyncio.gather(workers, stop, return_exceptions=True)
+        
+        products = [product for offset in sorted(pages) for product in pages[offset]]
+        if target is not None:
+            products = products[:target]
+        
+        search_time = (datetime.now() - start_time).total_seconds()
+        logger.info(
+            f"Mercado Livre: Deep search kept {len(products)} products from "
+            f"{len(pages)} page(s) in {search_time:.2f}s"
+        )
+        
+        return self._create_search_result(query, products, search_time)
+    
     def _parse_product(self, item: Dict[str, Any]) -> Optional[Product]:
         """
         Parse a product from Mercado Livre API response.
@@ -197,3 +399,86 @@ class MercadoLivreAPI(BaseMarketplaceAPI):
         except Exception as e:
             logger.error(f"Mercado Livre: Failed to get product details - {e}")
             return None
+    
+    async def get_products(
+        self,
+        product_ids: Iterable[str],
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, Product]:
+        """
+        Fetch current data for many products using the multiget endpoint.
+        
+        IDs are sent in batches of MULTIGET_MAX_IDS per call
+        (/items?ids=ID1,ID2,...) with at most max_concurrency calls in
+        flight, so refreshing N products costs about N / 20 round trips.
+        
+        Args:
+            product_ids: Mercado Livre product IDs (duplicates are ignored)
+            max_concurrency: Parallel calls (default: MERCADOLIVRE_MULTIGET_CONCURRENCY)
+            
+        Returns:
+            Dict[str, Product]: Products by ID (IDs that failed or were not
+            found are missing)
+        """
+        ids = list(dict.fromkeys(str(product_id) for product_id in product_ids))
+        batches = [
+            ids[i:i + self.MULTIGET_MAX_IDS]
+            for i in range(0, len(ids), self.MULTIGET_MAX_IDS)
+        ]
+        
+        if not batches:
+            return {}
+        
+        semaphore = asyncio.Semaphore(max_concurrency or Config.MERCADOLIVRE_MULTIGET_CONCURRENCY)
+        
+        async def fetch(batch: List[str]) -> List[Product]:
+            async with semaphore:
+                return await self._get_products_batch(batch)
+        
+        results = await asyncio.gather(*[fetch(batch) for batch in batches])
+        products = {product.id: product for batch in results for product in batch}
+        
+        logger.info(
+            f"Mercado Livre: Refreshed {len(products)}/{len(ids)} products "
+            f"in {len(batches)} call(s)"
+        )
+        
+        return products
+    
+    async def _get_products_batch(self, product_ids: List[str]) -> List[Product]:
+        """
+        Fetch one multiget batch.
+        
+        Args:
+            product_ids: Up to MULTIGET_MAX_IDS product IDs
+            
+        Returns:
+            List[Product]: Parsed products found in the batch
+        """
+        url = f"{self.BASE_URL}{self.ITEMS_ENDPOINT}"
+        params = {
+            "ids": ",".join(product_ids),
+            "attributes": self.MULTIGET_ATTRIBUTES,
+        }
+        
+        try:
+            data = await self._make_request(url, params=params, schema=MLMultigetResponse)
+        except Exception as e:
+            logger.error(f"Mercado Livre: Multiget failed - {e}")
+            return []
+        
+        if not data:
+            return []
+        
+        products = []
+        
+        for entry in data:
+            # Each entry carries its own status (e.g. 404 for a removed item)
+            if entry.get("code") != 200:
+                continue
+            
+            product = self._parse_product(entry.get("body") or {})
+            if product:
+                products.append(product)
+        
+        return products
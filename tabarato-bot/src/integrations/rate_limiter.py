@@ -0,0 +1,189 @@
+"""
+Outbound rate limiting for marketplace integrations.
+Token buckets that keep our request rate under each partner's quota.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+import asyncio
+import time
+
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics, metric_name
+
+logger = get_logger(__name__)
+
+# Whether callers in the current context give up instead of waiting for a token
+_fail_fast: ContextVar[bool] = ContextVar("rate_limit_fail_fast", default=False)
+
+
+@contextmanager
+def rate_limit_fail_fast() -> Iterator[None]:
+    """
+    Make requests inside the block fail immediately when out of tokens.
+    
+    Usage:
+        with rate_limit_fail_fast():
+            result = await marketplace.search(query)
+    """
+    token = _fail_fast.set(True)
+    try:
+        yield
+    finally:
+        _fail_fast.reset(token)
+
+
+def is_fail_fast() -> bool:
+    """
+    Check if the current context fails fast on rate limits.
+    
+    Returns:
+        bool: True inside rate_limit_fail_fast()
+    """
+    return _fail_fast.get()
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+    
+    The bucket refills at ``rate`` tokens per second up to ``capacity``
+    (the allowed burst). Each request takes one token. When the bucket is
+    empty a caller reserves the next token and sleeps until it is due, so
+    waiters are served in arrival order; if the wait would exceed the
+    caller's limit the request is rejected instead. A rate of 0 disables
+    limiting.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the bucket (starts full).
+        
+        Args:
+            name: Name of the limited marketplace
+            rate: Tokens added per second (0 disables limiting)
+            capacity: Maximum burst size (default: one second of tokens, at least 1)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        
+        # Counters
+        self.acquired = 0
+        self.rejected = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Check if the bucket limits anything."""
+        return self.rate > 0
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while waiters hold reservations)."""
+        self._refill()
+        return self._tokens
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+    
+    def try_acquire(self) -> bool:
+        """
+        Take a token without waiting.
+        
+        Returns:
+            bool: True if a token was available
+        """
+        if not self.enabled:
+            return True
+        
+        self._refill()
+        
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self._record_acquired(0.0)
+            return True
+        
+        self._record_rejected()
+        return False
+    
+    async def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Take a token, waiting for one if needed.
+        
+        Args:
+            max_wait: Longest wait accepted in seconds (None waits as
+                long as needed, 0 fails fast)
+                
+        Returns:
+            bool: True if a token was acquired, False if rejected
+        """
+        if not self.enabled:
+            return True
+        
+        self._refill()
+        wait = max(0.0, (1 - self._tokens) / self.rate)
+        
+        if max_wait is not None and wait > max_wait:
+            self._record_rejected()
+            return False
+        
+        # Reserve the token now so later callers queue behind this one
+        self._tokens -= 1
+        
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
+        
+        self._record_acquired(wait)
+        return True
+    
+    def _record_acquired(self, wait: float) -> None:
+        """
+        Record a granted token.
+        
+        Args:
+            wait: Seconds spent waiting for it
+        """
+        self.acquired += 1
+        get_metrics().observe(metric_name("rate_limiter", self.name, "wait_seconds"), wait)
+    
+    def _record_rejected(self) -> None:
+        """Record a rejected request."""
+        self.rejected += 1
+        get_metrics().increment(metric_name("rate_limiter", self.name, "rejected"))
+        logger.warning(f"Rate limit reached for {self.name}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+        
+        Returns:
+            Dict: Rate, capacity, available tokens and counters
+        """
+        return {
+            'rate': self.rate,
+            'capacity': self.capacity,
+            'tokens': self.tokens,
+            'acquired': self.acquired,
+            'rejected': self.rejected
+        }
@@ -0,0 +1,205 @@
+"""
+Conditional-request cache for marketplace GETs.
+Keeps decoded responses with their ETag / Last-Modified validators.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+import re
+
+from src.utils.cache import TTLCache
+from src.utils.logger import get_logger
+from src.utils.metrics import get_metrics, metric_name
+from src.config import Config
+
+logger = get_logger(__name__)
+
+
+class CachedResponse:
+    """Decoded response body and the validators to revalidate it."""
+    
+    __slots__ = ("data", "etag", "last_modified")
+    
+    def __init__(self, data: Any, etag: Optional[str], last_modified: Optional[str]):
+        """
+        Initialize a cached response.
+        
+        Args:
+            data: Decoded response body
+            etag: ETag header value
+            last_modified: Last-Modified header value
+        """
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Get the headers that revalidate this response.
+        
+        Returns:
+            Dict: If-None-Match and/or If-Modified-Since headers
+        """
+        headers = {}
+        
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        
+        return headers
+
+
+class ResponseCache:
+    """
+    Size-bounded cache of GET responses revalidated with conditional requests.
+    
+    Only URLs whose path matches one of the endpoint policies are cached,
+    each policy giving how long a response is kept for revalidation. A kept
+    response is always revalidated: the request carries If-None-Match /
+    If-Modified-Since and a 304 answer is served from the stored decoded
+    body, so unchanged payloads are neither downloaded nor decoded again.
+    Cached bodies are shared between callers and must not be mutated.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        policies: Iterable[Tuple[str, float]],
+        max_size: int = Config.HTTP_CACHE_MAX_SIZE
+    ):
+        """
+        Initialize the response cache.
+        
+        Args:
+            name: Name of the marketplace (used in metrics)
+            policies: (path regex, TTL in seconds) pairs; the first match wins
+            max_size: Maximum number of responses kept
+        """
+        self.name = name
+        self.policies: List[Tuple[Pattern[str], float]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in policies
+        ]
+        self._entries = TTLCache(max_size=max_size)
+        
+        # Counters
+        self.revalidated = 0
+        self.stored = 0
+    
+    def ttl_for(self, url: str) -> Optional[float]:
+        """
+        Get the retention TTL for a URL.
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            Optional[float]: TTL in seconds, or None if the URL is not cached
+        """
+        path = urlsplit(url).path
+        
+        for pattern, ttl in self.policies:
+            if pattern.search(path):
+                return ttl if ttl > 0 else None
+        
+        return None
+    
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        schema: Optional[Any] = None
+    ) -> Hashable:
+        """
+        Build the cache key of a request.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            schema: Decoding schema (the same URL may be decoded differently)
+            
+        Returns:
+            Hashable: Cache key
+        """
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (url, items, schema)
+    
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """
+        Get a stored response to revalidate.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[CachedResponse]: Stored response, or None
+        """
+        return self._entries.get(key)
+    
+    def store(
+        self,
+        key: Hashable,
+        url: str,
+        data: Any,
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> None:
+        """
+        Store a response if it is cacheable.
+        
+        Args:
+            key: Cache key
+            url: Request URL (selects the TTL policy)
+            data: Decoded response body
+            etag: ETag header value
+            last_modified: Last-Modified header value
+        """
+        ttl = self.ttl_for(url)
+        
+        # Without validators there is nothing to revalidate with
+        if ttl is None or not (etag or last_modified):
+            return
+        
+        self._entries.set(key, CachedResponse(data, etag, last_modified), ttl=ttl)
+        self.stored += 1
+    
+    def revalidate(self, key: Hashable, url: str, cached: CachedResponse) -> Any:
+        """
+        Record a 304 answer and extend the entry's retention.
+        
+        Args:
+            key: Cache key
+            url: Request URL
+            cached: Response confirmed as unchanged
+            
+        Returns:
+            Any: Cached decoded body
+        """
+        ttl = self.ttl_for(url)
+        if ttl is not None:
+            self._entries.set(key, cached, ttl=ttl)
+        
+        self.revalidated += 1
+        get_metrics().increment(metric_name("http_cache", self.name, "revalidated"))
+        logger.debug(f"{self.name}: 304 Not Modified, serving cached body for {url}")
+        
+        return cached.data
+    
+    def __len__(self) -> int:
+        """Number of stored responses."""
+        return len(self._entries)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict: Size, capacity and counters
+        """
+        return {
+            'size': len(self._entries),
+            'max_size': self._entries.max_size,
+            'stored': self.stored,
+            'revalidated': self.revalidated,
+            'evictions': self._entries.evictions
+        }
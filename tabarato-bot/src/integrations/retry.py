@@ -0,0 +1,143 @@
+"""
+Retry policy for marketplace HTTP calls.
+Jittered exponential backoff that honors Retry-After headers.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Iterable, Optional
+import random
+
+from src.config import Config
+
+
+class RetryPolicy:
+    """
+    Retry policy for idempotent HTTP requests.
+    
+    Delays follow "full jitter" exponential backoff: before attempt n+1
+    the client sleeps a random time in [0, min(max_delay, base_delay * 2^(n-1))].
+    A Retry-After header from the server replaces the computed delay when
+    ``respect_retry_after`` is enabled (capped at ``max_retry_after``).
+    """
+    
+    # Status codes worth retrying (rate limiting and transient server errors)
+    DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    
+    # Methods that are safe to repeat
+    IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    
+    def __init__(
+        self,
+        max_attempts: int = Config.RETRY_MAX_ATTEMPTS,
+        base_delay: float = Config.RETRY_BASE_DELAY,
+        max_delay: float = Config.RETRY_MAX_DELAY,
+        retry_statuses: Optional[Iterable[int]] = None,
+        respect_retry_after: bool = True,
+        max_retry_after: float = Config.RETRY_MAX_DELAY
+    ):
+        """
+        Initialize the retry policy.
+        
+        Args:
+            max_attempts: Total attempts including the first one
+            base_delay: Backoff base in seconds
+            max_delay: Maximum backoff in seconds
+            retry_statuses: Status codes to retry (default: 429 and 5xx gateway errors)
+            respect_retry_after: Whether to honor Retry-After headers
+            max_retry_after: Longest Retry-After wait accepted, in seconds
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(
+            retry_statuses if retry_statuses is not None else self.DEFAULT_RETRY_STATUSES
+        )
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+    
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """
+        Check if another attempt is allowed.
+        
+        Args:
+            method: HTTP method
+            attempt: Number of attempts already made
+            
+        Returns:
+            bool: True if the request may be retried
+        """
+        return method.upper() in self.IDEMPOTENT_METHODS and attempt < self.max_attempts
+    
+    def is_retryable_status(self, status: int) -> bool:
+        """
+        Check if a response status is worth retrying.
+        
+        Args:
+            status: HTTP status code
+            
+        Returns:
+            bool: True if retryable
+        """
+        return status in self.retry_statuses
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the jittered backoff after a failed attempt.
+        
+        Args:
+            attempt: Number of attempts already made (1-based)
+            
+        Returns:
+            float: Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+    
+    def next_delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Compute the delay before the next attempt.
+        
+        Args:
+            attempt: Number of attempts already made (1-based)
+            retry_after: Retry-After header value, if any
+            
+        Returns:
+            Optional[float]: Delay in seconds, or None if the server asked
+            to wait longer than max_retry_after
+        """
+        if self.respect_retry_after and retry_after:
+            server_delay = self.parse_retry_after(retry_after)
+            
+            if server_delay is not None:
+                if server_delay > self.max_retry_after:
+                    return None
+                return server_delay
+        
+        return self.backoff(attempt)
+    
+    @staticmethod
+    def parse_retry_after(value: str) -> Optional[float]:
+        """
+        Parse a Retry-After header (delta-seconds or HTTP date).
+        
+        Args:
+            value: Header value
+            
+        Returns:
+            Optional[float]: Seconds to wait, or None if unparseable
+        """
+        value = value.strip()
+        
+        if value.isdigit():
+            return float(value)
+        
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -3,20 +3,56 @@ Main entry point for EconomiZap Bot.
 """
 
 import asyncio
-from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from telegram.ext import Application, CommandHandler, InlineQueryHandler, MessageHandler, filters
 
 from src.config import Config
 from src.bot.commands import start_command, help_command, about_command, error_handler
 from src.bot.stats import stats_command
 from src.bot.admin import post_deal_command, stats_admin_command
 from src.bot.handlers import handle_message
+from src.bot.inline import handle_inline_query
 from src.database.connection import init_database, close_database
+from src.integrations.http_client import get_http_client, close_http_client
 from src.services.channel_service import get_channel_service
+from src.services.inline_service import get_inline_search_service
+from src.services.search_service import get_search_service
+from src.utils.executor import get_loop_lag_monitor, close_cpu_executor
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+async def on_startup(application: Application) -> None:
+    """
+    Start shared resources once the application is initialized.
+    
+    Args:
+        application: Telegram application
+    """
+    await get_http_client().start()
+    logger.info("HTTP client started")
+    
+    get_loop_lag_monitor().start()
+    logger.info("Event loop lag monitor started")
+    
+    await get_inline_search_service().refresh()
+
+
+async def on_shutdown(application: Application) -> None:
+    """
+    Release shared resources when the application stops.
+    
+    Args:
+        application: Telegram application
+    """
+    await get_search_service().close()
+    await close_http_client()
+    logger.info("HTTP client closed")
+    
+    await get_loop_lag_monitor().stop()
+    close_cpu_executor()
+
+
 async def main() -> None:
     """
     Main function to run the bot.
@@ -38,7 +74,13 @@ async def main() -> None:
         
         # Create the Application
         logger.info("Creating Telegram bot application...")
-        application = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
+        application = (
+            Application.builder()
+            .token(Config.TELEGRAM_BOT_TOKEN)
+            .post_init(on_startup)
+            .post_shutdown(on_shutdown)
+            .build()
+        )
         
         # Initialize channel service with bot instance
         get_channel_service(application.bot)
@@ -59,6 +101,9 @@ async def main() -> None:
             MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message)
         )
         
+        # Register inline query handler (@bot produto in any chat)
+        application.add_handler(InlineQueryHandler(handle_inline_query))
+        
         # Register error handler
         application.add_error_handler(error_handler)
         
@@ -68,7 +113,7 @@ async def main() -> None:
         logger.info("Starting bot...")
         logger.info("Bot is now running. Press Ctrl+C to stop.")
         
-        await application.run_polling(allowed_updates=["message"])
+        await application.run_polling(allowed_updates=["message", "inline_query"])
         
     except KeyboardInterrupt:
         logger.info("Received shutdown signal (Ctrl+C)")
@@ -104,6 +104,21 @@ class Coupon(BaseModel):
         if not self.can_apply_to_price(price):
             return 0.0
         
+        return self.discount_for(price)
+    
+    def discount_for(self, price: float) -> float:
+        """
+        Calculate the discount for a price the coupon is known to apply to.
+        
+        Skips the validity and minimum purchase checks of
+        ``calculate_discount`` (the coupon index already applied them).
+        
+        Args:
+            price: Original price
+            
+        Returns:
+            float: Discount amount
+        """
         if self.discount_type == 'percentage':
             discount = price * (self.discount_value / 100)
         else:  # fixed
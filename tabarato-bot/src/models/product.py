@@ -3,11 +3,15 @@ Product data model for EconomiZap Bot.
 Represents a product from any marketplace.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 
+# Lowest price a product can have (prices must be greater than 0)
+MIN_PRICE = 0.01
+
+
 class Product(BaseModel):
     """
     Product model representing an item from any marketplace.
@@ -38,6 +42,51 @@ class Product(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now, description="Fetch timestamp")
     
     
+    @classmethod
+    def from_trusted(cls, **data) -> "Product":
+        """
+        Build a product from data that was already validated.
+        
+        Skips validation (e.g. for products read back from our own storage).
+        Never use it for raw marketplace data.
+        
+        Args:
+            data: Product fields
+            
+        Returns:
+            Product: Product built without validation
+        """
+        return cls.model_construct(**data)
+    
+    def with_coupon(
+        self,
+        final_price: float,
+        coupon_code: str,
+        discount_percentage: float
+    ) -> "Product":
+        """
+        Get a copy of this product with a coupon applied.
+        
+        A shallow copy: the product was validated when parsed, so only the
+        price fields change and nothing is validated again. The copy keeps
+        the field constraints: a coupon worth more than the price leaves
+        ``MIN_PRICE`` and the discount is capped at 100%.
+        
+        Args:
+            final_price: Price after the coupon
+            coupon_code: Applied coupon code
+            discount_percentage: Coupon discount percentage
+            
+        Returns:
+            Product: Product with coupon applied
+        """
+        return self.model_copy(update={
+            'price': max(final_price, MIN_PRICE),
+            'original_price': self.price,
+            'coupon_code': coupon_code,
+            'discount_percentage': min(max(discount_percentage, 0.0), 100.0)
+        })
+    
     @property
     def final_price(self) -> float:
         """
@@ -147,6 +196,8 @@ class SearchResult(BaseModel):
         products: List of products found
         total_results: Total number of results
         timestamp: When the search was performed
+        missing_marketplaces: Marketplaces that missed the search deadline
+        stale: Whether the result was served from stored results
     """
     
     query: str = Field(..., min_length=1, description="Search query")
@@ -154,12 +205,27 @@ class SearchResult(BaseModel):
     total_results: int = Field(default=0, ge=0, description="Total results")
     search_time: float = Field(default=0.0, ge=0, description="Search time in seconds")
     timestamp: datetime = Field(default_factory=datetime.now, description="Search timestamp")
+    missing_marketplaces: list[str] = Field(
+        default_factory=list,
+        description="Marketplaces that missed the search deadline"
+    )
+    stale: bool = Field(default=False, description="Served from stored results")
     
     @property
     def has_results(self) -> bool:
         """Check if search has results."""
         return len(self.products) > 0
     
+    @property
+    def is_partial(self) -> bool:
+        """Check if some marketplaces missed the search deadline."""
+        return len(self.missing_marketplaces) > 0
+    
+    @property
+    def age(self) -> timedelta:
+        """Time elapsed since the prices were fetched."""
+        return datetime.now() - self.timestamp
+    
     @property
     def best_price(self) -> Optional[Product]:
         """
@@ -0,0 +1,119 @@
+"""
+Vectorized coupon pricing for EconomiZap Bot.
+Applies the best coupon to a whole batch of products with NumPy.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; PriceService falls back to the scalar path
+    np = None
+
+from src.models.coupon import Coupon
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def is_available() -> bool:
+    """Check if NumPy is installed (required for batch pricing)."""
+    return np is not None
+
+
+class BatchCouponPricer:
+    """
+    Columnar equivalent of ``CouponService.apply_best_coupon``.
+    
+    Coupons valid at construction time are grouped by marketplace and
+    stored as arrays (type, value, minimum purchase, maximum discount).
+    ``price`` evaluates every coupon of a marketplace against all of its
+    products at once and keeps the largest discount per product, with the
+    same float operations and tie-breaking (first coupon wins) as the
+    scalar path. Coupon categories are not considered, like
+    ``compare_prices``.
+    """
+    
+    def __init__(self, coupons: Sequence[Coupon], now: Optional[datetime] = None):
+        """
+        Initialize the pricer.
+        
+        Args:
+            coupons: Candidate coupons (invalid ones are skipped)
+            now: Validity reference time (default: now)
+        """
+        if np is None:
+            raise RuntimeError("numpy is required for batch pricing")
+        
+        now = now or datetime.now()
+        groups: Dict[str, List[Coupon]] = {}
+        
+        for coupon in coupons:
+            if coupon.is_valid(now):
+                groups.setdefault(coupon.marketplace.lower(), []).append(coupon)
+        
+        self._groups: Dict[str, tuple] = {}
+        
+        for marketplace, group in groups.items():
+            self._groups[marketplace] = (
+                group,
+                np.array([c.discount_type == 'percentage' for c in group]),
+                np.array([c.discount_value for c in group], dtype=np.float64),
+                # Falsy limits are ignored by the scalar path too
+                np.array([c.minimum_purchase or 0.0 for c in group], dtype=np.float64),
+                np.array([c.maximum_discount or np.inf for c in group], dtype=np.float64),
+            )
+    
+    def price(
+        self,
+        marketplaces: Sequence[str],
+        prices: Sequence[float]
+    ) -> Tuple[List[Optional[Coupon]], "np.ndarray", "np.ndarray"]:
+        """
+        Find the best coupon for each product.
+        
+        Args:
+            marketplaces: Marketplace name of each product
+            prices: Price of each product
+            
+        Returns:
+            Tuple: Best coupon per product (None if no coupon applies),
+            discount amounts and final prices
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        discounts = np.zeros(len(prices))
+        best: List[Optional[Coupon]] = [None] * len(prices)
+        
+        # Marketplace code per product (-1 for marketplaces without coupons)
+        codes = {marketplace: code for code, marketplace in enumerate(self._groups)}
+        product_codes = np.fromiter(
+            (codes.get(m.lower(), -1) for m in marketplaces),
+            dtype=np.int64,
+            count=len(prices)
+        )
+        
+        for code, (coupons, is_percentage, values, minimums, maximums) in enumerate(self._groups.values()):
+            rows = np.flatnonzero(product_codes == code)
+            if rows.size == 0:
+                continue
+            
+            # One row per product, one column per coupon
+            price = prices[rows, None]
+            discount = np.where(is_percentage, price * (values / 100), values)
+            discount = np.minimum(discount, maximums)
+            discount = np.minimum(discount, price)
+            
+            applicable = price >= minimums
+            discount = np.where(applicable, discount, -np.inf)
+            
+            choice = discount.argmax(axis=1)
+            chosen = discount[np.arange(rows.size), choice]
+            has_coupon = applicable.any(axis=1)
+            
+            discounts[rows[has_coupon]] = chosen[has_coupon]
+            for row, index in zip(rows[has_coupon].tolist(), choice[has_coupon].tolist()):
+                best[row] = coupons[index]
+        
+        final_prices = np.maximum(0.0, prices - discounts)
+        return best, discounts, final_prices
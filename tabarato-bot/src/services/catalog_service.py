@@ -0,0 +1,364 @@
+"""
+Product catalog service for EconomiZap Bot.
+Groups listings by canonical product instead of fuzzy matching every search.
+"""
+
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import uuid
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.models.product import Product
+from src.database.connection import get_database
+from src.database.repositories import CatalogRepository
+from src.database.repositories.catalog_repository import ListingKey
+from src.utils.normalizer import (
+    ProductNormalizer,
+    group_similar_names,
+    group_similar_names_async,
+    group_similar_products,
+    group_similar_products_async
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """
+    Get the canonical product ID for a fingerprint.
+    
+    Args:
+        fingerprint: Product fingerprint
+        
+    Returns:
+        str: Stable canonical ID (same fingerprint, same ID)
+    """
+    return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:16]
+
+
+class CatalogService:
+    """
+    Service mapping marketplace listings to canonical products.
+    
+    Each listing, keyed by (marketplace, external_id), is assigned a
+    canonical product ID the first time it is seen and stored in the
+    ``product_catalog`` table. Grouping a result set is then a lookup for
+    known listings; new listings get the ID of their fingerprint
+    (brand, model and specs) and only those without one are fuzzy matched,
+    against one representative per canonical product in the result.
+    """
+    
+    def __init__(self, session_scope: Optional[Callable[[], ContextManager[Session]]] = None):
+        """
+        Initialize catalog service.
+        
+        Args:
+            session_scope: Transactional session factory (default: the
+                global database ``session_scope``)
+        """
+        self._session_scope = session_scope
+        
+        # Counters
+        self.known = 0
+        self.fingerprinted = 0
+        self.fuzzy_matched = 0
+    
+    def group_products(
+        self,
+        products: List[Product],
+        threshold: float = 70.0
+    ) -> List[List[Product]]:
+        """
+        Group products by canonical product.
+        
+        Blocks on the database: async code should use
+        ``group_products_async``. Falls back to fuzzy grouping of every
+        product if the catalog cannot be read or written.
+        
+        Args:
+            products: Products to group
+            threshold: Similarity threshold for new listings (0-100)
+            
+        Returns:
+            List[List[Product]]: Product groups, in order of first appearance
+        """
+        if not products:
+            return []
+        
+        try:
+            with self._get_session_scope()() as session:
+                canonical_ids = self._assign(session, products, threshold)
+        except SQLAlchemyError as e:
+            logger.error(f"Catalog grouping failed, using fuzzy grouping: {e}")
+            return group_similar_products(products, threshold=threshold)
+        
+        return self._group_by_id(products, canonical_ids)
+    
+    async def group_products_async(
+        self,
+        products: List[Product],
+        threshold: float = 70.0
+    ) -> List[List[Product]]:
+        """
+        Group products by canonical product without blocking the event loop.
+        
+        Same result as ``group_products``: the catalog is read and written
+        in worker threads (one short transaction each), and new listings
+        are fuzzy matched in between through the CPU executor (see
+        ``group_similar_names_async``).
+        
+        Args:
+            products: Products to group
+            threshold: Similarity threshold for new listings (0-100)
+            
+        Returns:
+            List[List[Product]]: Product groups, in order of first appearance
+        """
+        if not products:
+            return []
+        
+        try:
+            keys, known, canonical_ids, fingerprints, unmatched = await asyncio.to_thread(
+                self._in_session, self._lookup, products
+            )
+            
+            if unmatched:
+                candidates = self._match_candidates(canonical_ids, unmatched)
+                groups = await group_similar_names_async(
+                    [products[i].name for i in candidates], threshold
+                )
+                self._apply_matches(canonical_ids, candidates, groups)
+            
+            await asyncio.to_thread(
+                self._in_session, self._store, products, keys, known, canonical_ids, fingerprints
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Catalog grouping failed, using fuzzy grouping: {e}")
+            return await group_similar_products_async(products, threshold=threshold)
+        
+        return self._group_by_id(products, canonical_ids)
+    
+    def _get_session_scope(self) -> Callable[[], ContextManager[Session]]:
+        """Get the transactional session factory."""
+        return self._session_scope or get_database().session_scope
+    
+    def _in_session(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call ``func(session, *args)`` in a transaction (blocking).
+        
+        Args:
+            func: Function taking a session first
+            *args: Further arguments
+            
+        Returns:
+            Any: Function result
+        """
+        with self._get_session_scope()() as session:
+            return func(session, *args)
+    
+    @staticmethod
+    def _group_by_id(products: List[Product], canonical_ids: List[str]) -> List[List[Product]]:
+        """
+        Group products sharing a canonical ID.
+        
+        Args:
+            products: Products
+            canonical_ids: Canonical ID per product
+            
+        Returns:
+            List[List[Product]]: Product groups, in order of first appearance
+        """
+        groups: Dict[str, List[Product]] = {}
+        for product, canonical_id in zip(products, canonical_ids):
+            groups.setdefault(canonical_id, []).append(product)
+        
+        logger.info(f"Grouped {len(products)} products into {len(groups)} catalog products")
+        
+        return list(groups.values())
+    
+    def _assign(
+        self,
+        session: Session,
+        products: List[Product],
+        threshold: float
+    ) -> List[str]:
+        """
+        Get the canonical ID of each product, adding new listings to the catalog.
+        
+        Args:
+            session: Database session
+            products: Products to assign
+            threshold: Similarity threshold for new listings (0-100)
+            
+        Returns:
+            List[str]: Canonical ID per product
+        """
+        keys, known, canonical_ids, fingerprints, unmatched = self._lookup(session, products)
+        
+        if unmatched:
+            self._match_unmatched(products, canonical_ids, unmatched, threshold)
+        
+        self._store(session, products, keys, known, canonical_ids, fingerprints)
+        
+        return canonical_ids
+    
+    def _lookup(self, session: Session, products: List[Product]) -> Tuple[
+        List[ListingKey],
+        Dict[ListingKey, str],
+        List[Optional[str]],
+        List[Optional[str]],
+        List[int]
+    ]:
+        """
+        Assign canonical IDs to known and fingerprinted listings.
+        
+        Args:
+            session: Database session
+            products: Products to assign
+            
+        Returns:
+            Tuple: Listing keys, known canonical IDs by key, canonical ID
+            per product (None if unmatched), fingerprint per product and
+            indexes of the unmatched products
+        """
+        keys = [CatalogRepository.listing_key(p) for p in products]
+        known = CatalogRepository.get_canonical_ids(session, keys)
+        
+        canonical_ids: List[Optional[str]] = [known.get(key) for key in keys]
+        fingerprints: List[Optional[str]] = [None] * len(products)
+        unmatched = []
+        
+        for i, product in enumerate(products):
+            if canonical_ids[i] is not None:
+                continue
+            
+            fingerprint = ProductNormalizer.fingerprint(product.name)
+            if fingerprint:
+                fingerprints[i] = fingerprint
+                canonical_ids[i] = fingerprint_id(fingerprint)
+                self.fingerprinted += 1
+            else:
+                unmatched.append(i)
+        
+        self.known += len(known)
+        
+        return keys, known, canonical_ids, fingerprints, unmatched
+    
+    @staticmethod
+    def _store(
+        session: Session,
+        products: List[Product],
+        keys: List[ListingKey],
+        known: Dict[ListingKey, str],
+        canonical_ids: List[str],
+        fingerprints: List[Optional[str]]
+    ) -> None:
+        """
+        Mark known listings as seen and add the new ones.
+        
+        Args:
+            session: Database session
+            products: Products assigned
+            keys: Listing key per product
+            known: Canonical IDs of the listings already in the catalog
+            canonical_ids: Canonical ID per product
+            fingerprints: Fingerprint per product
+        """
+        CatalogRepository.touch(session, known)
+        CatalogRepository.add_listings(session, [
+            (products[i], canonical_ids[i], fingerprints[i])
+            for i in range(len(products))
+            if keys[i] not in known
+        ])
+    
+    def _match_unmatched(
+        self,
+        products: List[Product],
+        canonical_ids: List[Optional[str]],
+        unmatched: List[int],
+        threshold: float
+    ) -> None:
+        """
+        Assign canonical IDs to listings without one by fuzzy matching.
+        
+        Unmatched listings are compared with one representative per
+        canonical product already in the result and with each other;
+        listings matching no representative start a new canonical product.
+        
+        Args:
+            products: Products being grouped
+            canonical_ids: Canonical ID per product (filled in place)
+            unmatched: Indexes of products without a canonical ID
+            threshold: Similarity threshold (0-100)
+        """
+        candidates = self._match_candidates(canonical_ids, unmatched)
+        groups = group_similar_names([products[i].name for i in candidates], threshold)
+        self._apply_matches(canonical_ids, candidates, groups)
+    
+    @staticmethod
+    def _match_candidates(canonical_ids: List[Optional[str]], unmatched: List[int]) -> List[int]:
+        """
+        Get the products to fuzzy match: one representative per canonical
+        product, then the unmatched ones.
+        
+        Args:
+            canonical_ids: Canonical ID per product (None if unmatched)
+            unmatched: Indexes of products without a canonical ID
+            
+        Returns:
+            List[int]: Product indexes, representatives first so a group
+            containing one starts with it
+        """
+        representatives: Dict[str, int] = {}
+        for i, canonical_id in enumerate(canonical_ids):
+            if canonical_id is not None:
+                representatives.setdefault(canonical_id, i)
+        
+        return list(representatives.values()) + unmatched
+    
+    def _apply_matches(
+        self,
+        canonical_ids: List[Optional[str]],
+        candidates: List[int],
+        groups: List[List[int]]
+    ) -> None:
+        """
+        Give unmatched candidates the canonical ID of their group.
+        
+        Args:
+            canonical_ids: Canonical ID per product (filled in place)
+            candidates: Product indexes that were grouped
+            groups: Groups as positions in candidates (the same product
+                object may appear more than once in a result)
+        """
+        for group in groups:
+            indexes = [candidates[position] for position in group]
+            canonical_id = canonical_ids[indexes[0]] or uuid.uuid4().hex[:16]
+            
+            for i in indexes:
+                if canonical_ids[i] is None:
+                    canonical_ids[i] = canonical_id
+                    self.fuzzy_matched += 1
+
+
+# Global catalog service instance
+_catalog_service: Optional[CatalogService] = None
+
+
+def get_catalog_service() -> CatalogService:
+    """
+    Get the global catalog service instance.
+    
+    Returns:
+        CatalogService: Global catalog service
+    """
+    global _catalog_service
+    
+    if _catalog_service is None:
+        _catalog_service = CatalogService()
+    
+    return _catalog_service
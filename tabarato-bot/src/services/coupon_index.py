@@ -0,0 +1,232 @@
+"""
+Indexed in-memory coupon store for EconomiZap Bot.
+Keeps the currently valid coupons per marketplace ready for lookups.
+"""
+
+import heapq
+import itertools
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.models.coupon import Coupon
+
+# Sorts after every sequence number with the same minimum purchase
+_LAST = float("inf")
+
+
+def marketplace_key(marketplace: str) -> str:
+    """
+    Normalize a marketplace name for lookups.
+    
+    Args:
+        marketplace: Marketplace name (e.g. "Mercado Livre")
+        
+    Returns:
+        str: Lookup key (e.g. "mercado livre")
+    """
+    return marketplace.strip().lower()
+
+
+class CouponIndex:
+    """
+    Coupon store indexed by marketplace and minimum purchase.
+    
+    Valid coupons of each marketplace are kept sorted by
+    ``minimum_purchase``, so the coupons a price qualifies for are a
+    prefix found by bisection. Validity windows are precomputed: one
+    min-heap holds activation times (``valid_from``) of pending coupons
+    and another the expiry times (``valid_until``) of valid ones. Each
+    lookup advances the index to the current time by popping the
+    boundaries that were crossed, instead of calling ``is_valid`` on
+    every coupon.
+    
+    Coupons are treated as immutable once added: to change one, remove
+    it and add it again. Time is expected to move forward.
+    """
+    
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        """
+        Initialize an empty index.
+        
+        Args:
+            clock: Time source (injectable for tests)
+        """
+        self._clock = clock
+        self._sequence = itertools.count()
+        
+        # Every stored coupon by sequence number, in insertion order
+        self._coupons: Dict[int, Coupon] = {}
+        
+        # Valid coupons: marketplace key -> sorted (minimum purchase, sequence)
+        self._valid: Dict[str, List[Tuple[float, int]]] = {}
+        self._valid_sequences: set = set()
+        
+        # Validity boundaries: (time, sequence)
+        self._activations: List[Tuple[datetime, int]] = []
+        self._expirations: List[Tuple[datetime, int]] = []
+        
+        # Coupons that can never be valid again, for remove_expired
+        self._dead: List[int] = []
+    
+    def add(self, coupon: Coupon) -> None:
+        """
+        Add a coupon (it becomes valid once its window starts).
+        
+        Args:
+            coupon: Coupon to add
+        """
+        sequence = next(self._sequence)
+        self._coupons[sequence] = coupon
+        
+        if coupon.is_active:
+            heapq.heappush(self._activations, (coupon.valid_from, sequence))
+        else:
+            self._dead.append(sequence)
+    
+    def remove(self, code: str, marketplace: str) -> bool:
+        """
+        Remove the first coupon with a code in a marketplace.
+        
+        Args:
+            code: Coupon code (case-insensitive)
+            marketplace: Marketplace name
+            
+        Returns:
+            bool: True if removed, False if not found
+        """
+        code = code.lower()
+        key = marketplace_key(marketplace)
+        
+        for sequence, coupon in self._coupons.items():
+            if coupon.code.lower() == code and marketplace_key(coupon.marketplace) == key:
+                self._discard(sequence)
+                return True
+        
+        return False
+    
+    def refresh(self, now: Optional[datetime] = None) -> None:
+        """
+        Apply the validity boundaries crossed up to a time.
+        
+        Called by every lookup; only does work when a coupon starts or
+        expires.
+        
+        Args:
+            now: Current time (default: clock)
+        """
+        now = now or self._clock()
+        
+        # Coupon.is_valid: valid_from <= now <= valid_until
+        while self._activations and self._activations[0][0] <= now:
+            _, sequence = heapq.heappop(self._activations)
+            coupon = self._coupons.get(sequence)
+            if coupon is None:
+                continue
+            
+            if coupon.valid_until < now:
+                self._dead.append(sequence)
+                continue
+            
+            insort(
+                self._valid.setdefault(marketplace_key(coupon.marketplace), []),
+                (coupon.minimum_purchase or 0.0, sequence)
+            )
+            self._valid_sequences.add(sequence)
+            heapq.heappush(self._expirations, (coupon.valid_until, sequence))
+        
+        while self._expirations and self._expirations[0][0] < now:
+            _, sequence = heapq.heappop(self._expirations)
+            if sequence in self._valid_sequences:
+                self._unindex(sequence)
+                self._dead.append(sequence)
+    
+    def all(self) -> List[Coupon]:
+        """
+        Get every stored coupon, valid or not.
+        
+        Returns:
+            List[Coupon]: Coupons in insertion order
+        """
+        return list(self._coupons.values())
+    
+    def valid(self, marketplace: Optional[str] = None) -> List[Coupon]:
+        """
+        Get the currently valid coupons.
+        
+        Args:
+            marketplace: Only coupons for this marketplace (default: all)
+            
+        Returns:
+            List[Coupon]: Valid coupons in insertion order
+        """
+        self.refresh()
+        
+        if marketplace is None:
+            sequences = sorted(self._valid_sequences)
+        else:
+            entries = self._valid.get(marketplace_key(marketplace), [])
+            sequences = sorted(sequence for _, sequence in entries)
+        
+        return [self._coupons[sequence] for sequence in sequences]
+    
+    def applicable(self, marketplace: str, price: float) -> List[Coupon]:
+        """
+        Get the valid coupons of a marketplace whose minimum purchase a price meets.
+        
+        Args:
+            marketplace: Marketplace name
+            price: Product price
+            
+        Returns:
+            List[Coupon]: Applicable coupons in insertion order
+        """
+        self.refresh()
+        
+        entries = self._valid.get(marketplace_key(marketplace))
+        if not entries:
+            return []
+        
+        end = bisect_right(entries, (price, _LAST))
+        return [self._coupons[sequence] for sequence in sorted(s for _, s in entries[:end])]
+    
+    def remove_expired(self) -> int:
+        """
+        Drop coupons that expired or were added inactive.
+        
+        Coupons whose window has not started yet are kept.
+        
+        Returns:
+            int: Number of coupons removed
+        """
+        self.refresh()
+        
+        removed = 0
+        for sequence in self._dead:
+            if self._coupons.pop(sequence, None) is not None:
+                removed += 1
+        self._dead.clear()
+        
+        return removed
+    
+    def _unindex(self, sequence: int) -> None:
+        """Remove a coupon from the valid index."""
+        coupon = self._coupons[sequence]
+        entries = self._valid[marketplace_key(coupon.marketplace)]
+        entry = (coupon.minimum_purchase or 0.0, sequence)
+        del entries[bisect_left(entries, entry)]
+        self._valid_sequences.discard(sequence)
+    
+    def _discard(self, sequence: int) -> None:
+        """Forget a coupon (its heap entries are skipped when popped)."""
+        if sequence in self._valid_sequences:
+            self._unindex(sequence)
+        del self._coupons[sequence]
+    
+    def __len__(self) -> int:
+        """Number of stored coupons (valid or not)."""
+        return len(self._coupons)
+    
+    def __iter__(self) -> Iterator[Coupon]:
+        """Iterate over every stored coupon in insertion order."""
+        return iter(self._coupons.values())
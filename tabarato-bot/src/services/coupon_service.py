@@ -6,6 +6,7 @@ from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 
 from src.models.coupon import Coupon
+from src.services.coupon_index import CouponIndex
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,13 +17,19 @@ class CouponService:
     Service for managing and applying coupons.
     """
     
-    def __init__(self):
-        """Initialize coupon service."""
+    def __init__(self, load_defaults: bool = True):
+        """
+        Initialize coupon service.
+        
+        Args:
+            load_defaults: Whether to load the example coupons
+        """
         # In-memory coupon storage (will be replaced with database in Phase 5)
-        self._coupons: List[Coupon] = []
+        self._coupons = CouponIndex()
         
         # Load initial coupons
-        self._load_default_coupons()
+        if load_defaults:
+            self._load_default_coupons()
         
         logger.info(f"Coupon service initialized with {len(self._coupons)} coupons")
     
@@ -44,15 +51,6 @@ class CouponService:
                 maximum_discount=100.0,
                 description="10% off em tecnologia (mín R$ 500)"
             ),
-            Coupon(
-                code="FRETEGRATIS",
-                marketplace="Mercado Livre",
-                discount_type="fixed",
-                discount_value=0.0,  # Free shipping
-                valid_from=now - timedelta(days=30),
-                valid_until=now + timedelta(days=30),
-                description="Frete grátis"
-            ),
             
             # Amazon coupons
             Coupon(
@@ -93,7 +91,8 @@ class CouponService:
             ),
         ]
         
-        self._coupons.extend(default_coupons)
+        for coupon in default_coupons:
+            self._coupons.add(coupon)
     
     def get_all_coupons(self) -> List[Coupon]:
         """
@@ -102,7 +101,7 @@ class CouponService:
         Returns:
             List[Coupon]: All coupons
         """
-        return self._coupons.copy()
+        return self._coupons.all()
     
     def get_active_coupons(self) -> List[Coupon]:
         """
@@ -111,7 +110,7 @@ class CouponService:
         Returns:
             List[Coupon]: Active coupons
         """
-        return [coupon for coupon in self._coupons if coupon.is_valid()]
+        return self._coupons.valid()
     
     def get_coupons_for_marketplace(self, marketplace: str) -> List[Coupon]:
         """
@@ -123,10 +122,7 @@ class CouponService:
         Returns:
             List[Coupon]: Active coupons for marketplace
         """
-        return [
-            coupon for coupon in self._coupons
-            if coupon.marketplace.lower() == marketplace.lower() and coupon.is_valid()
-        ]
+        return self._coupons.valid(marketplace)
     
     def find_best_coupon(
         self,
@@ -145,14 +141,8 @@ class CouponService:
         Returns:
             Optional[Coupon]: Best coupon or None
         """
-        # Get applicable coupons
-        coupons = self.get_coupons_for_marketplace(marketplace)
-        
-        # Filter by price and category
-        applicable = [
-            coupon for coupon in coupons
-            if coupon.can_apply_to_price(price)
-        ]
+        # Valid coupons whose minimum purchase the price meets
+        applicable = self._coupons.applicable(marketplace, price)
         
         if category:
             # Filter by category if specified
@@ -164,16 +154,10 @@ class CouponService:
         if not applicable:
             return None
         
-        # Find coupon with maximum discount
-        best_coupon = max(
-            applicable,
-            key=lambda c: c.calculate_discount(price)
-        )
+        # Find coupon with maximum discount (the first one wins ties)
+        best_coupon = max(applicable, key=lambda c: c.discount_for(price))
         
-        logger.debug(
-            f"Found best coupon for {marketplace}: {best_coupon.code} "
-            f"(saves R$ {best_coupon.calculate_discount(price):.2f})"
-        )
+        logger.debug(f"Found best coupon for {marketplace}: {best_coupon.code}")
         
         return best_coupon
     
@@ -205,8 +189,8 @@ class CouponService:
                 'coupon_applied': False
             }
         
-        discount = best_coupon.calculate_discount(price)
-        final_price = best_coupon.apply_to_price(price)
+        discount = best_coupon.discount_for(price)
+        final_price = max(0.0, price - discount)
         
         return {
             'original_price': price,
@@ -224,7 +208,7 @@ class CouponService:
         Args:
             coupon: Coupon to add
         """
-        self._coupons.append(coupon)
+        self._coupons.add(coupon)
         logger.info(f"Added coupon: {coupon.code} for {coupon.marketplace}")
     
     def remove_coupon(self, code: str, marketplace: str) -> bool:
@@ -238,25 +222,22 @@ class CouponService:
         Returns:
             bool: True if removed, False if not found
         """
-        for i, coupon in enumerate(self._coupons):
-            if (coupon.code.lower() == code.lower() and
-                coupon.marketplace.lower() == marketplace.lower()):
-                del self._coupons[i]
-                logger.info(f"Removed coupon: {code} for {marketplace}")
-                return True
+        if self._coupons.remove(code, marketplace):
+            logger.info(f"Removed coupon: {code} for {marketplace}")
+            return True
         
         return False
     
     def cleanup_expired_coupons(self) -> int:
         """
-        Remove expired coupons.
+        Remove expired (and inactive) coupons.
+        
+        Coupons whose validity has not started yet are kept.
         
         Returns:
             int: Number of coupons removed
         """
-        initial_count = len(self._coupons)
-        self._coupons = [c for c in self._coupons if c.is_valid()]
-        removed = initial_count - len(self._coupons)
+        removed = self._coupons.remove_expired()
         
         if removed > 0:
             logger.info(f"Cleaned up {removed} expired coupons")
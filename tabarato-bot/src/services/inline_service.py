@@ -0,0 +1,306 @@
+"""
+Inline query service for EconomiZap Bot.
+Answers "@bot query" lookups from cached results of popular queries.
+"""
+
+from collections import Counter
+from typing import Callable, ContextManager, Dict, Hashable, List, Optional, Tuple
+import asyncio
+import time
+
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_database
+from src.database.repositories import SearchRepository
+from src.models.product import SearchResult
+from src.services.search_service import SearchService, get_search_service
+from src.utils.prefix_index import PrefixIndex
+from src.utils.logger import get_logger
+from src.config import Config
+
+logger = get_logger(__name__)
+
+
+class InlineSearchService:
+    """
+    Service answering inline queries without searching marketplaces.
+    
+    Telegram expects inline queries to be answered within a few seconds,
+    less than a full marketplace fan-out takes. Answers therefore only use
+    results already in the search cache, for the popular queries starting
+    with what the user typed (a ``PrefixIndex`` seeded from
+    ``SearchRepository.get_popular_queries``). A query with no cached
+    result is searched in the background once the user stops typing, so
+    a later keystroke (or the same query from another user) finds it
+    cached; it is indexed when the search returns products.
+    """
+    
+    # Shorter queries are not searched in the background
+    PREFETCH_MIN_LENGTH = 3
+    
+    def __init__(
+        self,
+        search_service: Optional[SearchService] = None,
+        session_scope: Optional[Callable[[], ContextManager[Session]]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize inline search service.
+        
+        Args:
+            search_service: Search service whose cache is used (default:
+                the global search service)
+            session_scope: Transactional session factory (default: the
+                global database ``session_scope``)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.search_service = search_service or get_search_service()
+        self._session_scope = session_scope
+        self._clock = clock
+        self.max_results = Config.INLINE_MAX_RESULTS
+        self.popular_days = Config.INLINE_POPULAR_DAYS
+        self.refresh_interval = Config.INLINE_REFRESH_INTERVAL
+        self.prefetch_delay = Config.INLINE_PREFETCH_DELAY
+        self.index = PrefixIndex(max_entries=Config.INLINE_INDEX_MAX_QUERIES)
+        self._refreshed_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Debounced background search per user (the last query typed)
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        
+        # Counters
+        self.answered = 0
+        self.unanswered = 0
+        self.prefetched = 0
+    
+    async def refresh(self) -> int:
+        """
+        Reload popular queries into the prefix index.
+        
+        Returns:
+            int: Number of queries loaded (0 if the database is unavailable)
+        """
+        self._refreshed_at = self._clock()
+        
+        try:
+            popular_queries = await asyncio.to_thread(self._load_popular_queries)
+        except Exception as e:
+            logger.warning(f"Could not load popular queries for inline mode: {e}")
+            return 0
+        
+        # Spellings of one query share a cache key: add up their counts
+        scores = Counter()
+        for query, count in popular_queries:
+            scores[self.search_service.get_cache_key(query)] += count
+        
+        self.index.update(scores.items())
+        
+        logger.info(f"Inline index refreshed with {len(scores)} popular queries ({len(self.index)} indexed)")
+        
+        return len(scores)
+    
+    def _load_popular_queries(self) -> List[tuple]:
+        """
+        Load popular queries from the database (blocking).
+        
+        Returns:
+            List[tuple]: (query, count) pairs
+        """
+        session_scope = self._session_scope or get_database().session_scope
+        with session_scope() as session:
+            return [
+                (query, count)
+                for query, count in SearchRepository.get_popular_queries(
+                    session,
+                    days=self.popular_days,
+                    limit=self.index.max_entries
+                )
+            ]
+    
+    def _refresh_if_due(self) -> None:
+        """Start a background refresh when the index is older than the interval."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        
+        if self._refreshed_at is None or self._clock() - self._refreshed_at >= self.refresh_interval:
+            self._refresh_task = asyncio.ensure_future(self.refresh())
+    
+    def answer(self, query: str) -> List[SearchResult]:
+        """
+        Get cached results for the popular queries starting with a query.
+        
+        Args:
+            query: Text typed after the bot username (may be empty)
+            
+        Returns:
+            List[SearchResult]: Up to ``max_results`` cached results with
+            products, the query itself first
+        """
+        self._refresh_if_due()
+        
+        prefix = self.search_service.get_cache_key(query)
+        results = []
+        
+        # Indexed queries may no longer be cached: look a few past the limit
+        for key in self.index.search(prefix, limit=self.max_results * 3):
+            result = self.search_service.get_cached_result(key)
+            if result is not None and result.has_results:
+                results.append(result)
+                if len(results) == self.max_results:
+                    break
+        
+        if results:
+            self.answered += 1
+        else:
+            self.unanswered += 1
+        
+        return results
+    
+    def is_cached(self, query: str) -> bool:
+        """
+        Check if a query has a cached result.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            bool: True if the search cache holds the query
+        """
+        return self.search_service.get_cache_key(query) in self.search_service.cache
+    
+    def needs_prefetch(self, query: str) -> bool:
+        """
+        Check if a query is worth searching in the background.
+        
+        It is not when it is short, when its result is cached, or when the
+        index already holds a longer query starting with it (the user is
+        typing towards a known query, which answers it).
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            bool: True if the query should be searched
+        """
+        if len(query.strip()) < self.PREFETCH_MIN_LENGTH or self.is_cached(query):
+            return False
+        
+        key = self.search_service.get_cache_key(query)
+        return all(indexed == key for indexed in self.index.search(key, limit=2))
+    
+    def schedule_prefetch(
+        self,
+        user_id: Hashable,
+        query: str,
+        hit: Callable[[Hashable], Tuple[bool, float]]
+    ) -> bool:
+        """
+        Search for a query in the background once the user stops typing.
+        
+        The search starts after ``prefetch_delay`` seconds unless the user
+        sends another query first, which cancels it; only then is the
+        user's rate limit checked, so keystrokes cost nothing.
+        
+        Args:
+            user_id: Telegram user ID
+            query: Search query
+            hit: Rate limiter check (e.g. ``SlidingWindowLimiter.hit``)
+            
+        Returns:
+            bool: True if a background search is scheduled
+        """
+        pending = self._pending.pop(user_id, None)
+        if pending is not None:
+            pending.cancel()
+        
+        if not self.needs_prefetch(query):
+            return False
+        
+        task = asyncio.ensure_future(self._prefetch_when_idle(user_id, query, hit))
+        self._pending[user_id] = task
+        task.add_done_callback(lambda t: self._forget_pending(user_id, t))
+        
+        return True
+    
+    async def _prefetch_when_idle(
+        self,
+        user_id: Hashable,
+        query: str,
+        hit: Callable[[Hashable], Tuple[bool, float]]
+    ) -> None:
+        """
+        Wait for the debounce delay, then search if still needed and allowed.
+        
+        Args:
+            user_id: Telegram user ID
+            query: Search query
+            hit: Rate limiter check
+        """
+        await asyncio.sleep(self.prefetch_delay)
+        
+        if not self.needs_prefetch(query):
+            return
+        
+        allowed, _ = hit(user_id)
+        if allowed:
+            self.prefetch(query)
+        else:
+            logger.debug(f"Inline search throttled for user {user_id}: '{query}'")
+    
+    def _forget_pending(self, user_id: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished debounced search unless it was replaced."""
+        if self._pending.get(user_id) is task:
+            del self._pending[user_id]
+    
+    def prefetch(self, query: str) -> bool:
+        """
+        Search for a query in the background, indexing it if products are found.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            bool: True if a background search was started
+        """
+        task = self.search_service.prefetch(query)
+        if task is None:
+            return False
+        
+        task.add_done_callback(lambda t: self._index_if_found(query, t))
+        self.prefetched += 1
+        
+        return True
+    
+    def _index_if_found(self, query: str, task: asyncio.Task) -> None:
+        """
+        Index a prefetched query once its search returned products.
+        
+        Args:
+            query: Search query
+            task: Finished background search
+        """
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        result = self.search_service.get_cached_result(query)
+        if result is not None and result.has_results:
+            self.index.add(self.search_service.get_cache_key(query))
+
+
+# Global inline search service instance
+_inline_search_service: Optional[InlineSearchService] = None
+
+
+def get_inline_search_service() -> InlineSearchService:
+    """
+    Get the global inline search service instance.
+    
+    Returns:
+        InlineSearchService: Global inline search service
+    """
+    global _inline_search_service
+    
+    if _inline_search_service is None:
+        _inline_search_service = InlineSearchService()
+    
+    return _inline_search_service
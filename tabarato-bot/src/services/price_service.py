@@ -1,6 +1,6 @@
 """
 Price comparison service for EconomiZap Bot.
-"""Compares prices across products and applies coupons.
+Compares prices across products and applies coupons.
 """
 
 from typing import List, Optional, Dict, Tuple
@@ -8,7 +8,10 @@ from datetime import datetime
 
 from src.models.product import Product, SearchResult
 from src.services.coupon_service import get_coupon_service
-from src.utils.normalizer import ProductNormalizer, group_similar_products
+from src.services import batch_pricing
+from src.services.catalog_service import get_catalog_service
+from src.utils.normalizer import ProductNormalizer
+from src.utils.clustering import IncrementalClusterer
 from src.utils.logger import get_logger
 from src.config import Config
 
@@ -24,6 +27,13 @@ class PriceService:
         """Initialize price service."""
         self.coupon_service = get_coupon_service()
         self.similarity_threshold = Config.SIMILARITY_THRESHOLD
+        self.batch_min_products = Config.BATCH_PRICING_MIN_PRODUCTS
+        self.catalog_grouping = Config.CATALOG_GROUPING
+        self.clusterer = IncrementalClusterer(
+            threshold=self.similarity_threshold,
+            max_age_days=Config.CLUSTER_MAX_AGE_DAYS,
+            min_token_overlap=Config.GROUPING_MIN_TOKEN_OVERLAP
+        )
         
         logger.info("Price service initialized")
     
@@ -43,11 +53,7 @@ class PriceService:
         logger.info(f"Comparing prices for {len(search_result.products)} products")
         
         # Apply coupons to all products
-        enhanced_products = []
-        
-        for product in search_result.products:
-            enhanced_product = self._apply_coupon_to_product(product)
-            enhanced_products.append(enhanced_product)
+        enhanced_products = self.apply_coupons(search_result.products)
         
         # Create new search result with enhanced products
         enhanced_result = SearchResult(
@@ -66,6 +72,45 @@ class PriceService:
         
         return enhanced_result
     
+    def apply_coupons(self, products: List[Product]) -> List[Product]:
+        """
+        Apply the best coupon to each product.
+        
+        Large batches are priced in one vectorized pass when NumPy is
+        installed; the result is the same as the per-product path.
+        
+        Args:
+            products: Original products
+            
+        Returns:
+            List[Product]: Products with coupons applied (same order)
+        """
+        if not batch_pricing.is_available() or len(products) < self.batch_min_products:
+            return [self._apply_coupon_to_product(p) for p in products]
+        
+        pricer = batch_pricing.BatchCouponPricer(self.coupon_service.get_active_coupons())
+        coupons, discounts, final_prices = pricer.price(
+            [p.marketplace for p in products],
+            [p.price for p in products]
+        )
+        
+        enhanced_products = []
+        
+        for product, coupon, discount, final_price in zip(
+            products, coupons, discounts.tolist(), final_prices.tolist()
+        ):
+            if coupon is None:
+                enhanced_products.append(product)
+                continue
+            
+            enhanced_products.append(product.with_coupon(
+                final_price=final_price,
+                coupon_code=coupon.code,
+                discount_percentage=(discount / product.price * 100) if product.price > 0 else 0
+            ))
+        
+        return enhanced_products
+    
     def _apply_coupon_to_product(self, product: Product) -> Product:
         """
         Apply best coupon to a product.
@@ -85,19 +130,11 @@ class PriceService:
         if not coupon_result['coupon_applied']:
             return product
         
-        # Create new product with coupon applied
-        enhanced_product = Product(
-            id=product.id,
-            name=product.name,
-            price=coupon_result['final_price'],
-            original_price=coupon_result['original_price'],
-            marketplace=product.marketplace,
-            url=product.url,
-            image_url=product.image_url,
+        # Copy the product with coupon applied (no second validation)
+        enhanced_product = product.with_coupon(
+            final_price=coupon_result['final_price'],
             coupon_code=coupon_result['coupon_code'],
-            discount_percentage=coupon_result['discount_percentage'],
-            currency=product.currency,
-            timestamp=product.timestamp
+            discount_percentage=coupon_result['discount_percentage']
         )
         
         logger.debug(
@@ -127,20 +164,48 @@ class PriceService:
         
         # Apply coupons if requested
         if apply_coupons:
-            products = [self._apply_coupon_to_product(p) for p in products]
+            products = self.apply_coupons(products)
         
         # Find product with lowest final price
         best_product = min(products, key=lambda p: p.final_price)
         
         return best_product
     
-    def group_and_compare(
+    async def group_products(self, products: List[Product]) -> List[List[Product]]:
+        """
+        Group listings of the same product.
+        
+        The two grouping strategies are alternatives, chosen by
+        ``CATALOG_GROUPING``: with it enabled (the default), products are
+        grouped by canonical product (see ``CatalogService``); otherwise
+        by the in-memory clusters kept across calls (see
+        ``IncrementalClusterer``), which are never consulted while the
+        catalog is in use. Both persist, so listings seen by an earlier
+        call (e.g. the previous scheduled scan) are not matched again.
+        
+        Args:
+            products: Products to group
+            
+        Returns:
+            List[List[Product]]: Product groups, in order of first appearance
+        """
+        if self.catalog_grouping:
+            return await get_catalog_service().group_products_async(
+                products,
+                threshold=self.similarity_threshold
+            )
+        
+        return self.clusterer.group(products)
+    
+    async def group_and_compare(
         self,
         search_result: SearchResult
     ) -> Dict[str, List[Product]]:
         """
         Group similar products and compare prices within groups.
         
+        Products are grouped by ``group_products`` and priced with coupons.
+        
         Args:
             search_result: Search results
             
@@ -151,10 +216,7 @@ class PriceService:
             return {}
         
         # Group similar products
-        groups = group_similar_products(
-            search_result.products,
-            threshold=self.similarity_threshold
-        )
+        groups = await self.group_products(search_result.products)
         
         # For each group, find best deal
         result = {}
@@ -5,8 +5,12 @@ Scheduler for automated tasks.
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+from src.integrations.rate_limiter import rate_limit_fail_fast
+from src.models.product import Product
+from src.services.price_service import get_price_service
 from src.services.search_service import get_search_service
 from src.services.channel_service import get_channel_service
 from src.utils.logger import get_logger
@@ -19,6 +23,9 @@ class TaskScheduler:
     Scheduler for automated bot tasks.
     """
     
+    # Good deals to collect per term before a deep search stops early
+    DEEP_SEARCH_TARGET = 10
+    
     def __init__(self):
         """Initialize task scheduler."""
         self.scheduler = AsyncIOScheduler()
@@ -101,16 +108,36 @@ class TaskScheduler:
             search_service = get_search_service()
             channel_service = get_channel_service()
             
+            mercadolivre = next(
+                (m for m in search_service.marketplaces if isinstance(m, MercadoLivreAPI)),
+                None
+            )
+            
             total_posted = 0
             
             for term in search_terms:
                 # Search
                 results = await search_service.search_all(term)
+                products = list(results.products)
+                
+                # Scan deeper into Mercado Livre listings for discounted items.
+                # Pages that would wait for a rate limit token are skipped, so
+                # the scan never queues ahead of user searches
+                if mercadolivre:
+                    with rate_limit_fail_fast():
+                        deep_results = await mercadolivre.deep_search(
+                            term,
+                            predicate=channel_service.is_good_deal,
+                            target=self.DEEP_SEARCH_TARGET
+                        )
+                    products = self.merge_deep_results(products, deep_results.products)
                 
-                if results.has_results:
+                products = await self.best_listings(products)
+                
+                if products:
                     # Post best deals
                     posted = await channel_service.post_best_deals(
-                        results.products,
+                        products,
                         max_posts=1  # 1 per search term
                     )
                     total_posted += posted
@@ -120,6 +147,60 @@ class TaskScheduler:
         except Exception as e:
             logger.error(f"Error in scheduled deal search: {e}", exc_info=True)
     
+    @staticmethod
+    def merge_deep_results(
+        products: List[Product],
+        deep_products: List[Product]
+    ) -> List[Product]:
+        """
+        Add deep search listings to already compared search results.
+        
+        Listings already in the results (same marketplace and ID) are
+        skipped; the new ones get coupons applied like search results,
+        so deals are posted with their coupon prices.
+        
+        Args:
+            products: Compared products from ``search_all``
+            deep_products: Raw products from ``deep_search``
+            
+        Returns:
+            List[Product]: Products followed by the new, priced deep listings
+        """
+        seen = {(p.marketplace, p.id) for p in products}
+        new_products = []
+        
+        for product in deep_products:
+            key = (product.marketplace, product.id)
+            if key not in seen:
+                seen.add(key)
+                new_products.append(product)
+        
+        return products + get_price_service().apply_coupons(new_products)
+    
+    @staticmethod
+    async def best_listings(products: List[Product]) -> List[Product]:
+        """
+        Keep the cheapest listing of each product.
+        
+        Listings are grouped by ``PriceService.group_products``, whose
+        catalog or clusters persist between scans, so listings seen by an
+        earlier scan are not matched again; a product listed on several
+        marketplaces is then offered for posting once.
+        
+        Args:
+            products: Priced products
+            
+        Returns:
+            List[Product]: Cheapest product of each group, in order of
+            first appearance
+        """
+        if not products:
+            return []
+        
+        groups = await get_price_service().group_products(products)
+        
+        return [min(group, key=lambda p: p.final_price) for group in groups]
+    
     async def _cleanup_old_data(self) -> None:
         """
         Cleanup old data from database.
@@ -3,16 +3,23 @@ Search service for EconomiZap Bot.
 Orchestrates product searches across multiple marketplaces.
 """
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
 import asyncio
 
+from src.database.connection import get_database
+from src.database.repositories import SearchRepository
 from src.models.product import Product, SearchResult
 from src.integrations.mercadolivre_api import MercadoLivreAPI
 from src.integrations.amazon_api import AmazonAPI
 from src.integrations.shopee_api import ShopeeAPI
 from src.integrations.aliexpress_api import AliExpressAPI
+from src.integrations.base_api import BaseMarketplaceAPI
 from src.services.price_service import get_price_service
+from src.utils.cache import TTLCache
+from src.utils.deadline import deadline_scope
+from src.utils.singleflight import Broadcast, SingleFlight
+from src.utils.normalizer import ProductNormalizer
 from src.utils.logger import get_logger
 from src.config import Config
 
@@ -46,6 +53,25 @@ class SearchService:
         # Initialize price service
         self.price_service = get_price_service()
         
+        # Cache of compared results, keyed by canonical query
+        self.cache = TTLCache(
+            max_size=Config.CACHE_MAX_SIZE,
+            ttl=Config.CACHE_EXPIRATION
+        )
+        
+        # Concurrent identical searches share one fan-out; streamed ones
+        # also share their per-marketplace results
+        self._in_flight = SingleFlight()
+        self._streams: Dict[str, Broadcast] = {}
+        
+        # Latency budget: return partial results after this many seconds
+        self.search_budget = Config.SEARCH_BUDGET
+        self.complete_in_background = Config.SEARCH_BUDGET_BACKGROUND
+        self._background_tasks: Set[asyncio.Task] = set()
+        
+        # Stale-while-revalidate from stored results, in seconds (0 disables it)
+        self.stale_max_age = Config.STALE_RESULTS_MAX_AGE
+        
         logger.info(f"Search service initialized with {len(self.marketplaces)} marketplace(s)")
         logger.info(f"Marketplaces: {[m.marketplace_name for m in self.marketplaces]}")
     
@@ -59,8 +85,6 @@ class SearchService:
         Returns:
             SearchResult: Aggregated search results from all marketplaces
         """
-        start_time = datetime.now()
-        
         logger.info(f"Starting search for: {query}")
         
         # Validate query
@@ -73,49 +97,205 @@ class SearchService:
                 search_time=0.0
             )
         
+        cache_key = self.get_cache_key(query)
+        
+        # Serve from cache when possible
+        cached_result = self.cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Cache hit for: {cache_key}")
+            # Deep copy: callers must not share Product objects with the cache
+            return cached_result.model_copy(deep=True, update={'query': query})
+        
+        result = await self._in_flight.do(
+            cache_key,
+            lambda: self._search_and_cache(query, cache_key)
+        )
+        
+        return result.model_copy(deep=True, update={'query': query})
+    
+    async def get_stale_result(self, query: str) -> Optional[SearchResult]:
+        """
+        Get a stored result for a query and refresh it in the background.
+        
+        Used when the in-process cache misses (e.g. right after a restart):
+        the latest result saved in ProductCache within the staleness window
+        is returned at once, while a fresh search runs and refills the cache.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Optional[SearchResult]: Stale result (stale=True), or None if the
+            query is cached, disabled or has no recent stored result
+        """
+        if not self.stale_max_age or not self._validate_query(query):
+            return None
+        
+        if self.get_cache_key(query) in self.cache:
+            return None
+        
+        try:
+            stale_result = await asyncio.to_thread(self._load_stored_result, query)
+        except Exception as e:
+            logger.warning(f"Could not load stored results for '{query}': {e}")
+            return None
+        
+        if stale_result is None:
+            return None
+        
+        logger.info(
+            f"Serving stored results for '{query}' "
+            f"({stale_result.age.total_seconds():.0f}s old), refreshing in background"
+        )
+        self._run_in_background(self.search_all(query))
+        
+        return stale_result
+    
+    def get_cached_result(self, query: str) -> Optional[SearchResult]:
+        """
+        Get the cached result for a query without searching.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Optional[SearchResult]: Cached result, or None on a miss
+        """
+        cached_result = self.cache.get(self.get_cache_key(query))
+        if cached_result is None:
+            return None
+        return cached_result.model_copy(deep=True, update={'query': query})
+    
+    def prefetch(self, query: str) -> Optional[asyncio.Task]:
+        """
+        Search for a query in the background so its result gets cached.
+        
+        Nothing is started for invalid queries, or ones already cached or
+        being searched.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Optional[asyncio.Task]: Background search, or None if none was
+            started
+        """
+        if not self._validate_query(query):
+            return None
+        
+        cache_key = self.get_cache_key(query)
+        
+        if cache_key in self.cache or self._in_flight.is_in_flight(cache_key):
+            return None
+        
+        logger.info(f"Prefetching results for: {cache_key}")
+        return self._run_in_background(self._in_flight.start(
+            cache_key,
+            lambda: self._search_and_cache(query, cache_key)
+        ))
+    
+    def _load_stored_result(self, query: str) -> Optional[SearchResult]:
+        """
+        Load the latest stored result for a query (blocking).
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Optional[SearchResult]: Stored result within the staleness window
+        """
+        db = get_database()
+        with db.session_scope() as session:
+            return SearchRepository.get_recent_result(
+                session,
+                query,
+                max_age=timedelta(seconds=self.stale_max_age)
+            )
+    
+    async def _search_and_cache(self, query: str, cache_key: str) -> SearchResult:
+        """
+        Run the marketplace fan-out and store the result in the cache.
+        
+        Args:
+            query: Validated search query
+            cache_key: Canonical cache key for the query
+            
+        Returns:
+            SearchResult: Aggregated search results
+        """
+        result = await self._search_marketplaces(query, cache_key)
+        
+        # Only cache complete, useful results, so an outage is not pinned
+        if result.has_results and not result.missing_marketplaces:
+            self.cache.set(cache_key, result)
+        
+        return result
+    
+    async def _search_marketplaces(self, query: str, cache_key: str) -> SearchResult:
+        """
+        Fan out a search to every marketplace and compare prices.
+        
+        Marketplaces that have not answered when the search budget runs out
+        are reported in missing_marketplaces.
+        
+        Args:
+            query: Validated search query
+            cache_key: Canonical cache key for the query
+            
+        Returns:
+            SearchResult: Aggregated search results from all marketplaces
+        """
+        start_time = datetime.now()
+        
         # Search all marketplaces in parallel
-        search_tasks = [
-            marketplace.search(query)
-            for marketplace in self.marketplaces
-        ]
+        search_tasks = self._start_searches(query)
         
         try:
-            # Wait for all searches to complete (with timeout)
-            results = await asyncio.gather(*search_tasks, return_exceptions=True)
+            # Wait for the searches, up to the search budget
+            done, pending = await asyncio.wait(
+                search_tasks,
+                timeout=self.search_budget or None
+            )
             
-            # Aggregate products from all marketplaces
-            all_products: List[Product] = []
+            # Aggregate results in marketplace order
+            partial_results: List[SearchResult] = []
             
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Marketplace search failed: {result}")
+            for task, marketplace in search_tasks.items():
+                if task not in done:
                     continue
                 
-                if isinstance(result, SearchResult):
-                    all_products.extend(result.products)
-                    logger.info(
-                        f"{self.marketplaces[i].marketplace_name}: "
-                        f"Found {len(result.products)} products"
-                    )
+                _, result = task.result()
+                
+                if result is None:
+                    continue
+                
+                partial_results.append(result)
+                logger.info(
+                    f"{marketplace.marketplace_name}: "
+                    f"Found {len(result.products)} products"
+                )
             
             # Calculate total search time
             search_time = (datetime.now() - start_time).total_seconds()
             
             # Create initial search result
-            initial_result = SearchResult(
-                query=query,
-                products=all_products,
-                total_results=len(all_products),
-                search_time=search_time
-            )
+            initial_result = self.merge_results(query, partial_results, search_time)
             
             # Apply price comparison and coupons
-            if all_products:
+            if initial_result.has_results:
                 logger.info("Applying coupons and comparing prices...")
                 final_result = self.price_service.compare_prices(initial_result)
             else:
                 final_result = initial_result
             
+            if pending:
+                final_result.missing_marketplaces = self._handle_stragglers(
+                    query,
+                    cache_key,
+                    [final_result],
+                    {task: search_tasks[task] for task in pending}
+                )
+            
             logger.info(
                 f"Search completed: {len(final_result.products)} total products "
                 f"in {search_time:.2f}s"
@@ -125,6 +305,10 @@ class SearchService:
             
         except Exception as e:
             logger.error(f"Search failed: {e}", exc_info=True)
+            
+            for task in search_tasks:
+                task.cancel()
+            
             return SearchResult(
                 query=query,
                 products=[],
@@ -132,6 +316,356 @@ class SearchService:
                 search_time=0.0
             )
     
+    def _handle_stragglers(
+        self,
+        query: str,
+        cache_key: str,
+        completed_results: List[SearchResult],
+        pending: Dict[asyncio.Task, BaseMarketplaceAPI]
+    ) -> List[str]:
+        """
+        Deal with marketplace searches that missed the search budget.
+        
+        They are either cancelled or, when background completion is
+        enabled, left running so the complete result lands in the cache.
+        
+        Args:
+            query: Search query
+            cache_key: Canonical cache key for the query
+            completed_results: Compared results that made the budget
+            pending: Marketplace search tasks still running, by task
+            
+        Returns:
+            List[str]: Names of the marketplaces that missed the budget
+        """
+        missing = sorted(m.marketplace_name for m in pending.values())
+        
+        logger.warning(
+            f"Search budget of {self.search_budget}s exceeded for '{query}', "
+            f"missing: {missing}"
+        )
+        
+        if not self.complete_in_background:
+            for task in pending:
+                task.cancel()
+            return missing
+        
+        self._run_in_background(
+            self._complete_in_background(
+                query, cache_key, completed_results, dict(pending)
+            )
+        )
+        
+        return missing
+    
+    def _run_in_background(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """
+        Start a background task and keep a reference until it finishes.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            asyncio.Task: Started task
+        """
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def _complete_in_background(
+        self,
+        query: str,
+        cache_key: str,
+        completed_results: List[SearchResult],
+        pending: Dict[asyncio.Task, BaseMarketplaceAPI]
+    ) -> None:
+        """
+        Wait for late marketplaces and cache the complete result.
+        
+        Args:
+            query: Search query
+            cache_key: Canonical cache key for the query
+            completed_results: Compared results that made the budget
+            pending: Marketplace search tasks still running, by task
+        """
+        try:
+            done, still_pending = await asyncio.wait(
+                pending,
+                timeout=Config.SEARCH_TIMEOUT
+            )
+            
+            for task in still_pending:
+                task.cancel()
+            
+            late_results = []
+            for task in done:
+                _, result = task.result()
+                if result is not None and result.has_results:
+                    late_results.append(self.price_service.compare_prices(result))
+            
+            if still_pending:
+                return
+            
+            full_result = self.merge_results(query, completed_results + late_results)
+            full_result.missing_marketplaces = []
+            
+            if not full_result.has_results:
+                return
+            
+            self.cache.set(cache_key, full_result)
+            
+            logger.info(
+                f"Background completion cached {full_result.total_results} "
+                f"products for: {cache_key}"
+            )
+            
+        except Exception as e:
+            logger.error(f"Background search completion failed: {e}", exc_info=True)
+    
+    async def search_stream(self, query: str) -> AsyncIterator[SearchResult]:
+        """
+        Search all marketplaces, yielding results as each one completes.
+        
+        Each yielded SearchResult holds one marketplace's products with
+        coupons already applied, in completion order. If the search budget
+        runs out, a last result without products lists the marketplaces
+        that did not answer in missing_marketplaces.
+        
+        Concurrent streams of the same query share one fan-out: the first
+        caller starts it as the in-flight search for the query and later
+        callers replay its results so far, then follow it live. A cached
+        result, or a search started by ``search_all``, is yielded as a
+        single aggregated result. Leaving the stream early does not stop
+        the shared fan-out, whose complete result is cached.
+        
+        Args:
+            query: Search query string
+            
+        Yields:
+            SearchResult: Per-marketplace results in completion order
+        """
+        logger.info(f"Starting streaming search for: {query}")
+        
+        if not self._validate_query(query):
+            logger.warning(f"Invalid query: {query}")
+            return
+        
+        cache_key = self.get_cache_key(query)
+        stream = self._streams.get(cache_key)
+        
+        # A closed stream has already cached its result (if complete)
+        if stream is not None and stream.closed:
+            stream = None
+        
+        # Cached or non-streamed running searches are served as one result
+        if stream is None and (cache_key in self.cache or self._in_flight.is_in_flight(cache_key)):
+            yield await self.search_all(query)
+            return
+        
+        if stream is None:
+            stream = self._start_stream(query, cache_key)
+        
+        async for result in stream.subscribe():
+            # Subscribers must not share Product objects with each other
+            yield result.model_copy(deep=True, update={'query': query})
+    
+    def _start_stream(self, query: str, cache_key: str) -> Broadcast:
+        """
+        Start a streamed fan-out as the in-flight search for a query.
+        
+        Args:
+            query: Validated search query
+            cache_key: Canonical cache key for the query
+            
+        Returns:
+            Broadcast: Stream of the fan-out's results
+        """
+        stream = Broadcast()
+        self._streams[cache_key] = stream
+        
+        def forget(task: asyncio.Task) -> None:
+            if self._streams.get(cache_key) is stream:
+                del self._streams[cache_key]
+        
+        self._in_flight.start(
+            cache_key,
+            lambda: self._stream_marketplaces(query, cache_key, stream)
+        ).add_done_callback(forget)
+        
+        return stream
+    
+    async def _stream_marketplaces(
+        self,
+        query: str,
+        cache_key: str,
+        stream: Broadcast
+    ) -> SearchResult:
+        """
+        Fan out a search, publishing each marketplace's compared result.
+        
+        Once done, the aggregated result is cached if complete.
+        
+        Args:
+            query: Validated search query
+            cache_key: Canonical cache key for the query
+            stream: Stream the results are published to
+            
+        Returns:
+            SearchResult: Aggregated search results (for ``search_all`` joiners)
+        """
+        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.search_budget if self.search_budget else None
+        
+        search_tasks = self._start_searches(query)
+        pending = set(search_tasks)
+        partial_results: List[SearchResult] = []
+        missing: List[str] = []
+        
+        try:
+            try:
+                while pending:
+                    timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    
+                    # Budget exhausted
+                    if not done:
+                        break
+                    
+                    for task in done:
+                        marketplace, result = task.result()
+                        
+                        if result is None:
+                            continue
+                        
+                        logger.info(
+                            f"{marketplace.marketplace_name}: "
+                            f"Found {len(result.products)} products"
+                        )
+                        
+                        if result.has_results:
+                            result = self.price_service.compare_prices(result)
+                        
+                        partial_results.append(result)
+                        stream.publish(result)
+                
+                if pending:
+                    missing = self._handle_stragglers(
+                        query,
+                        cache_key,
+                        list(partial_results),
+                        {task: search_tasks[task] for task in pending}
+                    )
+                    pending = set()
+                    
+                    stream.publish(SearchResult(query=query, missing_marketplaces=missing))
+            finally:
+                # Fan-out failed or was cancelled: do not leave orphaned requests behind
+                for task in pending:
+                    task.cancel()
+            
+            search_time = (datetime.now() - start_time).total_seconds()
+            final_result = self.merge_results(query, partial_results, search_time)
+            final_result.missing_marketplaces = missing
+            
+            # Cache before closing, so a finished stream is always cached
+            if final_result.has_results and not missing:
+                self.cache.set(cache_key, final_result)
+        finally:
+            stream.close()
+        
+        return final_result
+    
+    def _start_searches(self, query: str) -> Dict[asyncio.Task, BaseMarketplaceAPI]:
+        """
+        Start one search task per marketplace under the request deadline.
+        
+        The tasks inherit the deadline, so HTTP retries stop once the
+        search can no longer use their results: at the budget, or at the
+        end of the background completion window when that is enabled.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Dict: Search task to marketplace mapping
+        """
+        deadline = self.search_budget
+        if deadline and self.complete_in_background:
+            deadline += Config.SEARCH_TIMEOUT
+        
+        with deadline_scope(deadline):
+            return {
+                asyncio.ensure_future(self._search_one(marketplace, query)): marketplace
+                for marketplace in self.marketplaces
+            }
+    
+    async def _search_one(
+        self,
+        marketplace: BaseMarketplaceAPI,
+        query: str
+    ) -> Tuple[BaseMarketplaceAPI, Optional[SearchResult]]:
+        """
+        Search a single marketplace without raising.
+        
+        Args:
+            marketplace: Marketplace API to search
+            query: Search query
+            
+        Returns:
+            Tuple: Marketplace and its result (None if the search failed)
+        """
+        # An open circuit answers immediately with no products
+        if marketplace.circuit_breaker.is_open:
+            logger.info(f"{marketplace.marketplace_name}: Circuit open, skipping search")
+            return marketplace, SearchResult(query=query)
+        
+        try:
+            return marketplace, await marketplace.search(query)
+        except Exception as e:
+            logger.error(f"{marketplace.marketplace_name} search failed: {e}")
+            return marketplace, None
+    
+    @staticmethod
+    def merge_results(
+        query: str,
+        results: List[SearchResult],
+        search_time: Optional[float] = None
+    ) -> SearchResult:
+        """
+        Merge per-marketplace results into a single SearchResult.
+        
+        Args:
+            query: Original search query
+            results: Partial results to merge
+            search_time: Total search time (default: slowest partial)
+            
+        Returns:
+            SearchResult: Aggregated result
+        """
+        products: List[Product] = []
+        missing: List[str] = []
+        
+        for result in results:
+            products.extend(result.products)
+            missing.extend(result.missing_marketplaces)
+        
+        if search_time is None:
+            search_time = max((r.search_time for r in results), default=0.0)
+        
+        return SearchResult(
+            query=query,
+            products=products,
+            total_results=len(products),
+            search_time=search_time,
+            missing_marketplaces=sorted(set(missing))
+        )
+    
     async def search_marketplace(
         self,
         query: str,
@@ -154,6 +688,19 @@ class SearchService:
         logger.warning(f"Marketplace not found: {marketplace_name}")
         return None
     
+    @staticmethod
+    def get_cache_key(query: str) -> str:
+        """
+        Build the canonical form of a query used as cache key.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            str: Normalized query (lowercase, no accents or punctuation)
+        """
+        return ProductNormalizer.normalize_text(query)
+    
     def _validate_query(self, query: str) -> bool:
         """
         Validate search query.
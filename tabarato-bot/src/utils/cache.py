@@ -0,0 +1,154 @@
+"""
+In-memory caching utilities for EconomiZap Bot.
+Provides a size-bounded LRU cache with per-entry TTL expiry.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after a TTL.
+    
+    Entries are kept in access order: a hit moves the entry to the end,
+    and inserting beyond ``max_size`` evicts the least recently used one.
+    Expired entries are dropped lazily when they are read.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Default time-to-live in seconds
+            clock: Monotonic time source (injectable for tests)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value from the cache.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            
+        Returns:
+            Any: Cached value, or default if missing or expired
+        """
+        entry = self._entries.get(key)
+        
+        if entry is None:
+            self.misses += 1
+            return default
+        
+        expires_at, value = entry
+        
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live override in seconds (default: cache TTL)
+        """
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        
+        self._entries[key] = (expires_at, value)
+        
+        while len(self._entries) > self.max_size:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"Cache evicted: {evicted_key}")
+    
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove a key from the cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            bool: True if the key was present
+        """
+        return self._entries.pop(key, None) is not None
+    
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._entries.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a non-expired entry exists (does not touch counters or order)."""
+        entry = self._entries.get(key)
+        return entry is not None and self._clock() < entry[0]
+    
+    def __len__(self) -> int:
+        """Number of stored entries (including not yet collected expired ones)."""
+        return len(self._entries)
+    
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the cache hit rate.
+        
+        Returns:
+            float: Hits / lookups (0.0 if no lookups yet)
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict: Size, capacity and hit/miss/eviction counters
+        """
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hit_rate
+        }
@@ -0,0 +1,336 @@
+"""
+Incremental product clustering for EconomiZap Bot.
+Keeps groups of similar listings in memory across successive searches.
+"""
+
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Set
+
+from src.utils import similarity
+from src.utils.normalizer import ProductNormalizer, group_similar_names
+from src.utils.logger import get_logger
+from src.config import Config
+
+logger = get_logger(__name__)
+
+SECONDS_PER_DAY = 86400.0
+
+
+def listing_key(product) -> tuple:
+    """
+    Identify a listing by marketplace and external ID.
+    
+    Args:
+        product: Product object
+        
+    Returns:
+        tuple: (marketplace, id)
+    """
+    return (product.marketplace, product.id)
+
+
+class UnionFind:
+    """
+    Disjoint sets of hashable items (path halving).
+    
+    ``union`` always keeps the root of its ``into`` argument, so the
+    root of a set can serve as its stable representative.
+    """
+    
+    def __init__(self):
+        """Initialize an empty structure."""
+        self._parent: Dict[Hashable, Hashable] = {}
+    
+    def add(self, item: Hashable) -> None:
+        """
+        Add an item as a singleton set (no-op if present).
+        
+        Args:
+            item: Item to add
+        """
+        self._parent.setdefault(item, item)
+    
+    def find(self, item: Hashable) -> Hashable:
+        """
+        Get the root of an item's set.
+        
+        Args:
+            item: Item in the structure
+            
+        Returns:
+            Hashable: Root item
+        """
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, item: Hashable, into: Hashable) -> Hashable:
+        """
+        Merge the set of ``item`` into the set of ``into``.
+        
+        Args:
+            item: Item whose set is merged
+            into: Item whose root is kept
+            
+        Returns:
+            Hashable: Root of the merged set
+        """
+        root = self.find(into)
+        self._parent[self.find(item)] = root
+        return root
+    
+    def __contains__(self, item: Hashable) -> bool:
+        """Check if an item was added."""
+        return item in self._parent
+    
+    def __len__(self) -> int:
+        """Number of items."""
+        return len(self._parent)
+
+
+class IncrementalClusterer:
+    """
+    Groups listings into clusters that persist between calls.
+    
+    Listings already clustered are grouped by a union-find lookup. Each
+    new listing is scored only against cluster representatives sharing
+    one of its rarest tokens (prefix filtering, as in
+    ``similarity_candidates``) and joins the oldest similar one; new
+    listings matching no representative are grouped among themselves
+    and start new clusters. The cost of a call therefore grows with the
+    number of new listings, not with the number of listings seen.
+    
+    Listings not seen for ``max_age_days`` are evicted. A cluster whose
+    representative is evicted is represented by its most recently seen
+    listing.
+    """
+    
+    # Seconds between eviction sweeps
+    EVICTION_INTERVAL = 3600.0
+    
+    def __init__(
+        self,
+        threshold: float = 70.0,
+        max_age_days: float = 7.0,
+        min_token_overlap: float = 0.4,
+        key: Callable[[object], Hashable] = listing_key,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the clusterer.
+        
+        Args:
+            threshold: Similarity threshold (0-100)
+            max_age_days: Days a listing is kept without being seen
+            min_token_overlap: Token overlap a similar pair is assumed to have
+            key: Function identifying a listing
+            clock: Time source in seconds (injectable for tests)
+        """
+        self.threshold = threshold
+        self.max_age = max_age_days * SECONDS_PER_DAY
+        self.min_token_overlap = min_token_overlap
+        self._key = key
+        self._clock = clock
+        
+        self._sets = UnionFind()
+        self._names: Dict[Hashable, str] = {}
+        self._last_seen: Dict[Hashable, float] = {}
+        
+        # Representatives (cluster roots) by token of their name, and
+        # their creation order for deterministic tie-breaks
+        self._index: Dict[str, Set[Hashable]] = {}
+        self._rank: Dict[Hashable, int] = {}
+        self._next_rank = 0
+        self._last_eviction = clock()
+        
+        # Counters
+        self.known = 0
+        self.matched = 0
+        self.created = 0
+        self.evicted = 0
+    
+    def group(self, products: List) -> List[List]:
+        """
+        Group products, clustering new listings.
+        
+        Args:
+            products: Products to group
+            
+        Returns:
+            List[List]: Product groups, in order of first appearance
+        """
+        if not products:
+            return []
+        
+        now = self._clock()
+        if now - self._last_eviction >= self.EVICTION_INTERVAL:
+            self.evict(now)
+        
+        keys = [self._key(p) for p in products]
+        
+        # First occurrence of each listing not clustered yet
+        new: Dict[Hashable, int] = {}
+        for i, key in enumerate(keys):
+            if key not in self._sets and key not in new:
+                new[key] = i
+        
+        self.known += len(keys) - len(new)
+        
+        if new:
+            self._cluster_new([products[i] for i in new.values()], list(new))
+        
+        groups: Dict[Hashable, List] = {}
+        for product, key in zip(products, keys):
+            self._last_seen[key] = now
+            groups.setdefault(self._sets.find(key), []).append(product)
+        
+        logger.info(
+            f"Clustered {len(products)} products ({len(new)} new) into "
+            f"{len(groups)} groups"
+        )
+        
+        return list(groups.values())
+    
+    def _cluster_new(self, products: List, keys: List[Hashable]) -> None:
+        """
+        Add new listings to existing or new clusters.
+        
+        Args:
+            products: New products
+            keys: Their listing keys
+        """
+        names = similarity.sort_tokens(ProductNormalizer.normalize_batch(p.name for p in products))
+        unmatched = []
+        
+        for i, (key, name) in enumerate(zip(keys, names)):
+            self._names[key] = name
+            root = self._find_representative(name)
+            
+            if root is None:
+                unmatched.append(i)
+            else:
+                self._sets.add(key)
+                self._sets.union(key, root)
+                self.matched += 1
+        
+        if not unmatched:
+            return
+        
+        # Groups are positions in unmatched
+        for group in group_similar_names([products[i].name for i in unmatched], self.threshold):
+            root = keys[unmatched[group[0]]]
+            self._add_cluster(root)
+            
+            for position in group[1:]:
+                key = keys[unmatched[position]]
+                self._sets.add(key)
+                self._sets.union(key, root)
+            
+            self.created += 1
+    
+    def _find_representative(self, name: str) -> Optional[Hashable]:
+        """
+        Find the oldest cluster whose representative is similar to a name.
+        
+        Args:
+            name: Normalized name with sorted tokens
+            
+        Returns:
+            Optional[Hashable]: Root of the cluster, or None if no
+            representative reaches the threshold
+        """
+        tokens = sorted(set(name.split()), key=lambda t: (len(self._index.get(t, ())), t))
+        if not tokens:
+            return None
+        
+        # A representative sharing enough tokens shares one of the rarest
+        prefix = tokens[:len(tokens) - math.ceil(self.min_token_overlap * len(tokens)) + 1]
+        shared: Dict[Hashable, int] = {}
+        for token in prefix:
+            for root in self._index.get(token, ()):
+                shared[root] = shared.get(root, 0) + 1
+        
+        # Representatives sharing the most rare tokens are likeliest to match
+        roots = sorted(shared, key=lambda root: (-shared[root], self._rank[root]))
+        match = similarity.first_match(name, [self._names[root] for root in roots], self.threshold)
+        
+        return None if match is None else roots[match]
+    
+    def _add_cluster(self, root: Hashable) -> None:
+        """
+        Start a cluster represented by a listing.
+        
+        Args:
+            root: Key of the representative listing (name already stored)
+        """
+        self._sets.add(root)
+        self._rank[root] = self._next_rank
+        self._next_rank += 1
+        
+        for token in set(self._names[root].split()):
+            self._index.setdefault(token, set()).add(root)
+    
+    def evict(self, now: Optional[float] = None) -> int:
+        """
+        Drop listings not seen for ``max_age_days``.
+        
+        Clusters are rebuilt from the remaining listings, keeping their
+        membership; this is linear in the listings kept, so it runs at
+        most once per ``EVICTION_INTERVAL`` from ``group``.
+        
+        Args:
+            now: Current time (default: clock)
+            
+        Returns:
+            int: Number of listings evicted
+        """
+        now = self._clock() if now is None else now
+        self._last_eviction = now
+        cutoff = now - self.max_age
+        
+        stale = [key for key, seen in self._last_seen.items() if seen < cutoff]
+        if not stale:
+            return 0
+        
+        for key in stale:
+            del self._last_seen[key]
+        
+        # Surviving members by old root, in cluster creation order
+        clusters: Dict[Hashable, List[Hashable]] = {}
+        for key in self._last_seen:
+            clusters.setdefault(self._sets.find(key), []).append(key)
+        
+        old_rank = self._rank
+        self._sets = UnionFind()
+        self._index = {}
+        self._rank = {}
+        self._next_rank = 0
+        
+        for old_root in sorted(clusters, key=old_rank.__getitem__):
+            members = clusters[old_root]
+            root = old_root if old_root in self._last_seen else max(members, key=self._last_seen.__getitem__)
+            self._add_cluster(root)
+            
+            for key in members:
+                self._sets.add(key)
+                self._sets.union(key, root)
+        
+        for key in stale:
+            del self._names[key]
+        
+        self.evicted += len(stale)
+        logger.info(f"Evicted {len(stale)} listings unseen for {self.max_age / SECONDS_PER_DAY:g} days")
+        
+        return len(stale)
+    
+    @property
+    def cluster_count(self) -> int:
+        """Number of clusters."""
+        return len(self._rank)
+    
+    def __len__(self) -> int:
+        """Number of listings clustered."""
+        return len(self._sets)
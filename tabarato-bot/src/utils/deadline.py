@@ -0,0 +1,59 @@
+"""
+Request deadlines for EconomiZap Bot.
+Propagates the time left for a user search down to the HTTP layer.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+import time
+
+# Absolute monotonic time by which the current search must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("search_deadline", default=None)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Get the time left before the current deadline.
+    
+    Returns:
+        Optional[float]: Seconds left (never negative), or None without a deadline
+    """
+    deadline = _deadline.get()
+    
+    if deadline is None:
+        return None
+    
+    return max(0.0, deadline - time.monotonic())
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Set a deadline for the code (and tasks created) inside the block.
+    
+    Nested scopes can only tighten the deadline, never extend it. Tasks
+    created inside the block copy the context and keep the deadline.
+    
+    Usage:
+        with deadline_scope(4.0):
+            task = asyncio.ensure_future(marketplace.search(query))
+    
+    Args:
+        seconds: Time budget in seconds (None or 0 leaves it unchanged)
+    """
+    if not seconds:
+        yield
+        return
+    
+    new_deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    
+    if current is not None:
+        new_deadline = min(new_deadline, current)
+    
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
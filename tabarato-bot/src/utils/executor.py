@@ -0,0 +1,297 @@
+"""
+CPU-bound work scheduling for EconomiZap Bot.
+Runs large pipeline stages in a process pool so the event loop stays responsive.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from src.utils.logger import get_logger
+from src.utils.metrics import MetricsRegistry, get_metrics
+from src.config import Config
+
+logger = get_logger(__name__)
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when the CPU executor queue is full."""
+    pass
+
+
+class CpuExecutor:
+    """
+    Runs CPU-bound pipeline stages (name grouping) off the event loop.
+    
+    Batches of at least ``inline_min_items`` items go to a process pool;
+    smaller ones run inline, where pickling would cost more than the
+    work. At most ``max_workers`` jobs are submitted to the pool at a
+    time and at most ``max_queued`` more wait for a slot; beyond that
+    ``run`` raises ExecutorBusyError. Cancelling a caller removes its job
+    from the queue, or from the pool if a worker has not picked it up
+    yet; a job already running finishes and its result is dropped.
+    
+    Offloaded functions and their arguments must be picklable (module
+    level functions, models and plain data).
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 2,
+        inline_min_items: int = 1000,
+        max_queued: int = 32,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Initialize the executor (the pool is created lazily).
+        
+        Args:
+            max_workers: Worker processes (0 runs everything inline)
+            inline_min_items: Batch size from which work is offloaded
+            max_queued: Jobs allowed to wait for a worker
+            metrics: Metrics registry (default: global registry)
+        """
+        self.max_workers = max_workers
+        self.inline_min_items = inline_min_items
+        self.max_queued = max_queued
+        self._metrics = metrics or get_metrics()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._queued = 0
+    
+    def offloads(self, items: int) -> bool:
+        """
+        Check if a batch of this size would run in the pool.
+        
+        Args:
+            items: Batch size
+            
+        Returns:
+            bool: True if the batch is offloaded
+        """
+        return self.max_workers > 0 and items >= self.inline_min_items
+    
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queued
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool, creating it if needed.
+        
+        The pool is created for the first offloaded batch, so a bot whose
+        batches all run inline never starts worker processes. Workers are
+        spawned rather than forked, so they do not inherit
+        the event loop, its threads or open connections.
+        
+        Returns:
+            ProcessPoolExecutor: Process pool
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            logger.info(f"CPU executor started ({self.max_workers} worker processes)")
+        return self._pool
+    
+    async def run(self, func: Callable[..., Any], *args: Any, items: int) -> Any:
+        """
+        Run a function inline or in the process pool, by batch size.
+        
+        Args:
+            func: Picklable function
+            *args: Picklable arguments
+            items: Size of the batch being processed
+            
+        Returns:
+            Any: Function result
+            
+        Raises:
+            ExecutorBusyError: If the queue is full
+        """
+        if not self.offloads(items):
+            self._metrics.increment("executor.inline")
+            return func(*args)
+        
+        if self._queued >= self.max_queued:
+            self._metrics.increment("executor.rejected")
+            raise ExecutorBusyError(f"CPU executor queue is full ({self._queued} jobs waiting)")
+        
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        
+        self._queued += 1
+        self._metrics.set_gauge("executor.queued", self._queued)
+        try:
+            await self._slots.acquire()
+        except asyncio.CancelledError:
+            self._metrics.increment("executor.cancelled")
+            raise
+        finally:
+            self._queued -= 1
+            self._metrics.set_gauge("executor.queued", self._queued)
+        
+        try:
+            self._metrics.observe("executor.queue_seconds", loop.time() - queued_at)
+            started_at = loop.time()
+            
+            try:
+                result = await loop.run_in_executor(self._get_pool(), functools.partial(func, *args))
+            except BrokenProcessPool:
+                # A worker died: shut the broken pool down (its other jobs
+                # fail too), replace it on the next run and do this job inline
+                logger.error("CPU executor pool broken, restarting it")
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = None
+                self._metrics.increment("executor.broken")
+                return func(*args)
+            
+            self._metrics.increment("executor.offloaded")
+            self._metrics.observe("executor.run_seconds", loop.time() - started_at)
+            return result
+        except asyncio.CancelledError:
+            self._metrics.increment("executor.cancelled")
+            raise
+        finally:
+            self._slots.release()
+    
+    def close(self) -> None:
+        """Stop the worker processes, cancelling jobs not started yet."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            logger.info("CPU executor stopped")
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag: how late a periodic wake-up runs.
+    
+    Lag is the time the loop spent unable to run ready callbacks, e.g.
+    while CPU-bound code ran inline. It is recorded in the
+    ``event_loop.lag_seconds`` summary and gauge, and logged as a warning
+    above ``warn_after`` seconds.
+    """
+    
+    def __init__(
+        self,
+        interval: float = 1.0,
+        warn_after: float = 0.25,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Initialize the monitor.
+        
+        Args:
+            interval: Seconds between measurements
+            warn_after: Lag in seconds that is logged as a warning
+            metrics: Metrics registry (default: global registry)
+        """
+        self.interval = interval
+        self.warn_after = warn_after
+        self._metrics = metrics or get_metrics()
+        self._task: Optional[asyncio.Task] = None
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+    
+    def start(self) -> None:
+        """Start measuring on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def _run(self) -> None:
+        """Measure lag until cancelled."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - expected))
+    
+    def record(self, lag: float) -> None:
+        """
+        Record a lag measurement.
+        
+        Args:
+            lag: Lag in seconds
+        """
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self._metrics.observe("event_loop.lag_seconds", lag)
+        self._metrics.set_gauge("event_loop.lag_seconds", lag)
+        
+        if lag >= self.warn_after:
+            logger.warning(f"Event loop lag: {lag * 1000:.0f}ms")
+    
+    async def stop(self) -> None:
+        """Stop measuring."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global instances
+_cpu_executor: Optional[CpuExecutor] = None
+_loop_lag_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_cpu_executor() -> CpuExecutor:
+    """
+    Get the global CPU executor.
+    
+    Returns:
+        CpuExecutor: Global CPU executor
+    """
+    global _cpu_executor
+    
+    if _cpu_executor is None:
+        _cpu_executor = CpuExecutor(
+            max_workers=Config.CPU_WORKERS,
+            inline_min_items=Config.CPU_OFFLOAD_MIN_ITEMS,
+            max_queued=Config.CPU_QUEUE_SIZE
+        )
+    
+    return _cpu_executor
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """
+    Get the global event loop lag monitor.
+    
+    Returns:
+        LoopLagMonitor: Global lag monitor
+    """
+    global _loop_lag_monitor
+    
+    if _loop_lag_monitor is None:
+        _loop_lag_monitor = LoopLagMonitor(
+            interval=Config.LOOP_LAG_INTERVAL,
+            warn_after=Config.LOOP_LAG_WARNING
+        )
+    
+    return _loop_lag_monitor
+
+
+def close_cpu_executor() -> None:
+    """
+    Stop the global CPU executor.
+    Call this at application shutdown.
+    """
+    global _cpu_executor
+    
+    if _cpu_executor:
+        _cpu_executor.close()
+        _cpu_executor = None
@@ -0,0 +1,146 @@
+"""
+JSON decoding for marketplace responses.
+Uses orjson or msgspec when installed, falling back to the standard library.
+"""
+
+from typing import Any, Callable, Dict, Optional
+import json
+
+from src.utils.logger import get_logger
+from src.config import Config
+
+logger = get_logger(__name__)
+
+# Optional fast decoders
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _available_backends() -> Dict[str, Callable[[bytes], Any]]:
+    """
+    Get the installed generic decoders, fastest first.
+    
+    Returns:
+        Dict: Backend name to loads function
+    """
+    backends: Dict[str, Callable[[bytes], Any]] = {}
+    
+    if orjson is not None:
+        backends["orjson"] = orjson.loads
+    if msgspec is not None:
+        backends["msgspec"] = msgspec.json.decode
+    backends["json"] = json.loads
+    
+    return backends
+
+
+class JsonDecoder:
+    """
+    Pluggable JSON decoder working on raw response bytes.
+    
+    Generic mode returns plain dicts and lists like ``json.loads``. Typed
+    mode takes a schema (a ``TypedDict`` describing only the fields we
+    read) and, when msgspec is installed, decodes straight into dicts that
+    contain just those fields: unknown keys and nested objects are skipped
+    without being materialized. Payloads that do not match the schema, or
+    environments without msgspec, fall back to generic decoding.
+    """
+    
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize the decoder.
+        
+        Args:
+            backend: "orjson", "msgspec", "json" or "auto" (default: JSON_BACKEND
+                setting; "auto" picks the fastest installed backend)
+                
+        Raises:
+            ValueError: If the requested backend is unknown or not installed
+        """
+        backends = _available_backends()
+        backend = (backend or Config.JSON_BACKEND).lower()
+        
+        if backend == "auto":
+            backend = next(iter(backends))
+        
+        if backend not in backends:
+            raise ValueError(
+                f"JSON backend '{backend}' is not available "
+                f"(installed: {', '.join(backends)})"
+            )
+        
+        self.backend = backend
+        self._loads = backends[backend]
+        self._typed_decoders: Dict[Any, Any] = {}
+        
+        logger.debug(f"JSON decoder using {backend}")
+    
+    @property
+    def supports_schemas(self) -> bool:
+        """Check if typed decoding is available (requires msgspec)."""
+        return msgspec is not None
+    
+    def decode(self, data: bytes, schema: Optional[Any] = None) -> Any:
+        """
+        Decode a JSON document.
+        
+        Args:
+            data: Raw JSON bytes
+            schema: Optional type (e.g. a TypedDict) listing the fields to keep
+            
+        Returns:
+            Any: Decoded document
+            
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        if schema is not None and msgspec is not None:
+            try:
+                return self._typed_decoder(schema).decode(data)
+            except msgspec.ValidationError as e:
+                logger.debug(f"Response does not match {getattr(schema, '__name__', schema)}: {e}")
+        
+        return self._loads(data)
+    
+    def _typed_decoder(self, schema: Any) -> Any:
+        """
+        Get (and cache) the msgspec decoder for a schema.
+        
+        Args:
+            schema: Target type
+            
+        Returns:
+            msgspec.json.Decoder: Decoder for the schema
+        """
+        decoder = self._typed_decoders.get(schema)
+        
+        if decoder is None:
+            decoder = self._typed_decoders[schema] = msgspec.json.Decoder(schema)
+        
+        return decoder
+
+
+# Global JSON decoder instance
+_json_decoder: Optional[JsonDecoder] = None
+
+
+def get_json_decoder() -> JsonDecoder:
+    """
+    Get the global JSON decoder.
+    
+    Returns:
+        JsonDecoder: Global JSON decoder
+    """
+    global _json_decoder
+    
+    if _json_decoder is None:
+        _json_decoder = JsonDecoder()
+    
+    return _json_decoder
@@ -0,0 +1,160 @@
+"""
+In-process metrics for EconomiZap Bot.
+Collects counters, gauges and timing summaries for logs and admin stats.
+"""
+
+from typing import Any, Dict, Optional
+import re
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Summary:
+    """Running summary of observed values."""
+    
+    def __init__(self):
+        """Initialize an empty summary."""
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+    
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+        
+        Args:
+            value: Observed value
+        """
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+    
+    @property
+    def mean(self) -> float:
+        """Mean of observed values (0.0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsRegistry:
+    """
+    Registry of named counters, gauges and summaries.
+    
+    Metric names are dotted strings such as
+    ``circuit_breaker.mercado_livre.state``.
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.summaries: Dict[str, Summary] = {}
+    
+    def increment(self, name: str, value: float = 1.0) -> None:
+        """
+        Increment a counter.
+        
+        Args:
+            name: Metric name
+            value: Amount to add
+        """
+        self.counters[name] = self.counters.get(name, 0.0) + value
+    
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Set a gauge to a value.
+        
+        Args:
+            name: Metric name
+            value: Current value
+        """
+        self.gauges[name] = value
+    
+    def observe(self, name: str, value: float) -> None:
+        """
+        Record a value in a summary (e.g. a duration in seconds).
+        
+        Args:
+            name: Metric name
+            value: Observed value
+        """
+        summary = self.summaries.get(name)
+        if summary is None:
+            summary = self.summaries[name] = Summary()
+        summary.observe(value)
+    
+    def get(self, name: str) -> Optional[float]:
+        """
+        Get the current value of a counter or gauge.
+        
+        Args:
+            name: Metric name
+            
+        Returns:
+            Optional[float]: Value, or None if never recorded
+        """
+        if name in self.counters:
+            return self.counters[name]
+        return self.gauges.get(name)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a copy of all metrics.
+        
+        Returns:
+            Dict: Counters, gauges and summaries
+        """
+        return {
+            'counters': dict(self.counters),
+            'gauges': dict(self.gauges),
+            'summaries': {
+                name: {
+                    'count': s.count,
+                    'mean': s.mean,
+                    'max': s.maximum
+                }
+                for name, s in self.summaries.items()
+            }
+        }
+    
+    def reset(self) -> None:
+        """Clear all metrics."""
+        self.counters.clear()
+        self.gauges.clear()
+        self.summaries.clear()
+
+
+def metric_name(*parts: str) -> str:
+    """
+    Build a dotted metric name from free-form parts.
+    
+    Args:
+        parts: Name parts (e.g. "circuit_breaker", "Mercado Livre")
+        
+    Returns:
+        str: Metric name (e.g. "circuit_breaker.mercado_livre")
+    """
+    return ".".join(
+        re.sub(r'[^a-z0-9]+', '_', part.lower()).strip('_')
+        for part in parts
+    )
+
+
+# Global metrics registry
+_metrics: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Get the global metrics registry.
+    
+    Returns:
+        MetricsRegistry: Global metrics registry
+    """
+    global _metrics
+    
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    
+    return _metrics
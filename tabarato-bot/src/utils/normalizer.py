@@ -3,15 +3,58 @@ Text normalization utilities for product comparison.
 Normalizes product names to enable similarity matching.
 """
 
+import math
 import re
 import unicodedata
-from typing import List, Set
-from fuzzywuzzy import fuzz
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
 
+from src.utils import similarity, specs as spec_extractor
+from src.utils.executor import ExecutorBusyError, get_cpu_executor
 from src.utils.logger import get_logger
+from src.config import Config
 
 logger = get_logger(__name__)
 
+# Characters that are not letters, digits or whitespace after accent removal
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
+# Tokens that describe specs rather than the model (e.g. "8gb", "i5", "110v")
+_SPEC_TOKEN_RE = re.compile(r'^(\d+(gb|tb|mb|mp|mah|w|v|l|hz)|i[3579])$')
+
+# Model tokens kept after the brand in a fingerprint
+_MODEL_TOKENS = 2
+
+
+def _strip_marks(text: str) -> str:
+    """Decompose text (NFD) and drop combining marks (category Mn)."""
+    return ''.join(
+        char for char in unicodedata.normalize('NFD', text)
+        if unicodedata.category(char) != 'Mn'
+    )
+
+
+def _build_accent_table() -> dict:
+    """
+    Build a str.translate table that strips accents from Latin letters.
+    
+    Covers Latin-1 Supplement, Latin Extended-A/B and the combining
+    diacritical marks, mapping each character to what the NFD path
+    produces for it.
+    """
+    table = {}
+    
+    for code in list(range(0xC0, 0x250)) + list(range(0x300, 0x370)):
+        char = chr(code)
+        stripped = _strip_marks(char)
+        if stripped != char:
+            table[code] = stripped
+    
+    return table
+
+
+_ACCENT_TABLE = _build_accent_table()
+
 
 class ProductNormalizer:
     """
@@ -48,6 +91,9 @@ class ProductNormalizer:
         """
         Normalize text for comparison.
         
+        Results are memoized (bounded LRU), since the same product names
+        and queries are normalized over and over.
+        
         Args:
             text: Text to normalize
             
@@ -57,6 +103,32 @@ class ProductNormalizer:
         if not text:
             return ""
         
+        return _normalize_cached(text)
+    
+    @staticmethod
+    def normalize_batch(texts: Iterable[str]) -> List[str]:
+        """
+        Normalize many texts once, for reuse across comparisons.
+        
+        Args:
+            texts: Texts to normalize
+            
+        Returns:
+            List[str]: Normalized texts (same order)
+        """
+        return [ProductNormalizer.normalize_text(text) for text in texts]
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Normalize text without memoization.
+        
+        Args:
+            text: Text to normalize
+            
+        Returns:
+            str: Normalized text
+        """
         # Convert to lowercase
         normalized = text.lower()
         
@@ -64,7 +136,7 @@ class ProductNormalizer:
         normalized = ProductNormalizer._remove_accents(normalized)
         
         # Remove special characters (keep letters, numbers, spaces)
-        normalized = re.sub(r'[^a-z0-9\s]', ' ', normalized)
+        normalized = _NON_ALNUM_RE.sub(' ', normalized)
         
         # Remove extra whitespace
         normalized = ' '.join(normalized.split())
@@ -76,22 +148,24 @@ class ProductNormalizer:
         """
         Remove accents from text.
         
+        Latin accents are stripped with a translation table; only text
+        that still has other non-ASCII characters goes through NFD.
+        
         Args:
             text: Text with accents
             
         Returns:
             str: Text without accents
         """
-        # Normalize to NFD (decomposed form)
-        nfd = unicodedata.normalize('NFD', text)
+        if text.isascii():
+            return text
         
-        # Filter out combining characters (accents)
-        without_accents = ''.join(
-            char for char in nfd
-            if unicodedata.category(char) != 'Mn'
-        )
+        without_accents = text.translate(_ACCENT_TABLE)
+        
+        if without_accents.isascii():
+            return without_accents
         
-        return without_accents
+        return _strip_marks(without_accents)
     
     @staticmethod
     def extract_keywords(text: str, min_length: int = 2) -> List[str]:
@@ -137,11 +211,23 @@ class ProductNormalizer:
         norm1 = ProductNormalizer.normalize_text(text1)
         norm2 = ProductNormalizer.normalize_text(text2)
         
+        return ProductNormalizer.normalized_similarity(norm1, norm2)
+    
+    @staticmethod
+    def normalized_similarity(norm1: str, norm2: str) -> float:
+        """
+        Calculate similarity between two already normalized texts.
+        
+        Args:
+            norm1: First text (from normalize_text or normalize_batch)
+            norm2: Second text
+            
+        Returns:
+            float: Similarity percentage (0-100)
+        """
         # Calculate token sort ratio (best for product names)
         # This handles word order differences
-        similarity = fuzz.token_sort_ratio(norm1, norm2)
-        
-        return float(similarity)
+        return similarity.score(norm1, norm2)
     
     @staticmethod
     def are_similar(
@@ -168,36 +254,28 @@ class ProductNormalizer:
         """
         Extract common specifications from product name.
         
+        See ``specs.extract_specs`` for the keys and value formats.
+        
         Args:
             text: Product name
             
         Returns:
             dict: Extracted specifications
         """
-        specs = {}
-        normalized = ProductNormalizer.normalize_text(text)
-        
-        # Extract RAM (e.g., "8gb", "16gb")
-        ram_match = re.search(r'(\d+)\s*gb(?:\s+ram)?', normalized)
-        if ram_match:
-            specs['ram'] = f"{ram_match.group(1)}gb"
-        
-        # Extract storage (e.g., "256gb ssd", "1tb")
-        storage_match = re.search(r'(\d+)\s*(gb|tb)(?:\s+ssd|\s+hdd)?', normalized)
-        if storage_match:
-            specs['storage'] = f"{storage_match.group(1)}{storage_match.group(2)}"
-        
-        # Extract processor (e.g., "i5", "i7", "ryzen 5")
-        processor_match = re.search(r'(i[3579]|ryzen\s*[3579]|core\s*[3579])', normalized)
-        if processor_match:
-            specs['processor'] = processor_match.group(1).replace(' ', '')
-        
-        # Extract screen size (e.g., "15.6", "13.3")
-        screen_match = re.search(r'(\d+\.?\d*)\s*(?:polegadas|pol|")', normalized)
-        if screen_match:
-            specs['screen'] = f"{screen_match.group(1)}in"
+        return spec_extractor.extract_specs(text)
+    
+    @staticmethod
+    def extract_specs_batch(texts: Iterable[str]) -> List[dict]:
+        """
+        Extract specifications from many product names.
         
-        return specs
+        Args:
+            texts: Product names
+            
+        Returns:
+            List[dict]: Extracted specifications (same order)
+        """
+        return spec_extractor.extract_specs_batch(texts)
     
     @staticmethod
     def normalize_brand(text: str) -> str:
@@ -217,49 +295,256 @@ class ProductNormalizer:
                 return full_name
         
         return normalized
+    
+    @staticmethod
+    def fingerprint(text: str) -> Optional[str]:
+        """
+        Build a canonical fingerprint of a product name.
+        
+        Combines the brand (``normalize_brand``), the model tokens that
+        follow the brand (up to two, ignoring stop words and spec tokens)
+        and the extracted specs except color, so the same product listed with different
+        titles on different marketplaces gets the same fingerprint.
+        
+        Args:
+            text: Product name
+            
+        Returns:
+            Optional[str]: Fingerprint (e.g. "acer|nitro 5|processor=i5,ram=8gb"),
+            or None if no known brand or model is found
+        """
+        brand = ProductNormalizer.normalize_brand(text)
+        if brand not in _KNOWN_BRANDS:
+            return None
+        
+        tokens = ProductNormalizer.normalize_text(text).split()
+        
+        # Position of the token naming the brand (e.g. "moto" for motorola);
+        # a name that is only the full brand ("hewlett packard") has none
+        position = next((
+            i for i, token in enumerate(tokens)
+            if ProductNormalizer.BRAND_NORMALIZATIONS.get(token) == brand
+        ), None)
+        if position is None:
+            return None
+        
+        model = []
+        for token in tokens[position + 1:]:
+            if token in ProductNormalizer.STOP_WORDS or _SPEC_TOKEN_RE.match(token):
+                break
+            model.append(token)
+            if len(model) == _MODEL_TOKENS:
+                break
+        
+        if not model:
+            return None
+        
+        # Color variants of a product share its fingerprint
+        specs = ProductNormalizer.extract_specs(text)
+        spec_part = ','.join(
+            f"{key}={value}" for key, value in sorted(specs.items())
+            if key != spec_extractor.COLOR
+        )
+        
+        return f"{brand}|{' '.join(model)}|{spec_part}"
 
 
-def group_similar_products(products: List, threshold: float = 70.0) -> List[List]:
+# Brands a fingerprint can be built for
+_KNOWN_BRANDS = set(ProductNormalizer.BRAND_NORMALIZATIONS.values())
+
+# Memoized normalization shared by every caller
+_normalize_cached = lru_cache(maxsize=Config.NORMALIZE_CACHE_SIZE)(ProductNormalizer._normalize)
+
+
+def similarity_candidates(
+    names: List[str],
+    threshold: float,
+    min_token_overlap: float = 0.4
+) -> List[List[int]]:
     """
-    Group similar products together.
+    Find the pairs of normalized names worth scoring.
+    
+    Prefix filtering over an inverted token index: the tokens of each
+    name are ordered from rarest to most common in the batch, and a name
+    is indexed under its rarest ``len - ceil(min_token_overlap * len) + 1``
+    tokens. Names sharing at least that fraction of tokens are guaranteed
+    to share an indexed token, while tokens common to the whole batch
+    (e.g. the search query) rarely generate pairs. Pairs whose lengths
+    alone rule out reaching ``threshold`` with ``token_sort_ratio`` are
+    dropped.
     
     Args:
-        products: List of Product objects
+        names: Normalized names (from normalize_batch)
         threshold: Similarity threshold (0-100)
+        min_token_overlap: Token overlap a similar pair is assumed to have
         
     Returns:
-        List[List]: List of product groups
+        List[List[int]]: For each name, the later names to compare it with
     """
-    if not products:
+    token_sets = [set(name.split()) for name in names]
+    
+    frequency: Dict[str, int] = {}
+    for tokens in token_sets:
+        for token in tokens:
+            frequency[token] = frequency.get(token, 0) + 1
+    
+    # Index each name under its rarest tokens
+    index: Dict[str, List[int]] = {}
+    prefixes = []
+    
+    for i, tokens in enumerate(token_sets):
+        ordered = sorted(tokens, key=lambda t: (frequency[t], t))
+        prefix = ordered[:len(ordered) - math.ceil(min_token_overlap * len(ordered)) + 1]
+        prefixes.append(prefix)
+        for token in prefix:
+            index.setdefault(token, []).append(i)
+    
+    lengths = [len(name) for name in names]
+    candidates = []
+    
+    for i, prefix in enumerate(prefixes):
+        found = set()
+        for token in prefix:
+            found.update(j for j in index[token] if j > i)
+        
+        # token_sort_ratio <= 2 * min(len) / (len1 + len2)
+        candidates.append([
+            j for j in sorted(found)
+            if round(200 * min(lengths[i], lengths[j]) / (lengths[i] + lengths[j])) >= threshold
+        ])
+    
+    return candidates
+
+
+def group_similar_names(names: List[str], threshold: float = 70.0) -> List[List[int]]:
+    """
+    Group similar product names together.
+    
+    Each name not yet grouped starts a group with every later ungrouped
+    name similar to it. Large batches only score the candidate pairs
+    from ``similarity_candidates``; small ones compare every pair. With
+    rapidfuzz, names are scored in batch instead
+    (``similarity.greedy_groups``), which makes the candidates
+    unnecessary; fuzzywuzzy scores pair by pair.
+    
+    Takes and returns plain data so it can run in a worker process.
+    
+    Args:
+        names: Product names
+        threshold: Similarity threshold (0-100)
+        
+    Returns:
+        List[List[int]]: Groups as indexes into names, in order
+    """
+    if not names:
         return []
     
+    # Normalize every name once instead of once per comparison
+    names = ProductNormalizer.normalize_batch(names)
+    
+    if similarity.is_native():
+        # Batch scoring with rapidfuzz (fast enough without candidates)
+        return similarity.greedy_groups(names, threshold)
+    
+    if threshold > 0 and len(names) >= Config.GROUPING_BLOCKING_MIN_PRODUCTS:
+        candidates = similarity_candidates(names, threshold, Config.GROUPING_MIN_TOKEN_OVERLAP)
+    else:
+        candidates = [range(i + 1, len(names)) for i in range(len(names))]
+    
     groups = []
     used_indices = set()
     
-    for i, product1 in enumerate(products):
+    for i in range(len(names)):
         if i in used_indices:
             continue
         
         # Start a new group
-        group = [product1]
+        group = [i]
         used_indices.add(i)
         
-        # Find similar products
-        for j, product2 in enumerate(products):
-            if j <= i or j in used_indices:
+        # Find similar names
+        for j in candidates[i]:
+            if j in used_indices:
                 continue
             
             # Check similarity
-            if ProductNormalizer.are_similar(
-                product1.name,
-                product2.name,
-                threshold
-            ):
-                group.append(product2)
+            if ProductNormalizer.normalized_similarity(names[i], names[j]) >= threshold:
+                group.append(j)
                 used_indices.add(j)
         
         groups.append(group)
     
+    return groups
+
+
+async def group_similar_names_async(names: List[str], threshold: float = 70.0) -> List[List[int]]:
+    """
+    Group similar product names without blocking the event loop.
+    
+    Batches large enough for the CPU executor are grouped in a worker
+    process; smaller ones are grouped inline. Falls back to inline
+    grouping when the executor queue is full.
+    
+    Args:
+        names: Product names
+        threshold: Similarity threshold (0-100)
+        
+    Returns:
+        List[List[int]]: Groups as indexes into names, in order
+    """
+    try:
+        return await get_cpu_executor().run(group_similar_names, names, threshold, items=len(names))
+    except ExecutorBusyError as e:
+        logger.warning(f"{e}, grouping inline")
+        return group_similar_names(names, threshold)
+
+
+def group_similar_products(products: List, threshold: float = 70.0) -> List[List]:
+    """
+    Group similar products together (see ``group_similar_names``).
+    
+    Args:
+        products: List of Product objects
+        threshold: Similarity threshold (0-100)
+        
+    Returns:
+        List[List]: List of product groups
+    """
+    if not products:
+        return []
+    
+    groups = [
+        [products[i] for i in group]
+        for group in group_similar_names([p.name for p in products], threshold)
+    ]
+    
+    logger.info(f"Grouped {len(products)} products into {len(groups)} groups")
+    
+    return groups
+
+
+async def group_similar_products_async(products: List, threshold: float = 70.0) -> List[List]:
+    """
+    Group similar products without blocking the event loop.
+    
+    See ``group_similar_names_async`` (only the names are sent to a
+    worker process).
+    
+    Args:
+        products: List of Product objects
+        threshold: Similarity threshold (0-100)
+        
+    Returns:
+        List[List]: List of product groups
+    """
+    if not products:
+        return []
+    
+    groups = [
+        [products[i] for i in group]
+        for group in await group_similar_names_async([p.name for p in products], threshold)
+    ]
+    
     logger.info(f"Grouped {len(products)} products into {len(groups)} groups")
     
     return groups
@@ -0,0 +1,146 @@
+"""
+Prefix index for EconomiZap Bot.
+Finds the most popular known queries starting with what a user typed.
+"""
+
+import bisect
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sorts after every character, so [prefix, prefix + _MAX_CHAR) covers
+# every key starting with prefix
+_MAX_CHAR = "\U0010ffff"
+
+
+class PrefixIndex:
+    """
+    Size-bounded index of scored keys, searchable by prefix.
+    
+    Keys are kept in one sorted list, so the keys starting with a prefix
+    are a contiguous slice found with two binary searches; the slice is
+    then ranked by score. Beyond ``max_entries`` keys the lowest scored
+    one is dropped, and keys longer than ``max_key_length`` are not
+    indexed, which bounds memory to roughly
+    ``max_entries * max_key_length`` characters.
+    """
+    
+    def __init__(self, max_entries: int = 5000, max_key_length: int = 100):
+        """
+        Initialize an empty index.
+        
+        Args:
+            max_entries: Maximum number of keys kept
+            max_key_length: Longest key indexed
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        
+        self.max_entries = max_entries
+        self.max_key_length = max_key_length
+        self._keys: List[str] = []
+        self._scores: Dict[str, float] = {}
+        
+        # Counters
+        self.evictions = 0
+    
+    def add(self, key: str, score: float = 1.0) -> bool:
+        """
+        Add a key, or raise the score of a known key.
+        
+        Args:
+            key: Key (e.g. a canonical query)
+            score: Popularity; a known key keeps the higher score
+            
+        Returns:
+            bool: True if the key is indexed
+        """
+        if not key or len(key) > self.max_key_length:
+            return False
+        
+        if key in self._scores:
+            self._scores[key] = max(self._scores[key], score)
+            return True
+        
+        bisect.insort(self._keys, key)
+        self._scores[key] = score
+        
+        if len(self._keys) > self.max_entries:
+            self._evict()
+        
+        return key in self._scores
+    
+    def update(self, items: Iterable[Tuple[str, float]]) -> None:
+        """
+        Add many (key, score) pairs, sorting once.
+        
+        Args:
+            items: Keys and scores
+        """
+        for key, score in items:
+            if key and len(key) <= self.max_key_length:
+                self._scores[key] = max(self._scores.get(key, score), score)
+        
+        # Keep the best scored keys
+        if len(self._scores) > self.max_entries:
+            kept = heapq.nlargest(self.max_entries, self._scores.items(), key=lambda item: item[1])
+            self.evictions += len(self._scores) - self.max_entries
+            self._scores = dict(kept)
+        
+        self._keys = sorted(self._scores)
+    
+    def _evict(self) -> None:
+        """Drop the lowest scored key."""
+        key = min(self._scores, key=self._scores.__getitem__)
+        del self._scores[key]
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        self.evictions += 1
+        logger.debug(f"Prefix index evicted: {key}")
+    
+    def search(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Get the best scored keys starting with a prefix.
+        
+        Args:
+            prefix: Key prefix
+            limit: Maximum number of keys returned
+            
+        Returns:
+            List[str]: Keys, the prefix itself first if indexed, then by
+            score (ties in key order)
+        """
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_left(self._keys, prefix + _MAX_CHAR, lo)
+        
+        return heapq.nsmallest(
+            limit,
+            self._keys[lo:hi],
+            key=lambda key: (key != prefix, -self._scores[key], key)
+        )
+    
+    def remove(self, key: str) -> bool:
+        """
+        Remove a key.
+        
+        Args:
+            key: Key
+            
+        Returns:
+            bool: True if the key was indexed
+        """
+        if self._scores.pop(key, None) is None:
+            return False
+        
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        return True
+    
+    def __contains__(self, key: str) -> bool:
+        """Check if a key is indexed."""
+        return key in self._scores
+    
+    def __len__(self) -> int:
+        """Number of indexed keys."""
+        return len(self._keys)
@@ -0,0 +1,191 @@
+"""
+Batch similarity scoring for product names.
+Uses rapidfuzz when installed, falling back to fuzzywuzzy.
+"""
+
+import os
+from difflib import SequenceMatcher
+from typing import Iterable, List, Optional, Sequence
+
+from fuzzywuzzy import fuzz
+
+from src.utils.logger import get_logger
+from src.config import Config
+
+logger = get_logger(__name__)
+
+# Optional native scorer (computes whole score matrices, releasing the GIL)
+try:
+    import numpy as np
+    from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+except ImportError:
+    rapid_fuzz = rapid_process = None
+
+
+def is_native() -> bool:
+    """Check if the rapidfuzz backend is available."""
+    return rapid_process is not None
+
+
+def sort_tokens(names: Iterable[str]) -> List[str]:
+    """
+    Sort the tokens of normalized names once.
+    
+    ``token_sort_ratio`` is the plain ratio of the sorted-token strings,
+    so sorting up front avoids re-sorting for every pair.
+    
+    Args:
+        names: Normalized names
+        
+    Returns:
+        List[str]: Names with their tokens sorted
+    """
+    return [' '.join(sorted(name.split())) for name in names]
+
+
+def score(norm1: str, norm2: str) -> float:
+    """
+    Token sort ratio of two normalized names.
+    
+    Both backends return the score rounded to an integer. rapidfuzz
+    computes the exact indel ratio (what fuzzywuzzy returns with
+    python-Levenshtein); the pure-Python fuzzywuzzy fallback can score
+    some pairs slightly lower.
+    
+    Args:
+        norm1: First normalized name
+        norm2: Second normalized name
+        
+    Returns:
+        float: Similarity percentage (0-100)
+    """
+    if rapid_fuzz is not None:
+        return float(round(rapid_fuzz.token_sort_ratio(norm1, norm2)))
+    
+    return float(fuzz.token_sort_ratio(norm1, norm2))
+
+
+def first_match(query: str, choices: Sequence[str], threshold: float) -> Optional[int]:
+    """
+    Find the first choice similar to a query.
+    
+    Like ``greedy_groups``, the earliest similar choice wins rather than
+    the most similar one. Names must have their tokens sorted (see
+    ``sort_tokens``). With rapidfuzz all choices are scored in one call;
+    otherwise they are scored one by one until a match, skipping those
+    whose length or characters alone rule out the threshold.
+    
+    Args:
+        query: Normalized name with sorted tokens
+        choices: Normalized names with sorted tokens
+        threshold: Similarity threshold (0-100)
+        
+    Returns:
+        Optional[int]: Index of the first similar choice, or None
+    """
+    if not choices:
+        return None
+    
+    if rapid_process is not None:
+        # Scores are rounded like fuzzywuzzy before comparing with the threshold
+        scores = rapid_process.cdist(
+            [query],
+            choices,
+            scorer=rapid_fuzz.ratio,
+            score_cutoff=max(0.0, threshold - 0.5)
+        )[0]
+        hits = np.flatnonzero(np.round(scores) >= threshold)
+        return int(hits[0]) if hits.size else None
+    
+    # Scored as fuzz.ratio(choice, query); the query side is indexed once
+    matcher = SequenceMatcher(None)
+    matcher.set_seq2(query)
+    
+    for i, choice in enumerate(choices):
+        # token_sort_ratio <= 2 * min(len) / (len1 + len2)
+        if round(200 * min(len(query), len(choice)) / (len(query) + len(choice))) < threshold:
+            continue
+        
+        # quick_ratio bounds ratio from above at a fraction of the cost
+        matcher.set_seq1(choice)
+        if round(100 * matcher.quick_ratio()) < threshold:
+            continue
+        
+        if round(100 * matcher.ratio()) >= threshold:
+            return i
+    
+    return None
+
+
+def greedy_groups(
+    names: Sequence[str],
+    threshold: float,
+    workers: Optional[int] = None
+) -> List[List[int]]:
+    """
+    Group normalized names like ``group_similar_products``.
+    
+    Each name not yet grouped starts a group with every later ungrouped
+    name at least ``threshold`` similar to it. Instead of one Python call
+    per pair, the next ungrouped names are scored against all remaining
+    ones with a single ``cdist`` call (one row per name, spread across
+    ``workers`` threads with the GIL released), so names already grouped
+    are never scored. Requires rapidfuzz (see ``is_native``).
+    
+    Args:
+        names: Normalized names
+        threshold: Similarity threshold (0-100)
+        workers: Scoring threads (-1 = all cores, default: config)
+        
+    Returns:
+        List[List[int]]: Groups as indexes into names, in order
+    """
+    if rapid_process is None:
+        raise RuntimeError("rapidfuzz is required for batch similarity")
+    
+    workers = Config.SIMILARITY_WORKERS if workers is None else workers
+    threads = (os.cpu_count() or 1) if workers < 0 else max(workers, 1)
+    
+    # Rows scored per call: one per thread keeps every core busy, while a
+    # single thread scores one row at a time and never wastes a row on a
+    # name grouped by the row before it
+    rows_per_call = 1 if threads == 1 else 4 * threads
+    
+    choices = np.array(sort_tokens(names), dtype=object)
+    ungrouped = np.ones(len(names), dtype=bool)
+    
+    # Scores are rounded like fuzzywuzzy before comparing with the threshold
+    cutoff = max(0.0, threshold - 0.5)
+    groups: List[List[int]] = []
+    
+    for start in range(len(names)):
+        if not ungrouped[start]:
+            continue
+        
+        # The next ungrouped names, scored against every later ungrouped one
+        queries = np.flatnonzero(ungrouped[start:])[:rows_per_call] + start
+        columns = np.flatnonzero(ungrouped[start + 1:]) + start + 1
+        
+        if columns.size:
+            scores = rapid_process.cdist(
+                choices[queries],
+                choices[columns],
+                scorer=rapid_fuzz.ratio,
+                score_cutoff=cutoff,
+                workers=threads
+            )
+            similar = np.round(scores) >= threshold
+        
+        for row, i in enumerate(queries.tolist()):
+            if not ungrouped[i]:
+                continue
+            ungrouped[i] = False
+            
+            group = [i]
+            if columns.size:
+                hits = columns[similar[row] & ungrouped[columns] & (columns > i)]
+                ungrouped[hits] = False
+                group.extend(hits.tolist())
+            groups.append(group)
+    
+    return groups
@@ -0,0 +1,172 @@
+"""
+Request coalescing utilities for EconomiZap Bot.
+Lets concurrent identical calls share one underlying execution (and its
+intermediate results).
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share the same key.
+    
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task. Each waiter is shielded, so cancelling
+    one caller never cancels the shared work for the others.
+    """
+    
+    def __init__(self):
+        """Initialize the in-flight map."""
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        
+        # Counters
+        self.started = 0
+        self.coalesced = 0
+    
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run func for key, or join the call already in flight.
+        
+        Args:
+            key: Key identifying equivalent calls
+            func: Factory returning the coroutine to run
+            
+        Returns:
+            Any: Result of the shared call
+            
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        return await asyncio.shield(self.start(key, func))
+    
+    def start(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """
+        Start func for key without waiting, or get the call already in flight.
+        
+        The call is in flight as soon as this returns, so later calls
+        for the key join it.
+        
+        Args:
+            key: Key identifying equivalent calls
+            func: Factory returning the coroutine to run
+            
+        Returns:
+            asyncio.Task: Shared call
+        """
+        task = self._in_flight.get(key)
+        
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joined in-flight call: {key}")
+        
+        return task
+    
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """
+        Drop a finished task from the in-flight map.
+        
+        Args:
+            key: Key of the finished call
+            task: Finished task
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        
+        # Mark the exception as retrieved even if every waiter went away
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"In-flight call failed: {key} - {task.exception()}")
+    
+    def is_in_flight(self, key: Hashable) -> bool:
+        """
+        Check if a call for key is currently running.
+        
+        Args:
+            key: Call key
+            
+        Returns:
+            bool: True if in flight
+        """
+        return key in self._in_flight
+    
+    def __len__(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._in_flight)
+
+
+class Broadcast:
+    """
+    Append-only stream of items shared by any number of subscribers.
+    
+    A producer publishes items and closes the stream; each subscriber
+    gets every item from the first one, including those published before
+    it subscribed, so late joiners of a shared call miss nothing.
+    """
+    
+    def __init__(self):
+        """Initialize an open, empty stream."""
+        self._items: List[Any] = []
+        self._closed = False
+        self._changed = asyncio.Event()
+    
+    def publish(self, item: Any) -> None:
+        """
+        Append an item and wake the subscribers.
+        
+        Args:
+            item: Item to publish
+        """
+        self._items.append(item)
+        self._wake()
+    
+    def close(self) -> None:
+        """End the stream (subscribers finish after the last item)."""
+        self._closed = True
+        self._wake()
+    
+    def _wake(self) -> None:
+        """Wake everyone waiting for a change."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+    
+    @property
+    def closed(self) -> bool:
+        """Check if the stream has ended."""
+        return self._closed
+    
+    async def subscribe(self) -> AsyncIterator[Any]:
+        """
+        Iterate over every item, waiting for new ones until closed.
+        
+        Yields:
+            Any: Published items in order
+        """
+        position = 0
+        
+        while True:
+            while position < len(self._items):
+                yield self._items[position]
+                position += 1
+            
+            if self._closed:
+                return
+            
+            await self._changed.wait()
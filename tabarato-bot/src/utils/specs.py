@@ -0,0 +1,230 @@
+"""
+Specification extraction for product titles.
+Tokenizes each title once with a precompiled pattern and applies table-driven rules.
+"""
+
+import re
+from typing import Dict, Iterable, List
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Spec keys
+RAM = 'ram'
+STORAGE = 'storage'
+PROCESSOR = 'processor'
+SCREEN = 'screen'
+COLOR = 'color'
+CAPACITY = 'capacity'
+
+# Color names and their canonical form (titles are lowercased, not unaccented)
+COLORS = {
+    'preto': 'preto', 'preta': 'preto', 'black': 'preto',
+    'branco': 'branco', 'branca': 'branco', 'white': 'branco',
+    'azul': 'azul', 'blue': 'azul',
+    'vermelho': 'vermelho', 'vermelha': 'vermelho', 'red': 'vermelho',
+    'verde': 'verde', 'green': 'verde',
+    'rosa': 'rosa', 'pink': 'rosa',
+    'roxo': 'roxo', 'roxa': 'roxo', 'lilas': 'roxo', 'lilás': 'roxo',
+    'amarelo': 'amarelo', 'amarela': 'amarelo',
+    'laranja': 'laranja',
+    'cinza': 'cinza', 'grafite': 'cinza', 'gray': 'cinza', 'grey': 'cinza',
+    'prata': 'prata', 'prateado': 'prata', 'silver': 'prata',
+    'dourado': 'dourado', 'dourada': 'dourado', 'gold': 'dourado',
+    'bege': 'bege',
+    'marrom': 'marrom',
+}
+
+# Bare sizes (no "ram"/"ssd" next to them) from this many GB are storage
+STORAGE_MIN_GB = 64
+
+# Titles are split into words (letters then digits, e.g. "i5", "ddr4"),
+# numbers and inch marks, so "512gb" gives "512", "gb"
+_TOKEN_RE = re.compile(r'[a-zà-ÿ][a-zà-ÿ0-9]*|[0-9]+(?:[.,][0-9]+)?|"|\'\'')
+
+_DIGITS = set('0123456789')
+_SIZE_UNITS = {'gb', 'tb'}
+
+# Tokens that trigger a rule, by rule: units (applied to the number
+# before them), colors and processor names; any other token is skipped
+_RULES = {
+    'gb': 'size', 'tb': 'size',
+    '"': 'screen', "''": 'screen', 'pol': 'screen', 'polegada': 'screen',
+    'polegadas': 'screen', 'inch': 'screen',
+    'l': 'liters', 'litro': 'liters', 'litros': 'liters',
+    'mah': 'mah',
+    'i3': 'intel', 'i5': 'intel', 'i7': 'intel', 'i9': 'intel',
+    'core': 'core', 'core3': 'core', 'core5': 'core', 'core7': 'core', 'core9': 'core',
+    'ryzen': 'ryzen', 'ryzen3': 'ryzen', 'ryzen5': 'ryzen', 'ryzen7': 'ryzen', 'ryzen9': 'ryzen',
+    'm1': 'apple', 'm2': 'apple', 'm3': 'apple', 'm4': 'apple',
+    **{color: 'color' for color in COLORS},
+}
+
+# Words next to a size that tell RAM from storage
+_RAM_WORDS = {'ram', 'memoria', 'memória'}
+_RAM_PREFIXES = ('ddr', 'lpddr')
+_STORAGE_WORDS = {'ssd', 'hdd', 'hd', 'nvme', 'emmc', 'armazenamento', 'interno', 'rom'}
+_STORAGE_DEVICES = {'sd', 'microsd', 'pendrive', 'drive'}
+
+# Series numbers after "ryzen" and "core" (Intel Core 5/7/9)
+_SERIES = {'3', '5', '7', '9'}
+_APPLE_PREFIXES = {'apple', 'chip', 'air', 'pro'}
+
+
+def extract_specs(title: str) -> Dict[str, str]:
+    """
+    Extract specifications from a product title in one scan.
+    
+    The title is tokenized with a single precompiled pattern and each
+    token is looked up in a table of rules, so words that are not units,
+    colors or processor names cost one dictionary lookup. Sizes in GB/TB
+    are RAM or storage depending on the words next to them ("512gb ssd",
+    "ram 8gb", "16gb de ram", "ddr4 16gb"; a storage word between two
+    sizes, as in "8gb ssd 256gb", belongs to the second). Bare sizes are
+    storage from ``STORAGE_MIN_GB`` and in TB, RAM otherwise. The first
+    value of each spec wins.
+    
+    Args:
+        title: Product title (any case, accents allowed)
+        
+    Returns:
+        Dict[str, str]: Specs by key, e.g. {"ram": "8gb", "storage":
+        "512gb", "processor": "i5", "screen": "15.6in", "color": "preto",
+        "capacity": "5.5l"}
+    """
+    specs: Dict[str, str] = {}
+    tokens = _TOKEN_RE.findall(title.lower())
+    
+    for i, token in enumerate(tokens):
+        rule = _RULES.get(token)
+        if rule is None:
+            continue
+        
+        if rule == 'color':
+            if COLOR not in specs:
+                specs[COLOR] = COLORS[token]
+            continue
+        
+        if rule == 'intel' or rule == 'ryzen' or rule == 'core' or rule == 'apple':
+            if PROCESSOR not in specs:
+                processor = _processor(tokens, i, rule)
+                if processor:
+                    specs[PROCESSOR] = processor
+            continue
+        
+        # Units measure the number right before them
+        number = tokens[i - 1] if i else ''
+        if not number or number[0] not in _DIGITS:
+            continue
+        
+        whole = number.replace(',', '.').split('.')[0]
+        
+        if rule == 'size':
+            if whole == number:
+                key = _size_key(tokens, i - 1, token)
+                if key not in specs:
+                    specs[key] = f"{int(number)}{token}"
+        elif rule == 'screen':
+            if len(whole) <= 2 and SCREEN not in specs:
+                specs[SCREEN] = f"{number.replace(',', '.')}in"
+        elif rule == 'liters':
+            if len(whole) <= 4 and CAPACITY not in specs:
+                specs[CAPACITY] = f"{number.replace(',', '.')}l"
+        elif whole == number and 3 <= len(number) <= 5 and CAPACITY not in specs:
+            specs[CAPACITY] = f"{int(number)}mah"
+    
+    return specs
+
+
+def _processor(tokens: List[str], i: int, rule: str) -> str:
+    """
+    Get the processor named at a token.
+    
+    Args:
+        tokens: Title tokens
+        i: Index of the processor token
+        rule: "intel", "ryzen", "core" or "apple"
+        
+    Returns:
+        str: Processor (e.g. "i5", "ryzen5", "core5", "m2"), or "" if the token
+        does not name one here
+    """
+    token = tokens[i]
+    
+    if rule == 'intel':
+        return token
+    
+    if rule == 'ryzen' or rule == 'core':
+        # "ryzen 5", "core 7"; "core i5" is left to the "i5" token
+        number = token[len(rule):] or (tokens[i + 1] if i + 1 < len(tokens) else '')
+        return f"{rule}{number}" if number in _SERIES else ''
+    
+    # "m2" alone is too ambiguous without "apple", "chip", "air" or "pro"
+    return token if i and tokens[i - 1] in _APPLE_PREFIXES else ''
+
+
+def _size_key(tokens: List[str], i: int, unit: str) -> str:
+    """
+    Decide whether a GB/TB size is RAM or storage.
+    
+    Args:
+        tokens: Title tokens
+        i: Index of the size number (the unit follows it)
+        unit: "gb" or "tb"
+        
+    Returns:
+        str: RAM or STORAGE
+    """
+    # Word after the unit ("16gb de ram", "512gb ssd")
+    after = i + 2
+    if after < len(tokens) and tokens[after] == 'de':
+        after += 1
+    
+    if after < len(tokens):
+        word = tokens[after]
+        if unit == 'gb' and (word in _RAM_WORDS or word.startswith(_RAM_PREFIXES)):
+            return RAM
+        # Unless it introduces the next size ("8gb ssd 256gb")
+        if word in _STORAGE_WORDS and not _is_size(tokens, after + 1):
+            return STORAGE
+    
+    # Word before the number ("ssd 512gb", "ram de 8gb", "ddr4 16gb")
+    before = i - 1
+    if before >= 0 and tokens[before] == 'de':
+        before -= 1
+    
+    # Unless it closes the previous size ("8gb ram 512gb")
+    if before >= 0 and not (before >= 1 and tokens[before - 1] in _SIZE_UNITS):
+        word = tokens[before]
+        if word in _STORAGE_WORDS or word in _STORAGE_DEVICES:
+            return STORAGE
+        if word in _RAM_WORDS and before >= 2 and tokens[before - 1] == 'de' and tokens[before - 2].startswith('cart'):
+            # "cartao de memoria 32gb"
+            return STORAGE
+        if unit == 'gb' and (word in _RAM_WORDS or word.startswith(_RAM_PREFIXES)):
+            return RAM
+    
+    if unit == 'tb' or int(tokens[i]) >= STORAGE_MIN_GB:
+        return STORAGE
+    
+    return RAM
+
+
+def _is_size(tokens: List[str], i: int) -> bool:
+    """Check if a GB/TB size starts at a token."""
+    return i + 1 < len(tokens) and tokens[i][0].isdigit() and tokens[i + 1] in _SIZE_UNITS
+
+
+def extract_specs_batch(titles: Iterable[str]) -> List[Dict[str, str]]:
+    """
+    Extract specifications from many titles.
+    
+    Args:
+        titles: Product titles
+        
+    Returns:
+        List[Dict[str, str]]: Specs per title (same order)
+    """
+    extract = extract_specs
+    return [extract(title) for title in titles]
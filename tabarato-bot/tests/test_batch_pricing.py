@@ -0,0 +1,136 @@
+"""
+Unit tests for vectorized coupon pricing.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.models.coupon import Coupon
+from src.models.product import Product
+from src.services.batch_pricing import BatchCouponPricer
+from src.services.coupon_service import CouponService
+from src.services.price_service import PriceService
+
+
+def make_coupon(code: str, marketplace: str, discount_type: str, value: float, **kwargs) -> Coupon:
+    """Build a coupon valid for the next day."""
+    now = datetime.now()
+    return Coupon(
+        code=code,
+        marketplace=marketplace,
+        discount_type=discount_type,
+        discount_value=value,
+        valid_from=kwargs.pop('valid_from', now - timedelta(days=1)),
+        valid_until=kwargs.pop('valid_until', now + timedelta(days=1)),
+        **kwargs
+    )
+
+
+@pytest.fixture
+def coupon_service():
+    """Coupon service with edge-case coupons instead of the defaults."""
+    service = CouponService(load_defaults=False)
+    coupons = [
+        make_coupon("PCT10", "Mercado Livre", "percentage", 10.0, minimum_purchase=500.0, maximum_discount=100.0),
+        make_coupon("FIX50", "Mercado Livre", "fixed", 50.0, minimum_purchase=300.0),
+        make_coupon("FIX100", "Mercado Livre", "fixed", 100.0),
+        make_coupon("PCT15", "Amazon", "percentage", 15.0),
+        make_coupon("SAME15", "Amazon", "percentage", 15.0),
+        make_coupon("OLD90", "Amazon", "percentage", 90.0, valid_until=datetime.now() - timedelta(hours=1)),
+        make_coupon("OFF", "Shopee", "percentage", 50.0, is_active=False),
+    ]
+    for coupon in coupons:
+        service.add_coupon(coupon)
+    return service
+
+
+class TestBatchCouponPricer:
+    """Tests for BatchCouponPricer."""
+    
+    def test_matches_scalar_path(self, coupon_service):
+        """Test random batches pick the same coupon and prices as apply_best_coupon."""
+        rng = random.Random(7)
+        marketplaces = [
+            rng.choice(["Mercado Livre", "mercado livre", "Amazon", "Shopee", "Magalu"])
+            for _ in range(2000)
+        ]
+        prices = [round(rng.uniform(1, 2000), 2) for _ in range(2000)] + [300.0, 500.0, 40.0]
+        marketplaces += ["Mercado Livre"] * 3
+        
+        coupons, discounts, finals = BatchCouponPricer(coupon_service.get_all_coupons()).price(
+            marketplaces, prices
+        )
+        
+        for i, (marketplace, price) in enumerate(zip(marketplaces, prices)):
+            expected = coupon_service.apply_best_coupon(marketplace, price)
+            assert (coupons[i].code if coupons[i] else None) == expected['coupon_code']
+            assert discounts[i] == expected['discount']
+            assert finals[i] == expected['final_price']
+    
+    def test_discount_limits(self, coupon_service):
+        """Test minimum purchase, maximum discount and price floor."""
+        pricer = BatchCouponPricer(coupon_service.get_all_coupons())
+        
+        coupons, discounts, finals = pricer.price(
+            ["Mercado Livre"] * 3,
+            [2000.0, 400.0, 40.0]
+        )
+        
+        # 10% of 2000 is capped at 100, tied with FIX100; first coupon wins
+        assert coupons[0].code == "PCT10"
+        assert discounts[0] == 100.0
+        # Below PCT10's minimum, FIX100 beats FIX50
+        assert coupons[1].code == "FIX100"
+        assert finals[1] == 300.0
+        # A fixed discount never goes below zero
+        assert finals[2] == 0.0
+    
+    def test_invalid_coupons_are_skipped(self, coupon_service):
+        """Test expired, inactive and unknown-marketplace cases."""
+        pricer = BatchCouponPricer(coupon_service.get_all_coupons())
+        
+        coupons, discounts, finals = pricer.price(["Amazon", "Shopee", "Magalu"], [100.0, 100.0, 100.0])
+        
+        assert coupons[0].code == "PCT15"
+        assert coupons[1] is None and coupons[2] is None
+        assert finals.tolist() == [85.0, 100.0, 100.0]
+    
+    def test_empty_batch(self, coupon_service):
+        """Test an empty batch."""
+        coupons, discounts, finals = BatchCouponPricer(coupon_service.get_all_coupons()).price([], [])
+        
+        assert coupons == []
+        assert len(finals) == 0
+
+
+class TestPriceServiceBatch:
+    """Tests for PriceService.apply_coupons."""
+    
+    def test_batch_equals_scalar(self, coupon_service):
+        """Test the vectorized and per-product paths return the same products."""
+        rng = random.Random(3)
+        products = [
+            Product(
+                id=f"P{i}",
+                name=f"Produto {i}",
+                price=round(rng.uniform(10, 1500), 2),
+                marketplace=rng.choice(["Mercado Livre", "Amazon", "Shopee"]),
+                url=f"https://example.com/{i}"
+            )
+            for i in range(300)
+        ]
+        
+        service = PriceService()
+        service.coupon_service = coupon_service
+        
+        service.batch_min_products = len(products) + 1
+        scalar = service.apply_coupons(products)
+        service.batch_min_products = 1
+        batch = service.apply_coupons(products)
+        
+        assert [p.model_dump() for p in batch] == [p.model_dump() for p in scalar]
+        assert any(p.coupon_code for p in batch)
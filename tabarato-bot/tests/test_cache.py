@@ -0,0 +1,102 @@
+"""
+Unit tests for caching utilities.
+"""
+
+import pytest
+from src.utils.cache import TTLCache
+from src.services.search_service import SearchService
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+    
+    def test_get_and_set(self):
+        """Test storing and reading a value."""
+        cache = TTLCache(max_size=10, ttl=60)
+        cache.set("notebook", 1)
+        
+        assert cache.get("notebook") == 1
+        assert cache.get("iphone") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL."""
+        clock = FakeClock()
+        cache = TTLCache(max_size=10, ttl=60, clock=clock)
+        cache.set("notebook", 1)
+        
+        clock.now = 59.0
+        assert cache.get("notebook") == 1
+        
+        clock.now = 60.0
+        assert cache.get("notebook") is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+    
+    def test_ttl_override(self):
+        """Test per-entry TTL override."""
+        clock = FakeClock()
+        cache = TTLCache(max_size=10, ttl=60, clock=clock)
+        cache.set("notebook", 1, ttl=5)
+        
+        clock.now = 5.0
+        assert "notebook" not in cache
+    
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted first."""
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+    
+    def test_stats(self):
+        """Test statistics snapshot."""
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        
+        stats = cache.stats()
+        
+        assert stats['size'] == 1
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(0.5)
+    
+    def test_invalid_size(self):
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(max_size=0)
+
+
+class TestSearchCacheKey:
+    """Tests for the canonical search cache key."""
+    
+    def test_equivalent_queries_share_key(self):
+        """Test case, accents and spacing do not change the key."""
+        key1 = SearchService.get_cache_key("iPhone 15")
+        key2 = SearchService.get_cache_key("  iphone   15 ")
+        key3 = SearchService.get_cache_key("Fone Bluetooth Pequeno")
+        key4 = SearchService.get_cache_key("fone bluetooth pequeño")
+        
+        assert key1 == key2 == "iphone 15"
+        assert key3 == key4
@@ -0,0 +1,271 @@
+"""
+Unit tests for the product catalog (in-memory SQLite).
+"""
+
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.database.models import Base, CatalogProduct
+from src.database.repositories import CatalogRepository
+from src.models.product import Product
+from src.services import catalog_service
+from src.services.catalog_service import CatalogService, fingerprint_id
+from src.utils import normalizer
+from src.utils.executor import CpuExecutor
+from src.utils.metrics import MetricsRegistry
+from src.utils.normalizer import ProductNormalizer
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory bound to a fresh in-memory database."""
+    # One shared connection, so the database is visible from worker threads
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def service(session_factory):
+    """Catalog service using the in-memory database."""
+    @contextmanager
+    def session_scope():
+        session = session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    return CatalogService(session_scope=session_scope)
+
+
+def make_product(product_id: str, name: str, marketplace: str = "Mercado Livre") -> Product:
+    """Build a product listing."""
+    return Product(
+        id=product_id,
+        name=name,
+        price=100.0,
+        marketplace=marketplace,
+        url="https://test.com"
+    )
+
+
+class TestFingerprint:
+    """Tests for ProductNormalizer.fingerprint."""
+    
+    def test_same_product_different_titles(self):
+        """Test titles of one product on different marketplaces match."""
+        fp1 = ProductNormalizer.fingerprint("Acer Nitro 5 i5 8GB 512GB")
+        fp2 = ProductNormalizer.fingerprint("Notebook Gamer Acer Nitro 5 Intel Core i5 8GB RAM 512GB SSD")
+        
+        assert fp1 is not None
+        assert fp1 == fp2
+        assert fp1.startswith("acer|nitro 5|")
+    
+    def test_different_models(self):
+        """Test different models of a brand do not match."""
+        nitro = ProductNormalizer.fingerprint("Notebook Acer Nitro 5 i5 8GB")
+        aspire = ProductNormalizer.fingerprint("Notebook Acer Aspire 5 i5 8GB")
+        
+        assert nitro != aspire
+    
+    def test_unknown_brand_or_model(self):
+        """Test no fingerprint without a known brand and a model."""
+        assert ProductNormalizer.fingerprint("Fone Bluetooth Pequeno") is None
+        assert ProductNormalizer.fingerprint("Notebook Dell 8GB") is None
+    
+    def test_full_brand_name_only(self):
+        """Test a name that is only a full brand name has no fingerprint."""
+        assert ProductNormalizer.fingerprint("Hewlett Packard") is None
+        assert ProductNormalizer.fingerprint("hewlett  packard") is None
+
+
+class TestCatalogRepository:
+    """Tests for CatalogRepository."""
+    
+    def test_add_and_lookup(self, session_factory):
+        """Test stored listings are found by marketplace and external ID."""
+        session = session_factory()
+        product = make_product("MLB1", "Notebook Acer Nitro 5")
+        
+        added = CatalogRepository.add_listings(session, [
+            (product, "canon1", "acer|nitro 5|"),
+            (product, "canon1", "acer|nitro 5|")
+        ])
+        
+        found = CatalogRepository.get_canonical_ids(session, [
+            ("Mercado Livre", "MLB1"),
+            ("Amazon", "MLB1")
+        ])
+        
+        assert added == 1
+        assert found == {("Mercado Livre", "MLB1"): "canon1"}
+        session.close()
+
+
+class TestCatalogService:
+    """Tests for CatalogService."""
+    
+    def test_groups_by_fingerprint_across_marketplaces(self, service):
+        """Test one product sold on two marketplaces forms one group."""
+        products = [
+            make_product("MLB1", "Notebook Acer Nitro 5 i5 8GB", "Mercado Livre"),
+            make_product("B01", "Acer Nitro 5 Notebook Gamer i5 8GB", "Amazon"),
+            make_product("MLB2", "Notebook Acer Aspire 5 i5 8GB", "Mercado Livre")
+        ]
+        
+        groups = service.group_products(products)
+        
+        assert [[p.id for p in group] for group in groups] == [["MLB1", "B01"], ["MLB2"]]
+        assert service.fingerprinted == 3
+    
+    def test_new_listings_fuzzy_matched(self, service):
+        """Test listings without a fingerprint are matched by name."""
+        products = [
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon"),
+            make_product("MLB2", "Cafeteira Expresso Inox")
+        ]
+        
+        groups = service.group_products(products)
+        
+        assert [[p.id for p in group] for group in groups] == [["MLB1", "B01"], ["MLB2"]]
+        assert service.fuzzy_matched == 3
+    
+    def test_known_listings_skip_fuzzy_matching(self, service, monkeypatch):
+        """Test listings seen before are grouped by lookup only."""
+        products = [
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ]
+        first = service.group_products(products)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("fuzzy matching should not run")
+        
+        monkeypatch.setattr(catalog_service, "group_similar_products", fail)
+        second = service.group_products(products)
+        
+        assert [[p.id for p in g] for g in second] == [[p.id for p in g] for g in first]
+        assert service.known == 2
+    
+    def test_new_listing_joins_known_product(self, service, session_factory):
+        """Test a new listing is matched against known products in the result."""
+        service.group_products([make_product("MLB1", "Fone de Ouvido Bluetooth Preto")])
+        
+        groups = service.group_products([
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ])
+        
+        session = session_factory()
+        rows = session.query(CatalogProduct).all()
+        session.close()
+        
+        assert len(groups) == 1
+        assert len(rows) == 2
+        assert rows[0].canonical_id == rows[1].canonical_id
+    
+    def test_fingerprint_id_is_stable(self, service, session_factory):
+        """Test fingerprinted listings are stored under the fingerprint ID."""
+        name = "Notebook Acer Nitro 5 i5 8GB"
+        service.group_products([make_product("MLB1", name)])
+        
+        session = session_factory()
+        row = session.query(CatalogProduct).one()
+        session.close()
+        
+        assert row.canonical_id == fingerprint_id(ProductNormalizer.fingerprint(name))
+    
+    def test_database_error_falls_back(self):
+        """Test fuzzy grouping is used when the catalog is unavailable."""
+        @contextmanager
+        def broken_scope():
+            raise OperationalError("SELECT 1", {}, Exception("database down"))
+            yield
+        
+        service = CatalogService(session_scope=broken_scope)
+        products = [
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ]
+        
+        assert len(service.group_products(products)) == 1
+    
+    def test_programming_errors_are_raised(self):
+        """Test only database errors fall back to fuzzy grouping."""
+        @contextmanager
+        def broken_scope():
+            raise RuntimeError("bug")
+            yield
+        
+        service = CatalogService(session_scope=broken_scope)
+        
+        with pytest.raises(RuntimeError):
+            service.group_products([make_product("MLB1", "Fone de Ouvido Bluetooth Preto")])
+    
+    def test_full_brand_name_listing(self, service):
+        """Test a listing named only by a full brand is fuzzy matched."""
+        groups = service.group_products([
+            make_product("MLB1", "Hewlett Packard"),
+            make_product("MLB2", "Notebook Acer Nitro 5 i5 8GB")
+        ])
+        
+        assert [[p.id for p in g] for g in groups] == [["MLB1"], ["MLB2"]]
+        assert service.fuzzy_matched == 1
+    
+    def test_repeated_product_object(self, service):
+        """Test the same product object twice in a result is grouped twice."""
+        product = make_product("MLB1", "Fone de Ouvido Bluetooth Preto")
+        other = make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        
+        groups = service.group_products([product, other, product])
+        
+        assert [[p.id for p in g] for g in groups] == [["MLB1", "B01", "MLB1"]]
+    
+    @pytest.mark.asyncio
+    async def test_async_matches_sync(self, service, session_factory):
+        """Test async grouping gives the same groups and catalog rows."""
+        products = [
+            make_product("MLB1", "Notebook Acer Nitro 5 i5 8GB"),
+            make_product("MLB2", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ]
+        
+        first = await service.group_products_async(products)
+        second = service.group_products(products)
+        
+        session = session_factory()
+        rows = session.query(CatalogProduct).count()
+        session.close()
+        
+        assert [[p.id for p in g] for g in first] == [["MLB1"], ["MLB2", "B01"]]
+        assert [[p.id for p in g] for g in second] == [[p.id for p in g] for g in first]
+        assert rows == 3
+        assert service.known == 3
+    
+    @pytest.mark.asyncio
+    async def test_async_matching_uses_cpu_executor(self, service, monkeypatch):
+        """Test new listings are fuzzy matched through the CPU executor."""
+        metrics = MetricsRegistry()
+        executor = CpuExecutor(max_workers=0, metrics=metrics)
+        monkeypatch.setattr(normalizer, "get_cpu_executor", lambda: executor)
+        
+        groups = await service.group_products_async([
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ])
+        
+        assert [[p.id for p in g] for g in groups] == [["MLB1", "B01"]]
+        assert metrics.get("executor.inline") == 1
@@ -0,0 +1,150 @@
+"""
+Unit tests for the marketplace circuit breaker.
+"""
+
+import pytest
+from aioresponses import aioresponses
+from src.integrations.circuit_breaker import CircuitBreaker, CircuitState
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+from src.integrations.retry import RetryPolicy
+from src.utils.metrics import get_metrics
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    """Create a breaker with small thresholds."""
+    return CircuitBreaker(
+        "Test Store",
+        window=60,
+        min_calls=4,
+        error_rate=0.5,
+        timeout_rate=0.25,
+        open_duration=30,
+        clock=clock
+    )
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+    
+    def test_stays_closed_below_min_calls(self):
+        """Test failures below min_calls do not trip the circuit."""
+        breaker = make_breaker(FakeClock())
+        
+        for _ in range(3):
+            breaker.record_failure()
+        
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+    
+    def test_trips_on_error_rate(self):
+        """Test the circuit opens when the error rate is reached."""
+        breaker = make_breaker(FakeClock())
+        
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+    
+    def test_trips_on_timeout_rate(self):
+        """Test timeouts trip the circuit at a lower rate."""
+        breaker = make_breaker(FakeClock())
+        
+        for _ in range(3):
+            breaker.record_success()
+        breaker.record_failure(timeout=True)
+        
+        assert breaker.state == CircuitState.OPEN
+    
+    def test_old_outcomes_leave_the_window(self):
+        """Test failures outside the rolling window are forgotten."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 61.0
+        breaker.record_success()
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats()['calls'] == 2
+    
+    def test_half_open_probe_success_closes(self):
+        """Test a successful probe closes the circuit."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        
+        for _ in range(4):
+            breaker.record_failure()
+        assert breaker.is_open
+        
+        clock.now = 30.0
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_half_open_probe_failure_reopens(self):
+        """Test a failed probe opens the circuit again."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        
+        for _ in range(4):
+            breaker.record_failure()
+        
+        clock.now = 30.0
+        assert breaker.allow_request()
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitState.OPEN
+    
+    def test_state_exported_as_metric(self):
+        """Test state changes are exported to the metrics registry."""
+        breaker = make_breaker(FakeClock())
+        
+        for _ in range(4):
+            breaker.record_failure()
+        breaker.allow_request()
+        
+        metrics = get_metrics()
+        assert metrics.get("circuit_breaker.test_store.state") == 2
+        assert metrics.get("circuit_breaker.test_store.rejected") >= 1
+
+
+@pytest.mark.asyncio
+class TestCircuitBreakerIntegration:
+    """Tests for the breaker inside BaseMarketplaceAPI."""
+    
+    async def test_open_circuit_skips_requests(self):
+        """Test server errors open the circuit and stop further requests."""
+        api = MercadoLivreAPI(retry_policy=RetryPolicy(max_attempts=1))
+        api.circuit_breaker = make_breaker(FakeClock())
+        url = f"{api.BASE_URL}/items/MLB1"
+        
+        with aioresponses() as mocked:
+            for _ in range(4):
+                mocked.get(url, status=503)
+                assert await api._make_request(url) is None
+            
+            assert api.circuit_breaker.is_open
+            assert await api._make_request(url) is None
+            
+            # The fifth call never reached the network
+            sent = sum(len(calls) for calls in mocked.requests.values())
+            assert sent == 4
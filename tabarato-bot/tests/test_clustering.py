@@ -0,0 +1,226 @@
+"""
+Unit tests for incremental product clustering.
+"""
+
+import random
+import string
+import pytest
+from src.models.product import Product, SearchResult
+from src.services import price_service as price_module
+from src.services.price_service import PriceService
+from src.utils import clustering
+from src.utils.clustering import IncrementalClusterer, UnionFind, SECONDS_PER_DAY
+
+
+class FakeClock:
+    """Manually advanced clock for eviction tests."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_product(product_id: str, name: str, marketplace: str = "Mercado Livre") -> Product:
+    """Build a product listing."""
+    return Product(
+        id=product_id,
+        name=name,
+        price=100.0,
+        marketplace=marketplace,
+        url="https://test.com"
+    )
+
+
+def ids(groups) -> list:
+    """Product IDs per group."""
+    return [[p.id for p in group] for group in groups]
+
+
+class TestUnionFind:
+    """Tests for UnionFind."""
+    
+    def test_union_keeps_target_root(self):
+        """Test merged sets share the root of the target."""
+        sets = UnionFind()
+        for item in "abcd":
+            sets.add(item)
+        
+        sets.union("b", "a")
+        sets.union("d", "c")
+        sets.union("c", "b")
+        
+        assert {sets.find(item) for item in "abcd"} == {"a"}
+        assert len(sets) == 4
+        assert "e" not in sets
+
+
+class TestIncrementalClusterer:
+    """Tests for IncrementalClusterer."""
+    
+    def test_groups_similar_listings(self):
+        """Test a first run groups like fuzzy grouping."""
+        clusterer = IncrementalClusterer(threshold=70)
+        
+        groups = clusterer.group([
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("MLB2", "Cafeteira Expresso Inox"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ])
+        
+        assert ids(groups) == [["MLB1", "B01"], ["MLB2"]]
+        assert clusterer.cluster_count == 2
+        assert len(clusterer) == 3
+    
+    def test_known_listings_are_not_scored(self, monkeypatch):
+        """Test a repeated run groups by lookup only."""
+        clusterer = IncrementalClusterer(threshold=70)
+        products = [
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ]
+        clusterer.group(products)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("known listings should not be scored")
+        
+        monkeypatch.setattr(clustering.similarity, "first_match", fail)
+        monkeypatch.setattr(clustering, "group_similar_names", fail)
+        
+        assert ids(clusterer.group(products)) == [["MLB1", "B01"]]
+        assert clusterer.known == 2
+    
+    def test_new_listing_joins_cluster_from_earlier_run(self):
+        """Test a new listing is matched against earlier clusters."""
+        clusterer = IncrementalClusterer(threshold=70)
+        clusterer.group([
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("MLB2", "Cafeteira Expresso Inox")
+        ])
+        
+        groups = clusterer.group([
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon"),
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto")
+        ])
+        
+        assert ids(groups) == [["B01", "MLB1"]]
+        assert clusterer.matched == 1
+        assert clusterer.cluster_count == 2
+    
+    def test_scores_only_representatives_sharing_tokens(self, monkeypatch):
+        """Test a new listing is not scored against unrelated clusters."""
+        clusterer = IncrementalClusterer(threshold=70)
+        rng = random.Random(3)
+        names = [
+            " ".join("".join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(3))
+            for _ in range(50)
+        ]
+        clusterer.group([make_product(f"MLB{i}", name) for i, name in enumerate(names)])
+        assert clusterer.cluster_count == 50
+        
+        scored = []
+        original = clustering.similarity.first_match
+        
+        def counting(query, choices, threshold):
+            scored.extend(choices)
+            return original(query, choices, threshold)
+        
+        monkeypatch.setattr(clustering.similarity, "first_match", counting)
+        clusterer.group([make_product("B01", names[7], "Amazon")])
+        
+        assert scored == [" ".join(sorted(names[7].split()))]
+    
+    def test_eviction(self):
+        """Test listings unseen for max_age_days are dropped."""
+        clock = FakeClock()
+        clusterer = IncrementalClusterer(threshold=70, max_age_days=7, clock=clock)
+        clusterer.group([
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("MLB2", "Cafeteira Expresso Inox")
+        ])
+        
+        clock.now = 3 * SECONDS_PER_DAY
+        clusterer.group([make_product("MLB2", "Cafeteira Expresso Inox")])
+        
+        clock.now = 8 * SECONDS_PER_DAY
+        clusterer.group([make_product("MLB2", "Cafeteira Expresso Inox")])
+        
+        assert clusterer.evicted == 1
+        assert len(clusterer) == 1
+        assert clusterer.cluster_count == 1
+    
+    def test_evicted_representative_is_replaced(self):
+        """Test a cluster outlives its representative."""
+        clock = FakeClock()
+        clusterer = IncrementalClusterer(threshold=70, max_age_days=7, clock=clock)
+        clusterer.group([make_product("MLB1", "Fone de Ouvido Bluetooth Preto")])
+        
+        clock.now = 3 * SECONDS_PER_DAY
+        clusterer.group([make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")])
+        
+        clock.now = 8 * SECONDS_PER_DAY
+        assert clusterer.evict() == 1
+        
+        groups = clusterer.group([
+            make_product("B02", "Fone de Ouvido Bluetooth Preto", "Amazon"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ])
+        
+        assert ids(groups) == [["B02", "B01"]]
+        assert clusterer.cluster_count == 1
+    
+    def test_empty(self):
+        """Test grouping nothing."""
+        assert IncrementalClusterer().group([]) == []
+
+
+class RecordingCatalog:
+    """Catalog service stub recording the products it groups."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def group_products_async(self, products, threshold=70.0):
+        self.calls += 1
+        return [[p] for p in products]
+
+
+@pytest.mark.asyncio
+class TestGroupingStrategy:
+    """Tests for the CATALOG_GROUPING switch in PriceService.group_products."""
+    
+    @staticmethod
+    def search_result() -> SearchResult:
+        """Build a result with two listings of one product."""
+        products = [
+            make_product("MLB1", "Fone de Ouvido Bluetooth Preto"),
+            make_product("B01", "Fone Ouvido Bluetooth Preto", "Amazon")
+        ]
+        return SearchResult(query="fone", products=products, total_results=2)
+    
+    async def test_catalog_strategy(self, monkeypatch):
+        """Test the catalog groups products and the clusterer is not used."""
+        catalog = RecordingCatalog()
+        monkeypatch.setattr(price_module, "get_catalog_service", lambda: catalog)
+        service = PriceService()
+        service.catalog_grouping = True
+        
+        groups = await service.group_and_compare(self.search_result())
+        
+        assert catalog.calls == 1
+        assert len(groups) == 2
+        assert service.clusterer.cluster_count == 0
+    
+    async def test_cluster_strategy(self, monkeypatch):
+        """Test the in-memory clusters group products without the catalog."""
+        catalog = RecordingCatalog()
+        monkeypatch.setattr(price_module, "get_catalog_service", lambda: catalog)
+        service = PriceService()
+        service.catalog_grouping = False
+        
+        groups = await service.group_and_compare(self.search_result())
+        
+        assert catalog.calls == 0
+        assert len(groups) == 1
+        assert service.clusterer.created == 1
@@ -0,0 +1,154 @@
+"""
+Unit tests for the indexed coupon store.
+"""
+
+from datetime import datetime, timedelta
+
+from src.models.coupon import Coupon
+from src.services.coupon_index import CouponIndex
+from src.services.coupon_service import CouponService
+
+START = datetime(2024, 1, 1, 12, 0)
+
+
+class FakeClock:
+    """Manually advanced clock for validity tests."""
+    
+    def __init__(self):
+        self.now = START
+    
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_coupon(code: str, marketplace: str = "Mercado Livre", **kwargs) -> Coupon:
+    """Build a fixed-discount coupon valid for one day from START."""
+    return Coupon(
+        code=code,
+        marketplace=marketplace,
+        discount_type=kwargs.pop('discount_type', "fixed"),
+        discount_value=kwargs.pop('discount_value', 10.0),
+        valid_from=kwargs.pop('valid_from', START),
+        valid_until=kwargs.pop('valid_until', START + timedelta(days=1)),
+        **kwargs
+    )
+
+
+class TestCouponIndex:
+    """Tests for CouponIndex."""
+    
+    def test_applicable_by_minimum_purchase(self):
+        """Test only coupons whose minimum the price meets are returned."""
+        index = CouponIndex(clock=FakeClock())
+        index.add(make_coupon("MIN500", minimum_purchase=500.0))
+        index.add(make_coupon("NOMIN"))
+        index.add(make_coupon("MIN100", minimum_purchase=100.0))
+        
+        assert [c.code for c in index.applicable("Mercado Livre", 50.0)] == ["NOMIN"]
+        assert [c.code for c in index.applicable("Mercado Livre", 100.0)] == ["NOMIN", "MIN100"]
+        # Insertion order, not minimum purchase order
+        assert [c.code for c in index.applicable("Mercado Livre", 999.0)] == ["MIN500", "NOMIN", "MIN100"]
+    
+    def test_marketplace_is_normalized(self):
+        """Test marketplace lookups ignore case and surrounding spaces."""
+        index = CouponIndex(clock=FakeClock())
+        index.add(make_coupon("ML", marketplace="Mercado Livre"))
+        index.add(make_coupon("AMZ", marketplace="Amazon"))
+        
+        assert [c.code for c in index.valid(" mercado LIVRE ")] == ["ML"]
+        assert index.applicable("Shopee", 100.0) == []
+    
+    def test_validity_window(self):
+        """Test coupons start and expire as the clock crosses their boundaries."""
+        clock = FakeClock()
+        index = CouponIndex(clock=clock)
+        index.add(make_coupon(
+            "LATER",
+            valid_from=START + timedelta(hours=1),
+            valid_until=START + timedelta(hours=2)
+        ))
+        
+        assert index.valid() == []
+        
+        clock.now = START + timedelta(hours=1)
+        assert [c.code for c in index.valid()] == ["LATER"]
+        
+        # valid_until is inclusive, like Coupon.is_valid
+        clock.now = START + timedelta(hours=2)
+        assert [c.code for c in index.valid()] == ["LATER"]
+        
+        clock.now = START + timedelta(hours=2, seconds=1)
+        assert index.valid() == []
+        assert len(index) == 1
+    
+    def test_matches_is_valid(self):
+        """Test the index agrees with Coupon.is_valid over time."""
+        clock = FakeClock()
+        index = CouponIndex(clock=clock)
+        coupons = [
+            make_coupon(
+                f"C{i}",
+                valid_from=START + timedelta(hours=i % 5),
+                valid_until=START + timedelta(hours=i % 5 + i % 3),
+                is_active=i % 7 != 0
+            )
+            for i in range(30)
+        ]
+        for coupon in coupons:
+            index.add(coupon)
+        
+        for minutes in range(0, 10 * 60, 30):
+            clock.now = START + timedelta(minutes=minutes)
+            expected = [c.code for c in coupons if c.is_valid(clock.now)]
+            assert [c.code for c in index.valid()] == expected
+    
+    def test_remove(self):
+        """Test removing a valid coupon."""
+        index = CouponIndex(clock=FakeClock())
+        index.add(make_coupon("TECH10"))
+        
+        assert index.remove("tech10", "mercado livre")
+        assert not index.remove("tech10", "mercado livre")
+        assert index.valid() == []
+        assert len(index) == 0
+    
+    def test_remove_expired_keeps_pending(self):
+        """Test cleanup drops expired and inactive coupons only."""
+        clock = FakeClock()
+        index = CouponIndex(clock=clock)
+        index.add(make_coupon("OLD", valid_until=START + timedelta(minutes=1)))
+        index.add(make_coupon("OFF", is_active=False))
+        index.add(make_coupon("NEXT", valid_from=START + timedelta(days=2), valid_until=START + timedelta(days=3)))
+        index.add(make_coupon("NOW"))
+        
+        clock.now = START + timedelta(hours=1)
+        
+        assert index.remove_expired() == 2
+        assert [c.code for c in index.all()] == ["NEXT", "NOW"]
+        assert index.remove_expired() == 0
+
+
+class TestCouponServiceIndex:
+    """Tests for CouponService on top of the index."""
+    
+    def test_best_coupon_tie_keeps_first(self):
+        """Test equal discounts resolve to the first added coupon."""
+        service = CouponService(load_defaults=False)
+        now = datetime.now()
+        for code, minimum in [("FIRST", 300.0), ("SECOND", None)]:
+            service.add_coupon(Coupon(
+                code=code,
+                marketplace="Amazon",
+                discount_type="fixed",
+                discount_value=50.0,
+                valid_from=now - timedelta(days=1),
+                valid_until=now + timedelta(days=1),
+                minimum_purchase=minimum
+            ))
+        
+        assert service.find_best_coupon("Amazon", 400.0).code == "FIRST"
+        assert service.find_best_coupon("Amazon", 200.0).code == "SECOND"
+        
+        result = service.apply_best_coupon("Amazon", 400.0)
+        assert result['final_price'] == 350.0
+        assert result['discount_percentage'] == 12.5
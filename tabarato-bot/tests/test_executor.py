@@ -0,0 +1,183 @@
+"""
+Unit tests for CPU-bound work scheduling.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from src.utils import normalizer
+from src.utils.executor import CpuExecutor, ExecutorBusyError, LoopLagMonitor
+from src.utils.metrics import MetricsRegistry
+from src.utils.normalizer import (
+    group_similar_names,
+    group_similar_names_async,
+    group_similar_products,
+    group_similar_products_async
+)
+from src.models.product import Product
+
+
+def make_product(id: str, name: str) -> Product:
+    """Build a test product."""
+    return Product(
+        id=id,
+        name=name,
+        price=100.0,
+        marketplace="Mercado Livre",
+        url="https://test.com"
+    )
+
+
+@pytest.mark.asyncio
+class TestCpuExecutor:
+    """Tests for CpuExecutor."""
+    
+    async def test_small_batch_runs_inline(self):
+        """Test batches under the cutoff run inline without a pool."""
+        metrics = MetricsRegistry()
+        executor = CpuExecutor(max_workers=1, inline_min_items=100, metrics=metrics)
+        
+        assert await executor.run(sum, [1, 2, 3], items=3) == 6
+        assert executor._pool is None
+        assert metrics.get("executor.inline") == 1
+    
+    async def test_no_workers_runs_inline(self):
+        """Test max_workers=0 never offloads."""
+        executor = CpuExecutor(max_workers=0, inline_min_items=1, metrics=MetricsRegistry())
+        
+        assert not executor.offloads(10_000)
+        assert await executor.run(sum, [1, 2], items=10_000) == 3
+    
+    async def test_large_batch_is_offloaded(self):
+        """Test batches at the cutoff run in a worker process."""
+        metrics = MetricsRegistry()
+        executor = CpuExecutor(max_workers=1, inline_min_items=2, metrics=metrics)
+        
+        try:
+            names = ["Notebook Dell 8GB", "Notebook Dell 8 GB", "iPhone 15 128GB"]
+            result = await executor.run(group_similar_names, names, 70.0, items=len(names))
+            
+            assert result == group_similar_names(names, 70.0)
+            assert metrics.get("executor.offloaded") == 1
+            assert executor.queued == 0
+        finally:
+            executor.close()
+    
+    async def test_full_queue_rejects(self):
+        """Test jobs beyond the queue bound are rejected."""
+        metrics = MetricsRegistry()
+        executor = CpuExecutor(max_workers=1, inline_min_items=1, max_queued=1, metrics=metrics)
+        executor._slots = asyncio.Semaphore(0)  # no free worker
+        
+        waiting = asyncio.ensure_future(executor.run(sum, [1], items=1))
+        await asyncio.sleep(0)
+        
+        with pytest.raises(ExecutorBusyError):
+            await executor.run(sum, [1], items=1)
+        assert metrics.get("executor.rejected") == 1
+        
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+    
+    async def test_cancel_while_queued(self):
+        """Test cancelling a queued job frees its queue slot."""
+        metrics = MetricsRegistry()
+        executor = CpuExecutor(max_workers=1, inline_min_items=1, metrics=metrics)
+        executor._slots = asyncio.Semaphore(0)
+        
+        waiting = asyncio.ensure_future(executor.run(sum, [1], items=1))
+        await asyncio.sleep(0)
+        assert executor.queued == 1
+        
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        
+        assert executor.queued == 0
+        assert metrics.get("executor.cancelled") == 1
+        assert executor._pool is None
+    
+    async def test_broken_pool_is_shut_down(self):
+        """Test a broken pool is shut down and replaced, and the job runs inline."""
+        class BrokenPool:
+            """Pool whose workers have died."""
+            
+            def __init__(self):
+                self.shutdown_calls = []
+            
+            def submit(self, func, *args):
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+            
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shutdown_calls.append((wait, cancel_futures))
+        
+        metrics = MetricsRegistry()
+        executor = CpuExecutor(max_workers=1, inline_min_items=1, metrics=metrics)
+        pool = BrokenPool()
+        executor._pool = pool
+        
+        assert await executor.run(sum, [1, 2], items=2) == 3
+        assert pool.shutdown_calls == [(False, True)]
+        assert executor._pool is None
+        assert metrics.get("executor.broken") == 1
+
+
+@pytest.mark.asyncio
+class TestLoopLagMonitor:
+    """Tests for LoopLagMonitor."""
+    
+    async def test_record(self):
+        """Test lag measurements are kept and exported."""
+        metrics = MetricsRegistry()
+        monitor = LoopLagMonitor(metrics=metrics)
+        
+        monitor.record(0.3)
+        monitor.record(0.01)
+        
+        assert monitor.last_lag == 0.01
+        assert monitor.max_lag == 0.3
+        assert metrics.get("event_loop.lag_seconds") == 0.01
+        assert metrics.snapshot()['summaries']['event_loop.lag_seconds']['count'] == 2
+    
+    async def test_detects_blocked_loop(self):
+        """Test blocking the loop shows up as lag."""
+        monitor = LoopLagMonitor(interval=0.01, metrics=MetricsRegistry())
+        monitor.start()
+        
+        await asyncio.sleep(0)
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+        
+        assert monitor.max_lag >= 0.05
+
+
+@pytest.mark.asyncio
+class TestAsyncPipelineStages:
+    """Tests for the event-loop friendly grouping."""
+    
+    async def test_group_similar_products_async(self):
+        """Test async grouping matches inline grouping."""
+        products = [
+            make_product("1", "Notebook Dell Inspiron 15 8GB"),
+            make_product("2", "iPhone 15 Pro 256GB"),
+            make_product("3", "Notebook Dell Inspiron 15 8 GB"),
+        ]
+        
+        groups = await group_similar_products_async(products, threshold=70.0)
+        
+        assert groups == group_similar_products(products, threshold=70.0)
+    
+    async def test_busy_executor_groups_inline(self, monkeypatch):
+        """Test names are grouped inline when the executor queue is full."""
+        executor = CpuExecutor(max_workers=1, inline_min_items=1, max_queued=0, metrics=MetricsRegistry())
+        monkeypatch.setattr(normalizer, "get_cpu_executor", lambda: executor)
+        names = ["Notebook Dell 8GB", "Notebook Dell 8 GB", "iPhone 15 128GB"]
+        
+        assert await group_similar_names_async(names, 70.0) == group_similar_names(names, 70.0)
+        assert executor._pool is None
@@ -0,0 +1,49 @@
+"""
+Unit tests for the shared HTTP client.
+"""
+
+import pytest
+from src.integrations.http_client import HttpClient
+from src.integrations import http_client as http_module
+from src.integrations.amazon_api import AmazonAPI
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+
+
+@pytest.mark.asyncio
+class TestHttpClient:
+    """Tests for HttpClient."""
+    
+    async def test_session_is_reused(self):
+        """Test the same session is returned until closed."""
+        client = HttpClient()
+        
+        session1 = await client.get_session()
+        session2 = await client.get_session()
+        
+        assert session1 is session2
+        assert client.is_open
+        
+        await client.close()
+        assert not client.is_open
+    
+    async def test_connector_is_tuned(self):
+        """Test the connector uses the configured pool limits."""
+        client = HttpClient()
+        session = await client.get_session()
+        
+        assert session.connector.limit == client.limit
+        assert session.connector.limit_per_host == client.limit_per_host
+        
+        await client.close()
+    
+    async def test_adapters_share_session(self, monkeypatch):
+        """Test all marketplace adapters use the global session."""
+        client = HttpClient()
+        monkeypatch.setattr(http_module, "_http_client", client)
+        
+        session1 = await MercadoLivreAPI()._get_session()
+        session2 = await AmazonAPI()._get_session()
+        
+        assert session1 is session2
+        
+        await client.close()
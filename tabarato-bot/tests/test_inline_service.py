@@ -0,0 +1,279 @@
+"""
+Unit tests for inline query answers.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.bot.inline import _build_articles
+from src.database.models import Base, Search, User
+from src.integrations.circuit_breaker import CircuitBreaker
+from src.models.product import Product, SearchResult
+from src.services import search_service as search_module
+from src.services.inline_service import InlineSearchService
+from src.services.search_service import SearchService
+
+
+class PassThroughPriceService:
+    """Price service stub that leaves results untouched."""
+    
+    def compare_prices(self, search_result: SearchResult) -> SearchResult:
+        return search_result
+
+
+class FakeMarketplace:
+    """Marketplace stub answering at once."""
+    
+    def __init__(self):
+        self.marketplace_name = "Fake"
+        self.calls = 0
+        self.queries = []
+        self.circuit_breaker = CircuitBreaker("Fake")
+    
+    async def search(self, query: str) -> SearchResult:
+        self.calls += 1
+        self.queries.append(query)
+        if query == "nada encontrado":
+            return SearchResult(query=query, products=[], total_results=0)
+        product = Product(
+            id=f"{query}-1",
+            name=f"{query} produto",
+            price=100.0,
+            marketplace="Fake",
+            url="https://test.com"
+        )
+        return SearchResult(query=query, products=[product], total_results=1)
+    
+    async def close(self) -> None:
+        pass
+
+
+class RecordingLimiter:
+    """Rate limiter check recording the users it is asked about."""
+    
+    def __init__(self, allowed: bool = True):
+        self.allowed = allowed
+        self.users = []
+    
+    def __call__(self, user_id):
+        self.users.append(user_id)
+        return self.allowed, 0.0 if self.allowed else 30.0
+
+
+class FakeClock:
+    """Manually advanced clock for refresh tests."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def session_scope():
+    """Session factory over an in-memory database with past searches."""
+    # One shared connection, so the database is visible from worker threads
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    
+    session = factory()
+    user = User(telegram_id="1")
+    session.add(user)
+    for query, count in [("notebook", 3), ("Notebook", 2), ("notebook gamer", 4), ("iphone", 1)]:
+        for _ in range(count):
+            session.add(Search(user=user, query=query, results_count=1, created_at=datetime.utcnow()))
+    session.commit()
+    session.close()
+    
+    @contextmanager
+    def scope():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+    
+    return scope
+
+
+@pytest.fixture
+def search_service(monkeypatch):
+    """SearchService wired to a fake marketplace."""
+    monkeypatch.setattr(
+        search_module, "get_price_service", lambda: PassThroughPriceService()
+    )
+    service = SearchService()
+    service.marketplaces = [FakeMarketplace()]
+    return service
+
+
+@pytest.mark.asyncio
+class TestInlineSearchService:
+    """Tests for InlineSearchService."""
+    
+    async def test_refresh_seeds_index(self, search_service, session_scope):
+        """Test popular queries are indexed by cache key with summed counts."""
+        inline_service = InlineSearchService(search_service, session_scope=session_scope)
+        
+        assert await inline_service.refresh() == 3
+        assert inline_service.index.search("note") == ["notebook", "notebook gamer"]
+    
+    async def test_refresh_without_database(self, search_service):
+        """Test an unavailable database leaves the index empty."""
+        @contextmanager
+        def broken():
+            raise RuntimeError("Database not initialized")
+            yield
+        
+        inline_service = InlineSearchService(search_service, session_scope=broken)
+        
+        assert await inline_service.refresh() == 0
+        assert len(inline_service.index) == 0
+    
+    async def test_answers_only_cached_queries(self, search_service, session_scope):
+        """Test answers use cached results and never search."""
+        inline_service = InlineSearchService(search_service, session_scope=session_scope)
+        await inline_service.refresh()
+        
+        assert inline_service.answer("note") == []
+        
+        await search_service.search_all("notebook gamer")
+        results = inline_service.answer("note")
+        
+        assert [r.query for r in results] == ["notebook gamer"]
+        assert search_service.marketplaces[0].calls == 1
+        assert inline_service.answered == 1
+        assert inline_service.unanswered == 1
+    
+    async def test_prefetch_indexes_and_caches(self, search_service, session_scope):
+        """Test an uncached query is searched in the background and indexed."""
+        inline_service = InlineSearchService(search_service, session_scope=session_scope)
+        await inline_service.refresh()
+        
+        assert not inline_service.is_cached("Smart TV")
+        assert inline_service.prefetch("Smart TV")
+        assert not inline_service.prefetch("smart tv")  # already in flight
+        
+        await asyncio.gather(*search_service._background_tasks)
+        
+        assert inline_service.is_cached("smart tv")
+        assert "smart tv" in inline_service.index
+        assert [r.query for r in inline_service.answer("smart")] == ["smart tv"]
+        assert inline_service.prefetched == 1
+    
+    async def test_prefetch_without_products_is_not_indexed(self, search_service):
+        """Test a query whose search finds nothing stays out of the index."""
+        inline_service = InlineSearchService(search_service)
+        
+        assert inline_service.prefetch("nada encontrado")
+        await asyncio.gather(*search_service._background_tasks)
+        
+        assert "nada encontrado" not in inline_service.index
+    
+    async def test_schedule_prefetch_debounces(self, search_service):
+        """Test only the query the user stopped typing at is searched."""
+        inline_service = InlineSearchService(search_service)
+        inline_service.prefetch_delay = 0.01
+        limiter = RecordingLimiter()
+        
+        for query in ["sm", "sma", "smart", "smart tv"]:
+            inline_service.schedule_prefetch(1, query, limiter)
+            await asyncio.sleep(0)
+        
+        await asyncio.sleep(0.05)
+        await asyncio.gather(*search_service._background_tasks)
+        
+        assert search_service.marketplaces[0].queries == ["smart tv"]
+        assert limiter.users == [1]
+        assert inline_service._pending == {}
+    
+    async def test_schedule_prefetch_per_user(self, search_service):
+        """Test users typing at the same time do not cancel each other."""
+        inline_service = InlineSearchService(search_service)
+        inline_service.prefetch_delay = 0.01
+        limiter = RecordingLimiter()
+        
+        assert inline_service.schedule_prefetch(1, "smart tv", limiter)
+        assert inline_service.schedule_prefetch(2, "geladeira", limiter)
+        
+        await asyncio.sleep(0.05)
+        await asyncio.gather(*search_service._background_tasks)
+        
+        assert sorted(search_service.marketplaces[0].queries) == ["geladeira", "smart tv"]
+        assert sorted(limiter.users) == [1, 2]
+    
+    async def test_throttled_prefetch_is_skipped(self, search_service):
+        """Test a user over the inline limit starts no search."""
+        inline_service = InlineSearchService(search_service)
+        inline_service.prefetch_delay = 0.01
+        
+        assert inline_service.schedule_prefetch(1, "smart tv", RecordingLimiter(allowed=False))
+        await asyncio.sleep(0.05)
+        
+        assert search_service.marketplaces[0].calls == 0
+        assert inline_service.prefetched == 0
+    
+    async def test_prefix_of_indexed_query_is_not_searched(self, search_service, session_scope):
+        """Test no search is scheduled while typing towards a known query."""
+        inline_service = InlineSearchService(search_service, session_scope=session_scope)
+        await inline_service.refresh()
+        limiter = RecordingLimiter()
+        
+        assert not inline_service.needs_prefetch("noteb")
+        assert not inline_service.needs_prefetch("Notebook G")
+        assert not inline_service.schedule_prefetch(1, "note", limiter)
+        assert not inline_service.schedule_prefetch(1, "tv", limiter)  # too short
+        assert inline_service.needs_prefetch("notebook gamer")
+        assert inline_service.needs_prefetch("geladeira")
+        assert limiter.users == []
+    
+    async def test_refreshes_when_due(self, search_service, session_scope):
+        """Test answering reloads the index after the refresh interval."""
+        clock = FakeClock()
+        inline_service = InlineSearchService(search_service, session_scope=session_scope, clock=clock)
+        
+        inline_service.answer("note")
+        await inline_service._refresh_task
+        assert len(inline_service.index) == 3
+        
+        refresh_task = inline_service._refresh_task
+        inline_service.answer("note")
+        assert inline_service._refresh_task is refresh_task
+        
+        clock.now = inline_service.refresh_interval
+        inline_service.answer("note")
+        assert inline_service._refresh_task is not refresh_task
+        await inline_service._refresh_task
+
+
+class TestBuildArticles:
+    """Tests for the inline result articles."""
+    
+    def test_one_article_per_query(self):
+        """Test each result becomes an article showing its best price."""
+        products = [
+            Product(id="1", name="Notebook A", price=3000.0, marketplace="Amazon", url="https://a.com"),
+            Product(id="2", name="Notebook B", price=2500.0, marketplace="Shopee", url="https://b.com"),
+        ]
+        results = [
+            SearchResult(query="notebook", products=products, total_results=2),
+            SearchResult(query="vazio", products=[], total_results=0),
+        ]
+        
+        articles = _build_articles(results)
+        
+        assert len(articles) == 1
+        assert articles[0].title == "notebook - R$ 2.500,00"
+        assert "Notebook B" in articles[0].input_message_content.message_text
+        assert len(articles[0].id) <= 64
@@ -0,0 +1,96 @@
+"""
+Unit tests for JSON decoding of marketplace responses.
+"""
+
+import json
+import pytest
+from aioresponses import aioresponses
+from src.integrations.mercadolivre_api import MercadoLivreAPI, MLSearchResponse
+from src.utils.json_codec import JsonDecoder, _available_backends
+
+
+PAYLOAD = {
+    "site_id": "MLB",
+    "paging": {"total": 1, "offset": 0},
+    "results": [{
+        "id": "MLB1",
+        "title": "Notebook Gamer",
+        "price": 3999,
+        "original_price": None,
+        "permalink": "https://produto.mercadolivre.com.br/MLB-1",
+        "thumbnail": "http://http2.mlstatic.com/D_1-I.jpg",
+        "currency_id": "BRL",
+        "shipping": {"free_shipping": True, "mode": "me2"},
+        "attributes": [{"id": "BRAND", "value_name": "Acer"}],
+        "seller": {"id": 1, "nickname": "LOJA"}
+    }]
+}
+
+
+class TestJsonDecoder:
+    """Tests for JsonDecoder."""
+    
+    @pytest.mark.parametrize("backend", list(_available_backends()))
+    def test_backends_agree(self, backend):
+        """Test every installed backend decodes the same document."""
+        data = json.dumps(PAYLOAD).encode()
+        
+        assert JsonDecoder(backend).decode(data) == PAYLOAD
+    
+    def test_unknown_backend(self):
+        """Test an unavailable backend is rejected."""
+        with pytest.raises(ValueError):
+            JsonDecoder("simdjson")
+    
+    def test_invalid_json(self):
+        """Test malformed documents raise ValueError."""
+        with pytest.raises(ValueError):
+            JsonDecoder().decode(b'{"results": [')
+    
+    def test_typed_mode_keeps_only_schema_fields(self):
+        """Test typed decoding drops fields _parse_product never reads."""
+        decoder = JsonDecoder()
+        if not decoder.supports_schemas:
+            pytest.skip("msgspec not installed")
+        
+        data = decoder.decode(json.dumps(PAYLOAD).encode(), MLSearchResponse)
+        item = data["results"][0]
+        
+        assert "site_id" not in data
+        assert data["paging"] == {"total": 1}
+        assert "attributes" not in item
+        assert "seller" not in item
+        assert item["shipping"] == {"free_shipping": True}
+        assert item["price"] == 3999.0
+    
+    def test_typed_mode_falls_back_on_mismatch(self):
+        """Test payloads not matching the schema are decoded generically."""
+        payload = {"results": [{"id": 123, "price": "free"}]}
+        
+        data = JsonDecoder().decode(json.dumps(payload).encode(), MLSearchResponse)
+        
+        assert data == payload
+
+
+@pytest.mark.asyncio
+class TestMercadoLivreDecoding:
+    """Tests for decoding inside the Mercado Livre adapter."""
+    
+    async def test_search_parses_typed_response(self):
+        """Test a search response is decoded and parsed into products."""
+        api = MercadoLivreAPI()
+        
+        with aioresponses() as mocked:
+            mocked.get(
+                f"{api.BASE_URL}{api.SEARCH_ENDPOINT}?condition=new&limit={api.max_results}"
+                f"&offset=0&q=notebook&sort=relevance",
+                status=200,
+                body=json.dumps(PAYLOAD)
+            )
+            
+            result = await api.search("notebook")
+        
+        assert result.total_results == 1
+        assert result.products[0].id == "MLB1"
+        assert result.products[0].price == 3999.0
+        assert result.products[0].image_url.endswith("O.jpg")
@@ -0,0 +1,180 @@
+"""
+Unit tests for the Mercado Livre API integration (mocked HTTP).
+"""
+
+import asyncio
+import re
+import pytest
+from aioresponses import aioresponses, CallbackResult
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+from src.integrations.rate_limiter import TokenBucket
+
+
+MULTIGET_URL = re.compile(r"^https://api\.mercadolibre\.com/items\?.*$")
+
+
+def item(product_id: str, price: float = 100.0) -> dict:
+    """Build a multiget item body."""
+    return {
+        "id": product_id,
+        "title": f"Produto {product_id}",
+        "price": price,
+        "permalink": f"https://produto.mercadolivre.com.br/{product_id}",
+        "currency_id": "BRL"
+    }
+
+
+def multiget_callback(calls: list, active: list, peak: list):
+    """Answer multiget calls with one item per requested ID."""
+    async def callback(url, **kwargs):
+        ids = kwargs["params"]["ids"].split(",")
+        calls.append(ids)
+        active.append(1)
+        peak[0] = max(peak[0], len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        
+        payload = [
+            {"code": 404, "body": {"message": "not found"}} if product_id.endswith("X")
+            else {"code": 200, "body": item(product_id)}
+            for product_id in ids
+        ]
+        return CallbackResult(status=200, payload=payload)
+    
+    return callback
+
+
+@pytest.mark.asyncio
+class TestMultiget:
+    """Tests for MercadoLivreAPI.get_products."""
+    
+    async def test_batches_of_twenty(self):
+        """Test IDs are split into multiget calls of at most 20 IDs."""
+        api = MercadoLivreAPI(rate_limiter=TokenBucket("Mercado Livre", rate=0))
+        ids = [f"MLB{i}" for i in range(45)]
+        calls, active, peak = [], [], [0]
+        
+        with aioresponses() as mocked:
+            mocked.get(MULTIGET_URL, callback=multiget_callback(calls, active, peak), repeat=True)
+            
+            products = await api.get_products(ids)
+        
+        assert [len(batch) for batch in calls] == [20, 20, 5]
+        assert set(products) == set(ids)
+        assert products["MLB7"].price == 100.0
+        assert products["MLB7"].marketplace == "Mercado Livre"
+    
+    async def test_bounded_concurrency(self):
+        """Test no more than max_concurrency calls run at once."""
+        api = MercadoLivreAPI(rate_limiter=TokenBucket("Mercado Livre", rate=0))
+        ids = [f"MLB{i}" for i in range(200)]
+        calls, active, peak = [], [], [0]
+        
+        with aioresponses() as mocked:
+            mocked.get(MULTIGET_URL, callback=multiget_callback(calls, active, peak), repeat=True)
+            
+            products = await api.get_products(ids, max_concurrency=3)
+        
+        assert len(calls) == 10
+        assert peak[0] <= 3
+        assert len(products) == 200
+    
+    async def test_missing_items_and_duplicates(self):
+        """Test not found entries are skipped and duplicate IDs sent once."""
+        api = MercadoLivreAPI(rate_limiter=TokenBucket("Mercado Livre", rate=0))
+        calls, active, peak = [], [], [0]
+        
+        with aioresponses() as mocked:
+            mocked.get(MULTIGET_URL, callback=multiget_callback(calls, active, peak), repeat=True)
+            
+            products = await api.get_products(["MLB1", "MLB1", "MLBX"])
+        
+        assert calls == [["MLB1", "MLBX"]]
+        assert list(products) == ["MLB1"]
+    
+    async def test_empty_input(self):
+        """Test no request is made without IDs."""
+        api = MercadoLivreAPI()
+        
+        assert await api.get_products([]) == {}
+
+
+SEARCH_URL = re.compile(r"^https://api\.mercadolibre\.com/sites/MLB/search\?.*$")
+
+
+def search_callback(total: int, offsets: list, active: list, peak: list):
+    """Answer search pages from a catalog of `total` listings."""
+    async def callback(url, **kwargs):
+        offset = int(kwargs["params"]["offset"])
+        limit = int(kwargs["params"]["limit"])
+        offsets.append(offset)
+        active.append(1)
+        peak[0] = max(peak[0], len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        
+        results = []
+        for i in range(offset, min(offset + limit, total)):
+            listing = item(f"MLB{i}", price=100.0)
+            # Every tenth listing is discounted
+            listing["original_price"] = 200.0 if i % 10 == 0 else None
+            results.append(listing)
+        
+        return CallbackResult(
+            status=200,
+            payload={"paging": {"total": total}, "results": results}
+        )
+    
+    return callback
+
+
+@pytest.mark.asyncio
+class TestDeepSearch:
+    """Tests for MercadoLivreAPI.deep_search."""
+    
+    async def test_scans_pages_in_order(self):
+        """Test all pages up to max_items are fetched and kept in order."""
+        api = MercadoLivreAPI(rate_limiter=TokenBucket("Mercado Livre", rate=0))
+        offsets, active, peak = [], [], [0]
+        
+        with aioresponses() as mocked:
+            mocked.get(SEARCH_URL, callback=search_callback(1000, offsets, active, peak), repeat=True)
+            
+            result = await api.deep_search("notebook", max_items=200, max_concurrency=2)
+        
+        assert sorted(offsets) == [0, 50, 100, 150]
+        assert peak[0] <= 2
+        assert [p.id for p in result.products] == [f"MLB{i}" for i in range(200)]
+    
+    async def test_stops_at_total(self):
+        """Test no page past the last result is requested."""
+        api = MercadoLivreAPI(rate_limiter=TokenBucket("Mercado Livre", rate=0))
+        offsets, active, peak = [], [], [0]
+        
+        with aioresponses() as mocked:
+            mocked.get(SEARCH_URL, callback=search_callback(120, offsets, active, peak), repeat=True)
+            
+            result = await api.deep_search("notebook", max_items=500, max_concurrency=1)
+        
+        assert offsets == [0, 50, 100]
+        assert result.total_results == 120
+    
+    async def test_early_stop_with_predicate(self):
+        """Test fetching stops once enough qualifying products are found."""
+        api = MercadoLivreAPI(rate_limiter=TokenBucket("Mercado Livre", rate=0))
+        offsets, active, peak = [], [], [0]
+        
+        with aioresponses() as mocked:
+            mocked.get(SEARCH_URL, callback=search_callback(1000, offsets, active, peak), repeat=True)
+            
+            result = await api.deep_search(
+                "notebook",
+                max_items=500,
+                predicate=lambda p: p.has_discount,
+                target=8,
+                max_concurrency=1
+            )
+        
+        assert len(result.products) == 8
+        assert all(p.has_discount for p in result.products)
+        assert offsets == [0, 50]
@@ -4,7 +4,7 @@ Unit tests for product models.
 
 import pytest
 from datetime import datetime
-from src.models.product import Product, SearchResult
+from src.models.product import MIN_PRICE, Product, SearchResult
 
 
 class TestProduct:
@@ -68,6 +68,60 @@ class TestProduct:
         formatted = product.format_price()
         assert "1.299,90" in formatted
         assert "R$" in formatted
+    
+    def test_from_trusted_matches_validated(self):
+        """Test a trusted product equals the validated one and fills defaults."""
+        fields = dict(
+            id="MLB123",
+            name="Test",
+            price=1299.90,
+            marketplace="Mercado Livre",
+            url="https://test.com"
+        )
+        
+        trusted = Product.from_trusted(**fields)
+        validated = Product(**fields)
+        
+        assert trusted.model_dump(exclude={'timestamp'}) == validated.model_dump(exclude={'timestamp'})
+        assert trusted.currency == "BRL"
+        assert trusted.image_url is None
+        assert trusted.timestamp is not None
+    
+    def test_with_coupon_copies_product(self):
+        """Test applying a coupon returns a copy and leaves the original intact."""
+        product = Product(
+            id="MLB123",
+            name="Test",
+            price=100.0,
+            marketplace="Mercado Livre",
+            url="https://test.com"
+        )
+        
+        discounted = product.with_coupon(90.0, "TECH10", 10.0)
+        
+        assert discounted is not product
+        assert discounted.price == 90.0
+        assert discounted.original_price == 100.0
+        assert discounted.coupon_code == "TECH10"
+        assert discounted.timestamp == product.timestamp
+        assert product.price == 100.0
+        assert product.coupon_code is None
+    
+    def test_with_coupon_keeps_price_positive(self):
+        """Test a coupon worth more than the price cannot zero it."""
+        product = Product(
+            id="MLB123",
+            name="Test",
+            price=30.0,
+            marketplace="Mercado Livre",
+            url="https://test.com"
+        )
+        
+        discounted = product.with_coupon(0.0, "VALE50", 166.7)
+        
+        assert discounted.price == MIN_PRICE
+        assert discounted.discount_percentage == 100.0
+        assert Product.model_validate(discounted.model_dump()) == discounted
 
 
 class TestSearchResult:
@@ -2,8 +2,18 @@
 Unit tests for normalizer utilities.
 """
 
+import re
+import unicodedata
+
 import pytest
-from src.utils.normalizer import ProductNormalizer, group_similar_products
+from src.config import Config
+from src.utils import similarity
+from src.utils.normalizer import (
+    ProductNormalizer,
+    _normalize_cached,
+    group_similar_products,
+    similarity_candidates
+)
 from src.models.product import Product
 
 
@@ -29,6 +39,49 @@ class TestProductNormalizer:
         assert "ó" not in normalized
         assert "ú" not in normalized
     
+    def test_fast_path_matches_nfd(self):
+        """Test the translation table gives the same result as full NFD stripping."""
+        def nfd_normalize(text):
+            stripped = ''.join(
+                c for c in unicodedata.normalize('NFD', text.lower())
+                if unicodedata.category(c) != 'Mn'
+            )
+            return ' '.join(re.sub(r'[^a-z0-9\s]', ' ', stripped).split())
+        
+        texts = [
+            "Pão de Açúcar Ñandú",
+            "Tênis Nike Air Max 90 – Edição Especial",
+            "Café Ôlho d'Água ÀÉÎÕÜ",
+            "Smartphone Xiaomi 13 Pro ™ 256 GB",
+            "cafe\u0301 com acento combinado",
+            "Straße Øresund Łódź",
+            "Ελληνικά ά",
+        ]
+        
+        for text in texts:
+            assert ProductNormalizer.normalize_text(text) == nfd_normalize(text)
+    
+    def test_normalize_is_memoized(self):
+        """Test repeated names are served from the cache."""
+        _normalize_cached.cache_clear()
+        
+        ProductNormalizer.normalize_text("Air Fryer Mondial 4L")
+        ProductNormalizer.normalize_text("Air Fryer Mondial 4L")
+        
+        info = _normalize_cached.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+    
+    def test_normalize_batch(self):
+        """Test batch normalization keeps order and handles empty names."""
+        names = ["Geladeira Brastemp Frost Free", "", "GELADEIRA brastemp"]
+        
+        assert ProductNormalizer.normalize_batch(names) == [
+            "geladeira brastemp frost free",
+            "",
+            "geladeira brastemp"
+        ]
+    
     def test_extract_keywords(self):
         """Test keyword extraction."""
         text = "Notebook Dell Inspiron 15 com i5 e 8GB de RAM"
@@ -165,3 +218,57 @@ class TestGroupSimilarProducts:
         groups = group_similar_products(products)
         assert len(groups) == 1
         assert len(groups[0]) == 1
+    
+    def test_blocked_grouping_matches_all_pairs(self, monkeypatch):
+        """Test grouping with candidate blocking returns the same groups."""
+        names = [
+            "Notebook Dell Inspiron 15 i5 8GB",
+            "iPhone 13 128GB Azul",
+            "DELL INSPIRON 15 NOTEBOOK i5 8GB RAM",
+            "Apple iPhone 13 128GB Azul Lacrado",
+            "Air Fryer Mondial 4L",
+            "Fritadeira Air Fryer Mondial 4L Preta",
+            "Notebook Lenovo IdeaPad 3 Ryzen 5",
+        ]
+        products = [
+            Product(id=str(i), name=name, price=100.0, marketplace="Test", url="https://test.com")
+            for i, name in enumerate(names)
+        ]
+        
+        monkeypatch.setattr(similarity, 'rapid_process', None)
+        monkeypatch.setattr(Config, 'GROUPING_BLOCKING_MIN_PRODUCTS', len(products) + 1)
+        exhaustive = group_similar_products(products, threshold=70.0)
+        monkeypatch.setattr(Config, 'GROUPING_BLOCKING_MIN_PRODUCTS', 1)
+        blocked = group_similar_products(products, threshold=70.0)
+        
+        assert [[p.id for p in g] for g in blocked] == [[p.id for p in g] for g in exhaustive]
+        assert len(blocked) < len(products)
+
+
+class TestSimilarityCandidates:
+    """Tests for candidate pair generation."""
+    
+    def test_common_tokens_do_not_pair_everything(self):
+        """Test tokens shared by the whole batch (the query) are not used to pair names."""
+        names = ProductNormalizer.normalize_batch([
+            "notebook dell inspiron 15 i5",
+            "notebook dell inspiron 15 i5 8gb",
+            "notebook acer aspire 5 ryzen",
+            "notebook acer aspire 5 ryzen 7",
+            "notebook lenovo ideapad 3 celeron",
+        ])
+        
+        candidates = similarity_candidates(names, threshold=70.0)
+        
+        assert 1 in candidates[0]
+        assert 3 in candidates[2]
+        assert 4 not in candidates[0]
+        assert candidates[4] == []
+    
+    def test_length_bound(self):
+        """Test pairs too different in length to reach the threshold are skipped."""
+        names = ["tv", "tv samsung 55 polegadas crystal uhd 4k smart"]
+        
+        # Index every token so only the length bound can drop the pair
+        assert similarity_candidates(names, threshold=70.0, min_token_overlap=0.0) == [[], []]
+        assert similarity_candidates(names, threshold=1.0, min_token_overlap=0.0) == [[1], []]
@@ -0,0 +1,93 @@
+"""
+Unit tests for the popular query prefix index.
+"""
+
+import pytest
+from src.utils.prefix_index import PrefixIndex
+
+
+class TestPrefixIndex:
+    """Tests for PrefixIndex."""
+    
+    def test_search_by_prefix(self):
+        """Test keys starting with the prefix are ranked by score."""
+        index = PrefixIndex()
+        index.add("notebook dell", 5)
+        index.add("notebook", 3)
+        index.add("notebook gamer", 9)
+        index.add("nintendo switch", 20)
+        index.add("iphone 15", 50)
+        
+        assert index.search("note") == ["notebook gamer", "notebook dell", "notebook"]
+        assert index.search("n", limit=2) == ["nintendo switch", "notebook gamer"]
+        assert index.search("xbox") == []
+    
+    def test_exact_key_first(self):
+        """Test the prefix itself comes first when indexed."""
+        index = PrefixIndex()
+        index.add("notebook", 1)
+        index.add("notebook gamer", 9)
+        
+        assert index.search("notebook") == ["notebook", "notebook gamer"]
+    
+    def test_empty_prefix_lists_most_popular(self):
+        """Test an empty prefix matches every key."""
+        index = PrefixIndex()
+        index.update([("mouse", 2), ("fone", 7), ("tv", 4)])
+        
+        assert index.search("", limit=2) == ["fone", "tv"]
+    
+    def test_add_keeps_higher_score(self):
+        """Test re-adding a key never lowers its score."""
+        index = PrefixIndex()
+        index.add("notebook", 5)
+        index.add("notebook", 1)
+        index.add("notebook gamer", 3)
+        
+        assert index.search("note") == ["notebook", "notebook gamer"]
+        assert len(index) == 2
+    
+    def test_size_bound_evicts_lowest_score(self):
+        """Test the lowest scored key is dropped beyond max_entries."""
+        index = PrefixIndex(max_entries=2)
+        index.add("a", 5)
+        index.add("b", 1)
+        index.add("c", 3)
+        
+        assert "b" not in index
+        assert index.search("") == ["a", "c"]
+        assert index.evictions == 1
+        
+        # A new key scoring below every indexed key is not kept
+        assert not index.add("d", 0)
+        assert len(index) == 2
+    
+    def test_update_bound(self):
+        """Test bulk loading keeps the best scored keys."""
+        index = PrefixIndex(max_entries=3)
+        index.update((f"query {i}", i) for i in range(10))
+        
+        assert index.search("query") == ["query 9", "query 8", "query 7"]
+        assert index.evictions == 7
+    
+    def test_long_keys_not_indexed(self):
+        """Test keys beyond max_key_length are skipped."""
+        index = PrefixIndex(max_key_length=10)
+        
+        assert not index.add("notebook gamer rgb")
+        assert not index.add("")
+        assert len(index) == 0
+    
+    def test_remove(self):
+        """Test removing a key."""
+        index = PrefixIndex()
+        index.update([("notebook", 1), ("notebook dell", 2)])
+        
+        assert index.remove("notebook")
+        assert not index.remove("notebook")
+        assert index.search("note") == ["notebook dell"]
+    
+    def test_invalid_size(self):
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            PrefixIndex(max_entries=0)
@@ -0,0 +1,137 @@
+"""
+Unit tests for the outbound rate limiter.
+"""
+
+import asyncio
+import pytest
+from aioresponses import aioresponses
+from src.integrations.rate_limiter import TokenBucket, rate_limit_fail_fast
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+from src.utils.metrics import get_metrics
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+    
+    def test_burst_then_refill(self):
+        """Test the burst is spent and tokens refill over time."""
+        clock = FakeClock()
+        bucket = TokenBucket("Test Store", rate=2, capacity=3, clock=clock)
+        
+        assert all(bucket.try_acquire() for _ in range(3))
+        assert not bucket.try_acquire()
+        
+        clock.now = 0.5
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+    
+    def test_refill_is_capped(self):
+        """Test idle time never adds more than the capacity."""
+        clock = FakeClock()
+        bucket = TokenBucket("Test Store", rate=10, capacity=2, clock=clock)
+        
+        clock.now = 100.0
+        assert bucket.tokens == 2
+    
+    def test_disabled(self):
+        """Test a zero rate never limits."""
+        bucket = TokenBucket("Test Store", rate=0)
+        
+        assert all(bucket.try_acquire() for _ in range(100))
+    
+    def test_rejections_are_exported(self):
+        """Test rejected requests are counted in the metrics registry."""
+        get_metrics().reset()
+        bucket = TokenBucket("Test Store", rate=1, capacity=1, clock=FakeClock())
+        
+        bucket.try_acquire()
+        bucket.try_acquire()
+        
+        assert bucket.rejected == 1
+        assert get_metrics().get("rate_limiter.test_store.rejected") == 1
+
+
+@pytest.mark.asyncio
+class TestTokenBucketAsync:
+    """Tests for waiting on the token bucket."""
+    
+    async def test_waits_for_token(self):
+        """Test an empty bucket makes the caller wait for the next token."""
+        get_metrics().reset()
+        bucket = TokenBucket("Test Store", rate=20, capacity=1)
+        loop = asyncio.get_running_loop()
+        
+        assert await bucket.acquire()
+        start = loop.time()
+        assert await bucket.acquire(max_wait=1.0)
+        
+        assert loop.time() - start >= 0.04
+        summary = get_metrics().summaries["rate_limiter.test_store.wait_seconds"]
+        assert summary.count == 2
+        assert summary.maximum > 0
+    
+    async def test_rejects_beyond_max_wait(self):
+        """Test a caller is rejected when the wait exceeds its limit."""
+        bucket = TokenBucket("Test Store", rate=1, capacity=1)
+        
+        assert await bucket.acquire(max_wait=0)
+        assert not await bucket.acquire(max_wait=0.5)
+        assert bucket.rejected == 1
+    
+    async def test_waiters_queue_in_order(self):
+        """Test concurrent waiters reserve successive tokens."""
+        bucket = TokenBucket("Test Store", rate=50, capacity=1)
+        
+        results = await asyncio.gather(*[bucket.acquire(max_wait=1.0) for _ in range(5)])
+        
+        assert results == [True] * 5
+        assert bucket.acquired == 5
+    
+    async def test_cancelled_waiter_returns_token(self):
+        """Test cancelling a waiter releases its reservation."""
+        clock = FakeClock()
+        bucket = TokenBucket("Test Store", rate=1, capacity=1, clock=clock)
+        
+        await bucket.acquire()
+        waiter = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)
+        assert bucket.tokens == -1
+        
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        
+        assert bucket.tokens == 0
+
+
+@pytest.mark.asyncio
+class TestRateLimiterIntegration:
+    """Tests for the limiter inside BaseMarketplaceAPI."""
+    
+    async def test_fail_fast_skips_request(self):
+        """Test no request is sent when out of tokens in fail-fast mode."""
+        api = MercadoLivreAPI(
+            rate_limiter=TokenBucket("Mercado Livre", rate=0.1, capacity=1)
+        )
+        url = f"{api.BASE_URL}/items/MLB1"
+        
+        with aioresponses() as mocked:
+            mocked.get(url, status=200, payload={'id': 'MLB1'})
+            mocked.get(url, status=200, payload={'id': 'MLB1'})
+            
+            with rate_limit_fail_fast():
+                assert await api._make_request(url) == {'id': 'MLB1'}
+                assert await api._make_request(url) is None
+            
+            sent = sum(len(calls) for calls in mocked.requests.values())
+            assert sent == 1
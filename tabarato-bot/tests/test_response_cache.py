@@ -0,0 +1,162 @@
+"""
+Unit tests for the conditional-request response cache.
+"""
+
+from contextlib import asynccontextmanager
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.integrations import http_client as http_module
+from src.integrations.http_client import HttpClient
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+from src.integrations.rate_limiter import TokenBucket
+from src.integrations.response_cache import ResponseCache
+
+
+class ItemServer:
+    """Local stand-in for the item endpoint, honoring conditional headers."""
+    
+    def __init__(self):
+        self.version = 1
+        self.requests = []
+        self.use_etag = True
+    
+    async def handle_item(self, request: web.Request) -> web.Response:
+        self.requests.append(dict(request.headers))
+        etag = f'"v{self.version}"'
+        last_modified = f"Mon, 0{self.version} Jan 2024 00:00:00 GMT"
+        
+        if self.use_etag and request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        if not self.use_etag and request.headers.get("If-Modified-Since") == last_modified:
+            return web.Response(status=304)
+        
+        headers = {"ETag": etag} if self.use_etag else {"Last-Modified": last_modified}
+        return web.json_response(
+            {"id": request.match_info["item_id"], "price": 100.0 * self.version},
+            headers=headers
+        )
+    
+    async def handle_search(self, request: web.Request) -> web.Response:
+        self.requests.append(dict(request.headers))
+        return web.json_response({"results": []}, headers={"ETag": '"s1"'})
+
+
+@asynccontextmanager
+async def running_server():
+    """Run a local item server (and an HTTP pool on this loop) for the block."""
+    state = ItemServer()
+    app = web.Application()
+    app.router.add_get("/items/{item_id}", state.handle_item)
+    app.router.add_get("/sites/MLB/search", state.handle_search)
+    
+    server = TestServer(app)
+    await server.start_server()
+    state.url = str(server.make_url("")).rstrip("/")
+    
+    previous_client = http_module._http_client
+    http_module._http_client = HttpClient()
+    try:
+        yield state
+    finally:
+        await http_module._http_client.close()
+        http_module._http_client = previous_client
+        await server.close()
+
+
+def make_api(max_size: int = 10) -> MercadoLivreAPI:
+    """Mercado Livre adapter with an unlimited rate and a small cache."""
+    return MercadoLivreAPI(
+        rate_limiter=TokenBucket("Mercado Livre", rate=0),
+        response_cache=ResponseCache(
+            "Mercado Livre", MercadoLivreAPI.RESPONSE_CACHE_POLICIES, max_size=max_size
+        )
+    )
+
+
+class TestResponseCachePolicies:
+    """Tests for endpoint policies."""
+    
+    def test_ttl_for(self):
+        """Test only configured endpoints are cached."""
+        cache = ResponseCache("Test", MercadoLivreAPI.RESPONSE_CACHE_POLICIES)
+        
+        assert cache.ttl_for("https://api.mercadolibre.com/items/MLB1") == 600
+        assert cache.ttl_for("https://api.mercadolibre.com/categories/MLB1051") == 86400
+        assert cache.ttl_for("https://api.mercadolibre.com/sites/MLB/search") is None
+        assert cache.ttl_for("https://api.mercadolibre.com/items") is None
+    
+    def test_key_ignores_param_order(self):
+        """Test equivalent parameter dicts share a key."""
+        key1 = ResponseCache.make_key("u", {"a": 1, "b": 2})
+        key2 = ResponseCache.make_key("u", {"b": 2, "a": 1})
+        
+        assert key1 == key2
+
+
+@pytest.mark.asyncio
+class TestConditionalRequests:
+    """Tests for revalidation against a local server."""
+    
+    async def test_etag_revalidation(self):
+        """Test an unchanged item is answered by 304 and served from the cache."""
+        async with running_server() as item_server:
+            api = make_api()
+            url = f"{item_server.url}/items/MLB1"
+            
+            first = await api._make_request(url)
+            second = await api._make_request(url)
+            
+            assert first == second == {"id": "MLB1", "price": 100.0}
+            assert "If-None-Match" not in item_server.requests[0]
+            assert item_server.requests[1]["If-None-Match"] == '"v1"'
+            assert api.response_cache.revalidated == 1
+    
+    async def test_changed_item_is_downloaded(self):
+        """Test a new version replaces the cached body."""
+        async with running_server() as item_server:
+            api = make_api()
+            url = f"{item_server.url}/items/MLB1"
+            
+            await api._make_request(url)
+            item_server.version = 2
+            
+            assert (await api._make_request(url))["price"] == 200.0
+            assert (await api._make_request(url))["price"] == 200.0
+            assert api.response_cache.revalidated == 1
+    
+    async def test_last_modified_revalidation(self):
+        """Test Last-Modified is used when there is no ETag."""
+        async with running_server() as item_server:
+            item_server.use_etag = False
+            api = make_api()
+            url = f"{item_server.url}/items/MLB1"
+            
+            await api._make_request(url)
+            await api._make_request(url)
+            
+            assert "If-Modified-Since" in item_server.requests[1]
+            assert api.response_cache.revalidated == 1
+    
+    async def test_uncached_endpoint(self):
+        """Test endpoints without a policy are never revalidated."""
+        async with running_server() as item_server:
+            api = make_api()
+            url = f"{item_server.url}/sites/MLB/search"
+            
+            await api._make_request(url)
+            await api._make_request(url)
+            
+            assert all("If-None-Match" not in headers for headers in item_server.requests)
+            assert len(api.response_cache) == 0
+    
+    async def test_size_bound(self):
+        """Test the least recently used response is evicted."""
+        async with running_server() as item_server:
+            api = make_api(max_size=2)
+            
+            for item_id in ("MLB1", "MLB2", "MLB3"):
+                await api._make_request(f"{item_server.url}/items/{item_id}")
+            
+            assert len(api.response_cache) == 2
+            assert api.response_cache.stats()['evictions'] == 1
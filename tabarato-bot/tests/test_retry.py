@@ -0,0 +1,153 @@
+"""
+Unit tests for HTTP retries and request deadlines.
+"""
+
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import pytest
+from aioresponses import aioresponses
+from src.integrations.retry import RetryPolicy
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+from src.utils.deadline import deadline_scope, remaining_time
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+    
+    def test_only_idempotent_methods_retry(self):
+        """Test GET is retried and POST is not."""
+        policy = RetryPolicy(max_attempts=3)
+        
+        assert policy.can_retry("GET", 1)
+        assert policy.can_retry("get", 2)
+        assert not policy.can_retry("GET", 3)
+        assert not policy.can_retry("POST", 1)
+    
+    def test_retryable_statuses(self):
+        """Test rate limiting and gateway errors are retryable."""
+        policy = RetryPolicy()
+        
+        assert policy.is_retryable_status(429)
+        assert policy.is_retryable_status(503)
+        assert not policy.is_retryable_status(404)
+    
+    def test_backoff_is_bounded(self):
+        """Test jittered backoff stays under the exponential ceiling."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+        
+        for _ in range(100):
+            assert 0 <= policy.backoff(1) <= 0.1
+            assert 0 <= policy.backoff(2) <= 0.2
+            assert 0 <= policy.backoff(5) <= 0.3
+    
+    def test_retry_after_seconds(self):
+        """Test a Retry-After delay replaces the backoff."""
+        policy = RetryPolicy(max_retry_after=5)
+        
+        assert policy.next_delay(1, "2") == 2.0
+        assert policy.next_delay(1, "10") is None
+    
+    def test_retry_after_ignored(self):
+        """Test Retry-After can be disabled."""
+        policy = RetryPolicy(base_delay=0.1, respect_retry_after=False)
+        
+        assert policy.next_delay(1, "60") <= 0.1
+    
+    def test_parse_retry_after_date(self):
+        """Test HTTP-date Retry-After values."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        
+        seconds = RetryPolicy.parse_retry_after(format_datetime(retry_at, usegmt=True))
+        
+        assert 28 <= seconds <= 30
+        assert RetryPolicy.parse_retry_after("soon") is None
+
+
+class TestDeadline:
+    """Tests for request deadlines."""
+    
+    def test_no_deadline(self):
+        """Test there is no deadline outside a scope."""
+        assert remaining_time() is None
+    
+    def test_nested_scopes_only_tighten(self):
+        """Test an inner scope cannot extend the outer deadline."""
+        with deadline_scope(1.0):
+            with deadline_scope(10.0):
+                assert remaining_time() <= 1.0
+            
+            with deadline_scope(0.5):
+                assert remaining_time() <= 0.5
+        
+        assert remaining_time() is None
+
+
+@pytest.mark.asyncio
+class TestRetryIntegration:
+    """Tests for retries inside BaseMarketplaceAPI."""
+    
+    async def test_retries_until_success(self):
+        """Test a transient 503 is retried and the next response is used."""
+        api = MercadoLivreAPI(retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01))
+        url = f"{api.BASE_URL}/items/MLB1"
+        
+        with aioresponses() as mocked:
+            mocked.get(url, status=503)
+            mocked.get(url, status=200, payload={'id': 'MLB1'})
+            
+            assert await api._make_request(url) == {'id': 'MLB1'}
+    
+    async def test_gives_up_after_max_attempts(self):
+        """Test the request fails once all attempts are used."""
+        api = MercadoLivreAPI(retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01))
+        url = f"{api.BASE_URL}/items/MLB1"
+        
+        with aioresponses() as mocked:
+            for _ in range(3):
+                mocked.get(url, status=500)
+            
+            assert await api._make_request(url) is None
+            
+            sent = sum(len(calls) for calls in mocked.requests.values())
+            assert sent == 2
+    
+    async def test_client_errors_are_not_retried(self):
+        """Test a 404 is returned without retrying."""
+        api = MercadoLivreAPI(retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01))
+        url = f"{api.BASE_URL}/items/MLB1"
+        
+        with aioresponses() as mocked:
+            mocked.get(url, status=404)
+            mocked.get(url, status=200, payload={'id': 'MLB1'})
+            
+            assert await api._make_request(url) is None
+    
+    async def test_retry_after_beyond_deadline_stops(self):
+        """Test a Retry-After longer than the deadline is not waited for."""
+        api = MercadoLivreAPI(retry_policy=RetryPolicy(max_attempts=3, max_retry_after=10))
+        url = f"{api.BASE_URL}/items/MLB1"
+        
+        with aioresponses() as mocked:
+            mocked.get(url, status=429, headers={'Retry-After': '5'})
+            mocked.get(url, status=200, payload={'id': 'MLB1'})
+            
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            
+            with deadline_scope(1.0):
+                assert await api._make_request(url) is None
+            
+            assert loop.time() - start < 0.5
+    
+    async def test_retry_after_is_honored(self):
+        """Test the client waits for a short Retry-After then succeeds."""
+        api = MercadoLivreAPI(retry_policy=RetryPolicy(max_attempts=2))
+        url = f"{api.BASE_URL}/items/MLB1"
+        
+        with aioresponses() as mocked:
+            mocked.get(url, status=429, headers={'Retry-After': '0'})
+            mocked.get(url, status=200, payload={'id': 'MLB1'})
+            
+            with deadline_scope(1.0):
+                assert await api._make_request(url) == {'id': 'MLB1'}
@@ -0,0 +1,198 @@
+"""
+Unit tests for the scheduled deal scan.
+"""
+
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.database.models import Base
+from src.integrations.mercadolivre_api import MercadoLivreAPI
+from src.integrations.rate_limiter import is_fail_fast
+from src.models.product import Product, SearchResult
+from src.services import price_service as price_module
+from src.services import scheduler as scheduler_module
+from src.services.catalog_service import CatalogService
+from src.services.price_service import PriceService, get_price_service
+from src.services.scheduler import TaskScheduler
+from src.utils import normalizer
+from src.utils.executor import CpuExecutor
+from src.utils.metrics import MetricsRegistry
+
+
+def make_product(
+    product_id: str,
+    price: float = 1000.0,
+    name: str = "",
+    marketplace: str = "Mercado Livre"
+) -> Product:
+    """Build a listing (a Mercado Livre one by default)."""
+    return Product(
+        id=product_id,
+        name=name or f"Notebook {product_id}",
+        price=price,
+        marketplace=marketplace,
+        url="https://test.com"
+    )
+
+
+class FakeMercadoLivre(MercadoLivreAPI):
+    """Mercado Livre stub recording how deep searches are run."""
+    
+    def __init__(self):
+        self.fail_fast = []
+    
+    async def deep_search(self, query, predicate=None, target=None, **kwargs) -> SearchResult:
+        self.fail_fast.append(is_fail_fast())
+        product = make_product(f"{query}-deep", name=f"Cabo USB {query} Deep Reforçado")
+        return SearchResult(query=query, products=[product], total_results=1)
+
+
+class FakeSearchService:
+    """Search service stub returning one listing per term."""
+    
+    def __init__(self):
+        self.marketplaces = [FakeMercadoLivre()]
+    
+    async def search_all(self, query: str) -> SearchResult:
+        # Two listings of one product
+        products = [
+            make_product(f"{query}-1", 1000.0, f"Produto {query} Modelo X"),
+            make_product(f"{query}-2", 900.0, f"Produto {query} Modelo X", "Amazon")
+        ]
+        return SearchResult(query=query, products=products, total_results=2)
+
+
+class FakeChannelService:
+    """Channel service stub recording the deals offered for posting."""
+    
+    def __init__(self):
+        self.offered = []
+    
+    def is_good_deal(self, product: Product) -> bool:
+        return True
+    
+    async def post_best_deals(self, products, max_posts: int = 3) -> int:
+        self.offered.append(products)
+        return 0
+
+
+@pytest.fixture
+def price_service(monkeypatch):
+    """Price service grouping with in-memory clusters."""
+    service = PriceService()
+    service.catalog_grouping = False
+    monkeypatch.setattr(scheduler_module, "get_price_service", lambda: service)
+    return service
+
+
+@pytest.fixture
+def scan(monkeypatch, price_service):
+    """Scheduler wired to stub search and channel services."""
+    search_service = FakeSearchService()
+    channel_service = FakeChannelService()
+    monkeypatch.setattr(scheduler_module, "get_search_service", lambda: search_service)
+    monkeypatch.setattr(scheduler_module, "get_channel_service", lambda: channel_service)
+    return TaskScheduler(), search_service, channel_service
+
+
+@pytest.mark.asyncio
+class TestDealScan:
+    """Tests for the scheduled deal scan."""
+    
+    async def test_deep_search_fails_fast(self, scan):
+        """Test the deep scan never waits for rate limit tokens."""
+        scheduler, search_service, channel_service = scan
+        
+        await scheduler._search_and_post_deals()
+        
+        mercadolivre = search_service.marketplaces[0]
+        assert mercadolivre.fail_fast and all(mercadolivre.fail_fast)
+        assert not is_fail_fast()
+        assert len(channel_service.offered) == len(mercadolivre.fail_fast)
+    
+    async def test_offers_cheapest_listing_per_product(self, scan):
+        """Test listings of one product are offered once, at the lowest price."""
+        scheduler, _, channel_service = scan
+        
+        await scheduler._search_and_post_deals()
+        
+        offered = channel_service.offered[0]
+        assert [p.id for p in offered] == ["notebook-2", "notebook-deep"]
+    
+    async def test_clusters_persist_across_scans(self, scan, price_service):
+        """Test a second scan groups the listings seen before by lookup."""
+        scheduler, _, channel_service = scan
+        
+        await scheduler._search_and_post_deals()
+        clusters = price_service.clusterer.cluster_count
+        created = price_service.clusterer.created
+        
+        await scheduler._search_and_post_deals()
+        
+        assert price_service.clusterer.created == created
+        assert price_service.clusterer.cluster_count == clusters
+        assert price_service.clusterer.known > 0
+        first, second = channel_service.offered[0], channel_service.offered[len(channel_service.offered) // 2]
+        assert [p.id for p in second] == [p.id for p in first]
+    
+    async def test_catalog_matching_uses_cpu_executor(self, scan, price_service, monkeypatch):
+        """Test the scan's catalog grouping fuzzy matches through the CPU executor."""
+        # One shared connection, so the database is visible from worker threads
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine)
+        
+        @contextmanager
+        def session_scope():
+            session = factory()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+        
+        catalog = CatalogService(session_scope=session_scope)
+        metrics = MetricsRegistry()
+        executor = CpuExecutor(max_workers=0, metrics=metrics)
+        monkeypatch.setattr(price_module, "get_catalog_service", lambda: catalog)
+        monkeypatch.setattr(normalizer, "get_cpu_executor", lambda: executor)
+        price_service.catalog_grouping = True
+        scheduler, _, channel_service = scan
+        
+        await scheduler._search_and_post_deals()
+        
+        assert metrics.get("executor.inline") == len(channel_service.offered)
+        assert [p.id for p in channel_service.offered[0]] == ["notebook-2", "notebook-deep"]
+
+
+class TestMergeDeepResults:
+    """Tests for TaskScheduler.merge_deep_results."""
+    
+    def test_skips_listings_already_found(self):
+        """Test page-1 listings found again by the deep search are not repeated."""
+        products = get_price_service().apply_coupons([make_product("ML1")])
+        
+        merged = TaskScheduler.merge_deep_results(
+            products,
+            [make_product("ML1"), make_product("ML2"), make_product("ML2")]
+        )
+        
+        assert [p.id for p in merged] == ["ML1", "ML2"]
+        assert merged[0] is products[0]
+    
+    def test_prices_deep_listings(self):
+        """Test deep listings get coupons applied like search results."""
+        deep = make_product("ML2", price=2000.0)
+        
+        merged = TaskScheduler.merge_deep_results([], [deep])
+        expected = get_price_service().apply_coupons([deep])[0]
+        
+        assert merged[0].coupon_code is not None
+        assert merged[0].final_price == expected.final_price
+        assert merged[0].coupon_code == expected.coupon_code
@@ -0,0 +1,88 @@
+"""
+Unit tests for the search repository (in-memory SQLite).
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.database.models import Base, Search
+from src.database.repositories import SearchRepository, UserRepository
+from src.models.product import Product, SearchResult
+
+
+@pytest.fixture
+def session():
+    """Session bound to a fresh in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def make_result(query: str, price: float = 100.0) -> SearchResult:
+    """Build a search result with one product."""
+    product = Product(
+        id="MLB1",
+        name=f"{query} produto",
+        price=price,
+        original_price=price * 2,
+        marketplace="Mercado Livre",
+        url="https://test.com",
+        coupon_code="TESTE10"
+    )
+    return SearchResult(query=query, products=[product], total_results=1, search_time=1.5)
+
+
+class TestRecentResult:
+    """Tests for SearchRepository.get_recent_result."""
+    
+    def test_rebuilds_stored_result(self, session):
+        """Test the latest stored products are returned as a stale result."""
+        user = UserRepository.get_or_create(session, telegram_id="1")
+        SearchRepository.create_search(session, user, make_result("notebook", 100.0))
+        SearchRepository.create_search(session, user, make_result("notebook", 90.0))
+        
+        result = SearchRepository.get_recent_result(session, "notebook", timedelta(hours=1))
+        
+        assert result.stale
+        assert result.total_results == 1
+        assert result.products[0].price == 90.0
+        assert result.products[0].coupon_code == "TESTE10"
+        assert result.age < timedelta(minutes=1)
+    
+    def test_old_results_are_ignored(self, session):
+        """Test results older than the window are not returned."""
+        user = UserRepository.get_or_create(session, telegram_id="1")
+        search = SearchRepository.create_search(session, user, make_result("notebook"))
+        search.created_at = datetime.utcnow() - timedelta(hours=2)
+        session.commit()
+        
+        assert SearchRepository.get_recent_result(session, "notebook", timedelta(hours=1)) is None
+    
+    def test_searches_without_products_are_skipped(self, session):
+        """Test a search saved without products does not hide the stored one."""
+        user = UserRepository.get_or_create(session, telegram_id="1")
+        SearchRepository.create_search(session, user, make_result("notebook", 100.0))
+        SearchRepository.create_search(
+            session, user, make_result("notebook", 50.0), save_products=False
+        )
+        
+        result = SearchRepository.get_recent_result(session, "notebook", timedelta(hours=1))
+        
+        assert session.query(Search).count() == 2
+        assert result.products[0].price == 100.0
+    
+    def test_matches_other_spellings(self, session):
+        """Test a case, accent or spacing variant finds the stored result."""
+        user = UserRepository.get_or_create(session, telegram_id="1")
+        SearchRepository.create_search(session, user, make_result("Geladeira Frost Free", 100.0))
+        SearchRepository.create_search(session, user, make_result("fogão", 80.0))
+        
+        result = SearchRepository.get_recent_result(session, "geladeira  frost free ", timedelta(hours=1))
+        
+        assert result.query == "geladeira  frost free "
+        assert result.products[0].price == 100.0
+        assert SearchRepository.get_recent_result(session, "Fogao", timedelta(hours=1)).products[0].price == 80.0
+        assert SearchRepository.get_recent_result(session, "geladeira", timedelta(hours=1)) is None
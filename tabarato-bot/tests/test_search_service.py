@@ -0,0 +1,284 @@
+"""
+Unit tests for SearchService orchestration (cache, coalescing, streaming).
+"""
+
+import asyncio
+import pytest
+from src.integrations.circuit_breaker import CircuitBreaker
+from src.models.product import Product, SearchResult
+from src.services import search_service as search_module
+from src.services.search_service import SearchService
+
+
+class PassThroughPriceService:
+    """Price service stub that leaves results untouched."""
+    
+    def compare_prices(self, search_result: SearchResult) -> SearchResult:
+        return search_result
+
+
+class FakeMarketplace:
+    """Marketplace stub answering after a fixed delay."""
+    
+    def __init__(self, name: str, delay: float, price: float):
+        self.marketplace_name = name
+        self.delay = delay
+        self.price = price
+        self.calls = 0
+        self.circuit_breaker = CircuitBreaker(name)
+    
+    async def search(self, query: str) -> SearchResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        product = Product(
+            id=f"{self.marketplace_name}-1",
+            name=f"{query} {self.marketplace_name}",
+            price=self.price,
+            marketplace=self.marketplace_name,
+            url="https://test.com"
+        )
+        return SearchResult(
+            query=query,
+            products=[product],
+            total_results=1,
+            search_time=self.delay
+        )
+    
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """SearchService wired to fake marketplaces."""
+    monkeypatch.setattr(
+        search_module, "get_price_service", lambda: PassThroughPriceService()
+    )
+    service = SearchService()
+    service.marketplaces = [
+        FakeMarketplace("Slow", delay=0.05, price=100.0),
+        FakeMarketplace("Fast", delay=0.01, price=200.0),
+    ]
+    return service
+
+
+@pytest.mark.asyncio
+class TestSearchService:
+    """Tests for SearchService."""
+    
+    async def test_search_all_uses_cache(self, service):
+        """Test a repeated query is served from the cache."""
+        first = await service.search_all("Notebook Gamer")
+        second = await service.search_all("notebook  gamer")
+        
+        assert first.total_results == 2
+        assert second.total_results == 2
+        assert second.query == "notebook  gamer"
+        assert all(m.calls == 1 for m in service.marketplaces)
+        assert service.cache.hits == 1
+    
+    async def test_cached_result_is_a_copy(self, service):
+        """Test changing a returned result does not change the cache."""
+        first = await service.search_all("notebook")
+        first.products[0].price = 1.0
+        
+        second = await service.search_all("notebook")
+        second.products[0].price = 2.0
+        
+        assert service.get_cached_result("notebook").products[0].price != 2.0
+        assert (await service.search_all("notebook")).products[0].price not in (1.0, 2.0)
+    
+    async def test_concurrent_searches_are_coalesced(self, service):
+        """Test identical concurrent searches share one fan-out."""
+        results = await asyncio.gather(*[
+            service.search_all("iphone 15") for _ in range(5)
+        ])
+        
+        assert all(r.total_results == 2 for r in results)
+        assert all(m.calls == 1 for m in service.marketplaces)
+    
+    async def test_search_stream_completion_order(self, service):
+        """Test streaming yields marketplaces as they complete."""
+        partials = [p async for p in service.search_stream("mouse gamer")]
+        
+        assert [p.products[0].marketplace for p in partials] == ["Fast", "Slow"]
+        
+        # The aggregated result is cached once the stream is exhausted
+        cached = [p async for p in service.search_stream("mouse gamer")]
+        assert len(cached) == 1
+        assert cached[0].total_results == 2
+    
+    async def test_concurrent_streams_share_fan_out(self, service):
+        """Test identical concurrent streams call each marketplace once."""
+        async def collect():
+            return [p async for p in service.search_stream("notebook gamer")]
+        
+        streams = await asyncio.gather(*[collect() for _ in range(5)])
+        
+        assert all(m.calls == 1 for m in service.marketplaces)
+        for partials in streams:
+            assert [p.products[0].marketplace for p in partials] == ["Fast", "Slow"]
+        
+        # Subscribers get their own copies
+        assert streams[0][0].products[0] is not streams[1][0].products[0]
+    
+    async def test_late_stream_replays_results(self, service):
+        """Test a stream joining a running fan-out gets the earlier results."""
+        first = service.search_stream("notebook gamer")
+        assert (await first.__anext__()).products[0].marketplace == "Fast"
+        
+        late = [p async for p in service.search_stream("notebook gamer")]
+        rest = [p async for p in first]
+        
+        assert [p.products[0].marketplace for p in late] == ["Fast", "Slow"]
+        assert [p.products[0].marketplace for p in rest] == ["Slow"]
+        assert all(m.calls == 1 for m in service.marketplaces)
+    
+    async def test_search_all_joins_stream(self, service):
+        """Test search_all joins a streamed fan-out for the same query."""
+        stream = service.search_stream("notebook gamer")
+        await stream.__anext__()
+        
+        result = await service.search_all("Notebook Gamer")
+        
+        assert result.total_results == 2
+        assert result.query == "Notebook Gamer"
+        assert all(m.calls == 1 for m in service.marketplaces)
+        await stream.aclose()
+    
+    async def test_search_stream_invalid_query(self, service):
+        """Test an invalid query yields nothing."""
+        partials = [p async for p in service.search_stream("ab")]
+        
+        assert partials == []
+    
+    async def test_merge_results(self, service):
+        """Test merging partial results."""
+        partials = [p async for p in service.search_stream("teclado")]
+        merged = SearchService.merge_results("teclado", partials)
+        
+        assert merged.total_results == 2
+        assert merged.best_price.marketplace == "Slow"
+        assert merged.search_time == pytest.approx(0.05)
+
+
+@pytest.mark.asyncio
+class TestSearchBudget:
+    """Tests for the per-search latency budget."""
+    
+    async def test_partial_result_after_budget(self, service):
+        """Test late marketplaces are reported as missing."""
+        service.search_budget = 0.03
+        service.complete_in_background = False
+        
+        result = await service.search_all("notebook")
+        
+        assert [p.marketplace for p in result.products] == ["Fast"]
+        assert result.missing_marketplaces == ["Slow"]
+        assert result.is_partial
+        assert "notebook" not in service.cache
+    
+    async def test_background_completion_fills_cache(self, service):
+        """Test late marketplaces finish in the background and are cached."""
+        service.search_budget = 0.03
+        service.complete_in_background = True
+        
+        result = await service.search_all("notebook")
+        assert result.missing_marketplaces == ["Slow"]
+        
+        await asyncio.gather(*service._background_tasks)
+        
+        cached = await service.search_all("notebook")
+        assert cached.total_results == 2
+        assert not cached.is_partial
+    
+    async def test_stream_reports_missing(self, service):
+        """Test streaming ends with a marker listing late marketplaces."""
+        service.search_budget = 0.03
+        service.complete_in_background = False
+        
+        partials = [p async for p in service.search_stream("notebook")]
+        merged = SearchService.merge_results("notebook", partials)
+        
+        assert partials[0].products[0].marketplace == "Fast"
+        assert partials[-1].missing_marketplaces == ["Slow"]
+        assert merged.total_results == 1
+        assert merged.missing_marketplaces == ["Slow"]
+
+
+@pytest.mark.asyncio
+class TestStaleWhileRevalidate:
+    """Tests for answering from stored results."""
+    
+    @staticmethod
+    def stored_result(query: str) -> SearchResult:
+        """Build a stale result as loaded from the database."""
+        product = Product(
+            id="DB-1",
+            name=f"{query} stored",
+            price=150.0,
+            marketplace="Stored",
+            url="https://test.com"
+        )
+        return SearchResult(query=query, products=[product], total_results=1, stale=True)
+    
+    async def test_serves_stored_result_and_refreshes(self, service, monkeypatch):
+        """Test a stored result is returned while the cache is refilled."""
+        monkeypatch.setattr(service, "_load_stored_result", self.stored_result)
+        
+        stale = await service.get_stale_result("notebook")
+        
+        assert stale.stale
+        assert stale.products[0].id == "DB-1"
+        
+        await asyncio.gather(*service._background_tasks)
+        
+        assert "notebook" in service.cache
+        assert all(m.calls == 1 for m in service.marketplaces)
+    
+    async def test_cached_query_skips_database(self, service, monkeypatch):
+        """Test the in-process cache takes priority over stored results."""
+        monkeypatch.setattr(service, "_load_stored_result", self.stored_result)
+        await service.search_all("notebook")
+        
+        assert await service.get_stale_result("notebook") is None
+    
+    async def test_disabled_or_unavailable(self, service, monkeypatch):
+        """Test no stale result when disabled or when the database fails."""
+        def broken(query):
+            raise RuntimeError("Database not initialized")
+        
+        monkeypatch.setattr(service, "_load_stored_result", broken)
+        assert await service.get_stale_result("notebook") is None
+        
+        monkeypatch.setattr(service, "_load_stored_result", self.stored_result)
+        service.stale_max_age = 0
+        assert await service.get_stale_result("notebook") is None
+        assert not service._background_tasks
+
+
+@pytest.mark.asyncio
+class TestPrefetch:
+    """Tests for background prefetching."""
+    
+    async def test_prefetch_fills_cache(self, service):
+        """Test a prefetched query is cached once the search completes."""
+        assert service.get_cached_result("notebook") is None
+        assert service.prefetch("Notebook")
+        
+        await asyncio.gather(*service._background_tasks)
+        
+        cached = service.get_cached_result("notebook")
+        assert cached.total_results == 2
+        assert cached.query == "notebook"
+    
+    async def test_prefetch_skips_cached_in_flight_and_invalid(self, service):
+        """Test nothing is started when a search is not needed."""
+        assert service.prefetch("notebook")
+        assert not service.prefetch("NOTEBOOK")
+        
+        await asyncio.gather(*service._background_tasks)
+        
+        assert not service.prefetch("notebook")
+        assert not service.prefetch("tv")
+        assert all(m.calls == 1 for m in service.marketplaces)
@@ -0,0 +1,114 @@
+"""
+Unit tests for batch similarity scoring.
+"""
+
+import random
+
+import pytest
+
+from src.utils import similarity
+from src.utils.normalizer import ProductNormalizer
+
+pytestmark = pytest.mark.skipif(not similarity.is_native(), reason="rapidfuzz not installed")
+
+NAMES = [
+    "Notebook Dell Inspiron 15 i5 8GB",
+    "iPhone 13 128GB Azul",
+    "DELL INSPIRON 15 NOTEBOOK i5 8GB RAM",
+    "",
+    "Apple iPhone 13 128GB Azul Lacrado",
+    "Air Fryer Mondial 4L",
+    "",
+    "Fritadeira Air Fryer Mondial 4L",
+    "Notebook Dell Inspiron 15 i5 8GB",
+]
+
+
+def fallback_groups(names, threshold):
+    """Reference greedy grouping scoring pair by pair with fuzzywuzzy."""
+    groups, used = [], set()
+    for i in range(len(names)):
+        if i in used:
+            continue
+        used.add(i)
+        group = [i]
+        for j in range(i + 1, len(names)):
+            if j not in used and similarity.fuzz.token_sort_ratio(names[i], names[j]) >= threshold:
+                group.append(j)
+                used.add(j)
+        groups.append(group)
+    return groups
+
+
+class TestScore:
+    """Tests for pairwise scores."""
+    
+    def test_token_order_is_ignored(self):
+        """Test reordered names score 100."""
+        assert similarity.score("dell inspiron 15", "inspiron 15 dell") == 100.0
+    
+    def test_empty_names(self):
+        """Test empty names only match each other, like fuzzywuzzy."""
+        assert similarity.score("", "") == 100.0
+        assert similarity.score("notebook", "") == 0.0
+    
+    def test_rounded_like_fuzzywuzzy(self):
+        """Test scores are integers close to fuzzywuzzy's."""
+        pair = ("notebook dell inspiron 15 i5 8gb", "dell inspiron 15 notebook i5 8gb ram")
+        
+        value = similarity.score(*pair)
+        
+        assert value == int(value)
+        assert abs(value - similarity.fuzz.token_sort_ratio(*pair)) <= 2
+
+
+class TestFirstMatch:
+    """Tests for first_match."""
+    
+    @pytest.mark.parametrize("native", [True, False])
+    def test_first_similar_choice(self, native, monkeypatch):
+        """Test the first choice reaching the threshold is returned."""
+        if not native:
+            monkeypatch.setattr(similarity, "rapid_process", None)
+        choices = similarity.sort_tokens(ProductNormalizer.normalize_batch([
+            "Air Fryer Mondial 4L",
+            "Notebook Dell Vostro 14 i7",
+            "Notebook Dell Inspiron 15 i5",
+            "Dell Inspiron 15 i5 8GB Notebook"
+        ]))
+        query = similarity.sort_tokens([ProductNormalizer.normalize_text("Notebook Dell Inspiron 15 i5 8GB")])[0]
+        
+        assert similarity.first_match(query, choices, 70.0) == 2
+        assert similarity.first_match(query, choices[:2], 70.0) is None
+        assert similarity.first_match(query, [], 70.0) is None
+
+
+class TestGreedyGroups:
+    """Tests for greedy_groups."""
+    
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_matches_pairwise_grouping(self, workers):
+        """Test batch grouping equals pair-by-pair greedy grouping."""
+        names = ProductNormalizer.normalize_batch(NAMES)
+        
+        assert similarity.greedy_groups(names, 70.0, workers=workers) == fallback_groups(names, 70.0)
+    
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_matches_on_random_listings(self, workers):
+        """Test several rows per call resolve groups in the same order."""
+        rng = random.Random(1)
+        words = ["galaxy", "a54", "128gb", "iphone", "13", "azul", "preto", "dell", "inspiron", "i5", "8gb", "novo"]
+        names = [" ".join(rng.sample(words, rng.randint(1, 5))) for _ in range(150)]
+        
+        for threshold in (60.0, 80.0):
+            expected = [[i for i in group] for group in fallback_groups(names, threshold)]
+            groups = similarity.greedy_groups(names, threshold, workers=workers)
+            
+            # Same partition; scores may differ by a point from SequenceMatcher
+            agreeing = sum(group in expected for group in groups)
+            assert agreeing >= 0.9 * len(expected)
+            assert sorted(i for group in groups for i in group) == list(range(len(names)))
+    
+    def test_empty_batch(self):
+        """Test an empty batch."""
+        assert similarity.greedy_groups([], 70.0) == []
@@ -0,0 +1,126 @@
+"""
+Unit tests for request coalescing.
+"""
+
+import asyncio
+import pytest
+from src.utils.singleflight import Broadcast, SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+    
+    async def test_concurrent_calls_share_work(self):
+        """Test identical concurrent calls run the work once."""
+        flight = SingleFlight()
+        calls = 0
+        
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+        
+        results = await asyncio.gather(*[
+            flight.do("notebook", work) for _ in range(10)
+        ])
+        
+        assert results == ["result"] * 10
+        assert calls == 1
+        assert flight.started == 1
+        assert flight.coalesced == 9
+        assert len(flight) == 0
+    
+    async def test_different_keys_run_separately(self):
+        """Test different keys are not coalesced."""
+        flight = SingleFlight()
+        
+        async def work(value):
+            await asyncio.sleep(0.01)
+            return value
+        
+        results = await asyncio.gather(
+            flight.do("a", lambda: work(1)),
+            flight.do("b", lambda: work(2))
+        )
+        
+        assert results == [1, 2]
+        assert flight.started == 2
+    
+    async def test_cancelled_waiter_does_not_cancel_work(self):
+        """Test cancelling one waiter keeps the shared call running."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+        
+        async def work():
+            await release.wait()
+            return "done"
+        
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert await second == "done"
+        assert first.cancelled()
+    
+    async def test_exception_propagates_to_all_waiters(self):
+        """Test a failure is raised to every waiter and the key is released."""
+        flight = SingleFlight()
+        
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("marketplace down")
+        
+        results = await asyncio.gather(
+            flight.do("key", work),
+            flight.do("key", work),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not flight.is_in_flight("key")
+    
+    async def test_start_registers_at_once(self):
+        """Test a started call is in flight before it first runs."""
+        flight = SingleFlight()
+        
+        async def work():
+            return "done"
+        
+        task = flight.start("key", work)
+        
+        assert flight.is_in_flight("key")
+        assert flight.start("key", work) is task
+        assert await flight.do("key", work) == "done"
+        assert flight.started == 1
+        assert flight.coalesced == 2
+
+
+@pytest.mark.asyncio
+class TestBroadcast:
+    """Tests for Broadcast."""
+    
+    async def test_subscribers_get_every_item(self):
+        """Test early and late subscribers see all items in order."""
+        stream = Broadcast()
+        
+        async def collect():
+            return [item async for item in stream.subscribe()]
+        
+        early = asyncio.ensure_future(collect())
+        stream.publish(1)
+        await asyncio.sleep(0)
+        
+        late = asyncio.ensure_future(collect())
+        stream.publish(2)
+        stream.close()
+        
+        assert await early == [1, 2]
+        assert await late == [1, 2]
+        assert [item async for item in stream.subscribe()] == [1, 2]
+        assert stream.closed
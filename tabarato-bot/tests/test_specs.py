@@ -0,0 +1,110 @@
+"""
+Unit tests for specification extraction.
+"""
+
+import re
+
+import pytest
+from src.utils.normalizer import ProductNormalizer
+from src.utils.specs import extract_specs, extract_specs_batch
+
+# Correctness corpus: marketplace-style titles and the specs expected from them
+CORPUS = [
+    ("Notebook Acer Nitro 5 Intel Core i5 8GB RAM 512GB SSD 15,6\" Preto",
+     {'processor': 'i5', 'ram': '8gb', 'storage': '512gb', 'screen': '15.6in', 'color': 'preto'}),
+    ("Notebook Dell Inspiron 15 i7 16GB 1TB SSD Tela 15.6 Polegadas",
+     {'processor': 'i7', 'ram': '16gb', 'storage': '1tb', 'screen': '15.6in'}),
+    ("Notebook Lenovo IdeaPad 3 Ryzen 5 8GB SSD 256GB",
+     {'processor': 'ryzen5', 'ram': '8gb', 'storage': '256gb'}),
+    ("Notebook Samsung Book Core i3 4GB de RAM SSD de 256GB",
+     {'processor': 'i3', 'ram': '4gb', 'storage': '256gb'}),
+    ("Notebook Intel Core 5 120U 16GB", {'processor': 'core5', 'ram': '16gb'}),
+    ("Notebook Dell Intel Core 7 150U 16GB RAM 512GB SSD",
+     {'processor': 'core7', 'ram': '16gb', 'storage': '512gb'}),
+    ("MacBook Air Apple M2 8GB 256GB Cinza Espacial",
+     {'processor': 'm2', 'ram': '8gb', 'storage': '256gb', 'color': 'cinza'}),
+    ("Notebook com 16GB de RAM", {'ram': '16gb'}),
+    ("Notebook 16GB RAM SSD 1TB", {'ram': '16gb', 'storage': '1tb'}),
+    ("Memória RAM DDR4 16GB 3200MHz", {'ram': '16gb'}),
+    ("Memória 8GB DDR4 Kingston", {'ram': '8gb'}),
+    ("Smartphone Samsung Galaxy A54 5G 128GB 8GB RAM Preto",
+     {'storage': '128gb', 'ram': '8gb', 'color': 'preto'}),
+    ("Apple iPhone 13 128GB Azul", {'storage': '128gb', 'color': 'azul'}),
+    ("iPhone 15 Pro Max 256GB Titânio Natural", {'storage': '256gb'}),
+    ("Xiaomi Redmi Note 13 256GB 8GB Ram Dourado",
+     {'storage': '256gb', 'ram': '8gb', 'color': 'dourado'}),
+    ("Motorola Moto G84 5G 256GB Grafite", {'storage': '256gb', 'color': 'cinza'}),
+    ("SSD 512GB NVMe Kingston", {'storage': '512gb'}),
+    ("HD Externo Seagate 2TB USB 3.0", {'storage': '2tb'}),
+    ("Cartão de Memória Micro SD 64GB SanDisk", {'storage': '64gb'}),
+    ("Cartão Micro SD 32GB Classe 10", {'storage': '32gb'}),
+    ("Pendrive 32GB Sandisk", {'storage': '32gb'}),
+    ("Monitor LG 27\" Full HD", {'screen': '27in'}),
+    ("Monitor 27 polegadas", {'screen': '27in'}),
+    ("Smart TV Samsung 55 Polegadas 4K", {'screen': '55in'}),
+    ("Tablet Samsung Galaxy Tab 10.4 pol 64GB", {'screen': '10.4in', 'storage': '64gb'}),
+    ("Air Fryer Mondial 4L Preta 1500W", {'capacity': '4l', 'color': 'preto'}),
+    ("Fritadeira Air Fryer Philco 5,5L Digital", {'capacity': '5.5l'}),
+    ("Geladeira Frost Free 375 Litros Branca", {'capacity': '375l', 'color': 'branco'}),
+    ("Garrafa Térmica 1 Litro Inox", {'capacity': '1l'}),
+    ("Power Bank 10000mAh Branco", {'capacity': '10000mah', 'color': 'branco'}),
+    ("Fone de Ouvido JBL Tune 510BT Bluetooth Rosa", {'color': 'rosa'}),
+    ("Cafeteira Expresso Arno", {}),
+    ("", {}),
+]
+
+
+class TestExtractSpecs:
+    """Tests for extract_specs."""
+    
+    @pytest.mark.parametrize("title, expected", CORPUS)
+    def test_corpus(self, title, expected):
+        """Test each corpus title yields exactly the expected specs."""
+        assert extract_specs(title) == expected
+    
+    def test_storage_not_read_as_ram(self):
+        """Test a storage-sized value is not taken for RAM."""
+        specs = extract_specs("Notebook i5 512GB SSD")
+        
+        assert 'ram' not in specs
+        assert specs['storage'] == "512gb"
+    
+    def test_first_match_wins(self):
+        """Test the first value of a spec is kept."""
+        assert extract_specs("Preto e Branco")['color'] == "preto"
+
+
+# Processor pattern of the previous regex extractor (run on normalized text)
+LEGACY_PROCESSOR_RE = re.compile(r'(i[3579]|ryzen\s*[3579]|core\s*[3579])')
+
+# Titles both extractors understand (Apple M chips were not recognised before)
+PROCESSOR_TITLES = [title for title, expected in CORPUS if expected.get('processor', '')[:1] != 'm'] + [
+    "Notebook Core 9 32GB",
+    "Notebook Intel Core5 8GB",
+    "Notebook Intel Core i7 16GB",
+    "Notebook Lenovo Ryzen 7 5700U 8GB",
+    "Notebook Ryzen5 8GB",
+]
+
+
+class TestLegacyProcessorParity:
+    """Tests that processors match the previous regex extractor."""
+    
+    @pytest.mark.parametrize("title", PROCESSOR_TITLES)
+    def test_same_processor(self, title):
+        """Test each shared title yields the processor the regex found."""
+        match = LEGACY_PROCESSOR_RE.search(ProductNormalizer._normalize(title))
+        legacy = match.group(1).replace(' ', '') if match else None
+        
+        assert extract_specs(title).get('processor') == legacy
+
+
+class TestExtractSpecsBatch:
+    """Tests for extract_specs_batch."""
+    
+    def test_matches_single_extraction(self):
+        """Test batch results equal per-title results, in order."""
+        titles = [title for title, _ in CORPUS]
+        
+        assert extract_specs_batch(titles) == [expected for _, expected in CORPUS]
+        assert extract_specs_batch([]) == []
@@ -0,0 +1,104 @@
+"""
+Unit tests for per-user search throttling.
+"""
+
+import pytest
+from src.bot.throttle import SlidingWindowLimiter, get_inline_throttle, get_search_throttle
+from src.config import Config
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSlidingWindowLimiter:
+    """Tests for SlidingWindowLimiter."""
+    
+    def test_limit_within_window(self):
+        """Test requests beyond the limit are throttled."""
+        limiter = SlidingWindowLimiter(limit=3, window=60, clock=FakeClock())
+        
+        results = [limiter.hit("user")[0] for _ in range(4)]
+        
+        assert results == [True, True, True, False]
+        assert limiter.throttled == 1
+    
+    def test_users_are_independent(self):
+        """Test one user's requests do not count against another."""
+        limiter = SlidingWindowLimiter(limit=1, window=60, clock=FakeClock())
+        
+        assert limiter.hit(1)[0]
+        assert not limiter.hit(1)[0]
+        assert limiter.hit(2)[0]
+    
+    def test_previous_window_is_weighted(self):
+        """Test the previous window still counts while it slides out."""
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(limit=4, window=60, clock=clock)
+        
+        for _ in range(4):
+            limiter.hit("user")
+        
+        # Half of the previous window (2 requests) is still inside the sliding window
+        clock.now = 90.0
+        assert limiter.hit("user")[0]
+        assert limiter.hit("user")[0]
+        assert not limiter.hit("user")[0]
+    
+    def test_retry_after(self):
+        """Test the retry time matches when the request becomes allowed."""
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(limit=2, window=60, clock=clock)
+        
+        limiter.hit("user")
+        limiter.hit("user")
+        clock.now = 30.0
+        allowed, retry_after = limiter.hit("user")
+        
+        assert not allowed
+        assert retry_after == pytest.approx(30.0)
+        
+        clock.now += retry_after - 1
+        assert not limiter.hit("user")[0]
+        
+        clock.now += 1.1
+        assert limiter.hit("user")[0]
+    
+    def test_idle_entries_expire(self):
+        """Test users idle for two windows are no longer tracked."""
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(limit=5, window=60, clock=clock)
+        
+        limiter.hit("idle")
+        clock.now = 100.0
+        limiter.hit("active")
+        assert len(limiter) == 2
+        
+        clock.now = 125.0
+        limiter.hit("active")
+        assert len(limiter) == 1
+    
+    def test_disabled(self):
+        """Test a non-positive limit never throttles."""
+        limiter = SlidingWindowLimiter(limit=0)
+        
+        assert all(limiter.hit("user")[0] for _ in range(100))
+        assert len(limiter) == 0
+
+
+class TestGlobalThrottles:
+    """Tests for the global throttles."""
+    
+    def test_inline_throttle_is_separate(self):
+        """Test inline searches do not use up the search limit."""
+        inline_throttle = get_inline_throttle()
+        
+        assert inline_throttle is get_inline_throttle()
+        assert inline_throttle is not get_search_throttle()
+        assert inline_throttle.limit == Config.MAX_INLINE_SEARCHES_PER_MINUTE